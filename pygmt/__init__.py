@@ -18,56 +18,126 @@ Here are just a few of the things that PyGMT does well:
   - Generating publication-quality illustrations and making animations.
 """
 
-import atexit as _atexit
+import importlib as _importlib
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 
-# Import modules to make the high-level GMT Python API
-from pygmt import datasets
-from pygmt._show_versions import __commit__, __version__, show_versions
-from pygmt.figure import Figure, set_display
-from pygmt.session_management import begin as _begin
-from pygmt.session_management import end as _end
-from pygmt.src import (
-    binstats,
-    blockmean,
-    blockmedian,
-    blockmode,
-    config,
-    dimfilter,
-    filter1d,
-    grd2cpt,
-    grd2xyz,
-    grdclip,
-    grdcut,
-    grdfill,
-    grdfilter,
-    grdgradient,
-    grdhisteq,
-    grdinfo,
-    grdlandmask,
-    grdmask,
-    grdpaste,
-    grdproject,
-    grdsample,
-    grdtrack,
-    grdvolume,
-    info,
-    makecpt,
-    nearneighbor,
-    project,
-    select,
-    sph2grd,
-    sphdistance,
-    sphinterpolate,
-    surface,
-    triangulate,
-    which,
-    x2sys_cross,
-    x2sys_init,
-    xyz2grd,
-)
+# The xarray accessor and backend are imported eagerly because the "gmt" accessor is
+# registered when the module is imported.
 from pygmt.xarray import GMTBackendEntrypoint, GMTDataArrayAccessor
 
-# Start our global modern mode session
-_begin()
-# Tell Python to run _end when shutting down
-_atexit.register(_end)
+# Import modules to make the high-level GMT Python API. They are imported lazily on
+# first access, so that "import pygmt" is fast.
+if _TYPE_CHECKING:
+    from pygmt import aio, datasets, parallel
+    from pygmt._show_versions import __commit__, __version__, show_versions
+    from pygmt.figure import Figure, set_display
+    from pygmt.parallel import render_many
+    from pygmt.src import (
+        binstats,
+        blockmean,
+        blockmedian,
+        blockmode,
+        config,
+        dimfilter,
+        filter1d,
+        grd2cpt,
+        grd2xyz,
+        grdclip,
+        grdcut,
+        grdfill,
+        grdfilter,
+        grdgradient,
+        grdhisteq,
+        grdinfo,
+        grdlandmask,
+        grdmask,
+        grdpaste,
+        grdproject,
+        grdsample,
+        grdtrack,
+        grdvolume,
+        info,
+        makecpt,
+        nearneighbor,
+        project,
+        select,
+        sph2grd,
+        sphdistance,
+        sphinterpolate,
+        surface,
+        triangulate,
+        which,
+        x2sys_cross,
+        x2sys_init,
+        xyz2grd,
+    )
+
+# Mapping of the lazily imported objects to the modules they are defined in.
+_LAZY_OBJECTS = {
+    "__commit__": "pygmt._show_versions",
+    "__version__": "pygmt._show_versions",
+    "show_versions": "pygmt._show_versions",
+    "Figure": "pygmt.figure",
+    "set_display": "pygmt.figure",
+    "render_many": "pygmt.parallel",
+    "binstats": "pygmt.src",
+    "blockmean": "pygmt.src",
+    "blockmedian": "pygmt.src",
+    "blockmode": "pygmt.src",
+    "config": "pygmt.src",
+    "dimfilter": "pygmt.src",
+    "filter1d": "pygmt.src",
+    "grd2cpt": "pygmt.src",
+    "grd2xyz": "pygmt.src",
+    "grdclip": "pygmt.src",
+    "grdcut": "pygmt.src",
+    "grdfill": "pygmt.src",
+    "grdfilter": "pygmt.src",
+    "grdgradient": "pygmt.src",
+    "grdhisteq": "pygmt.src",
+    "grdinfo": "pygmt.src",
+    "grdlandmask": "pygmt.src",
+    "grdmask": "pygmt.src",
+    "grdpaste": "pygmt.src",
+    "grdproject": "pygmt.src",
+    "grdsample": "pygmt.src",
+    "grdtrack": "pygmt.src",
+    "grdvolume": "pygmt.src",
+    "info": "pygmt.src",
+    "makecpt": "pygmt.src",
+    "nearneighbor": "pygmt.src",
+    "project": "pygmt.src",
+    "select": "pygmt.src",
+    "sph2grd": "pygmt.src",
+    "sphdistance": "pygmt.src",
+    "sphinterpolate": "pygmt.src",
+    "surface": "pygmt.src",
+    "triangulate": "pygmt.src",
+    "which": "pygmt.src",
+    "x2sys_cross": "pygmt.src",
+    "x2sys_init": "pygmt.src",
+    "xyz2grd": "pygmt.src",
+}
+# Subpackages that are imported lazily.
+_LAZY_SUBMODULES = {"aio", "datasets", "parallel", "params", "src"}
+
+
+def __getattr__(name: str):
+    """
+    Import the objects of the high-level GMT Python API on first access.
+    """
+    if name in _LAZY_SUBMODULES:
+        return _importlib.import_module(f"{__name__}.{name}")
+    if (module := _LAZY_OBJECTS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(_importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes, including the objects not imported yet.
+    """
+    return sorted({*globals(), *_LAZY_OBJECTS, *_LAZY_SUBMODULES})
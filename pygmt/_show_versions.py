@@ -14,7 +14,8 @@ from typing import TextIO
 
 from packaging.requirements import Requirement
 from packaging.version import Version
-from pygmt.clib import Session, __gmt_version__, required_gmt_version
+from pygmt import clib
+from pygmt.clib import Session, required_gmt_version
 
 # Get semantic version through setuptools-scm
 __version__ = version("pygmt")  # e.g., 0.1.2.dev3+g0ab3cd78
@@ -90,6 +91,7 @@ def _check_ghostscript_version(gs_version: str | None) -> str | None:
     if gs_version is None:
         return "Ghostscript is not detected. Your installation may be broken."
 
+    gmt_version = clib.__gmt_version__
     match Version(gs_version):
         case v if v < Version("9.53"):
             return (
@@ -101,9 +103,9 @@ def _check_ghostscript_version(gs_version: str | None) -> str | None:
                 f"Ghostscript {gs_version} has known bugs. "
                 "Please consider upgrading to Ghostscript 10.02 or later."
             )
-        case v if v >= Version("10.02") and Version(__gmt_version__) < Version("6.5.0"):
+        case v if v >= Version("10.02") and Version(gmt_version) < Version("6.5.0"):
             return (
-                f"GMT {__gmt_version__} doesn't support Ghostscript {gs_version}. "
+                f"GMT {gmt_version} doesn't support Ghostscript {gs_version}. "
                 "Please consider upgrading to GMT>=6.5.0 or downgrading to Ghostscript "
                 "9.56."
             )
@@ -9,12 +9,16 @@ from collections.abc import Sequence
 from typing import Literal
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 import xarray as xr
 
 # Anchor codes
 AnchorCode = Literal["TL", "TC", "TR", "ML", "MC", "MR", "BL", "BC", "BR"]
 
+# Data types that can be converted to a numpy.dtype
+DTypeLike = npt.DTypeLike
+
 # String array types
 StringArrayTypes = Sequence[str] | np.ndarray
 with contextlib.suppress(ImportError):
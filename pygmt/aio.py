@@ -0,0 +1,286 @@
+"""
+Awaitable versions of the PyGMT processing functions and Figure.savefig for asyncio.
+
+The functions in this module have the same parameters as the functions with the same
+name in the :mod:`pygmt` namespace (e.g., :func:`pygmt.aio.grdtrack` for
+:func:`pygmt.grdtrack`), but are coroutine functions. The calls run in a bounded pool of
+worker threads, so they don't block the event loop. Each worker thread borrows GMT API
+sessions from a pool, so that the cost of creating a session is paid only once per
+thread.
+
+At most ``max_workers`` calls run at the same time and at most ``max_pending`` calls are
+submitted to the worker threads (running or waiting to run). Further calls wait in the
+event loop until earlier calls finish, which applies backpressure to the callers. Use
+:func:`pygmt.aio.configure` to change the limits.
+
+Concurrent calls are only supported for in-memory inputs and outputs (e.g.,
+:class:`xarray.DataArray`, :class:`pandas.DataFrame` or :class:`numpy.ndarray`), like
+for :func:`pygmt.parallel.map`. Reading or writing grid files (e.g., netCDF grids, which
+use a library that isn't thread-safe) and downloading remote files (e.g.,
+``"@earth_relief_01d"``) in the worker threads may fail or corrupt data. Load such files
+before (e.g., with :func:`pygmt.datasets.load_earth_relief` or
+:func:`pygmt.load_dataarray`).
+
+Cancelling a call that is waiting to run removes it from the queue. GMT modules can't be
+interrupted, so a cancelled call that is already running finishes in the background and
+its result is discarded.
+"""
+
+import asyncio
+import atexit
+import contextlib
+import functools
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from pygmt._typing import PathLike
+from pygmt.clib.session import _THREAD_STATE, _SessionPool
+from pygmt.exceptions import GMTValueError
+
+# Processing functions of pygmt.src that are not mirrored, because they change the
+# state of the global modern mode session (e.g., the current CPT) instead of processing
+# data.
+_EXCLUDED = {"config", "grd2cpt", "makecpt"}
+
+# Lock for saving figures. Saving activates the figure in the shared global modern mode
+# session before converting it, so concurrent calls could convert the wrong figure.
+_SAVEFIG_LOCK = threading.Lock()
+
+
+class _Runner:
+    """
+    A bounded pool of worker threads with pooled GMT API sessions.
+
+    Parameters
+    ----------
+    max_workers
+        The number of worker threads and the size of the session pool.
+    max_pending
+        The maximum number of calls submitted to the worker threads.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._pool = _SessionPool(size=max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="pygmt-aio",
+            initializer=self._init_worker,
+        )
+        # asyncio semaphores can only be used by one event loop, so keep one per loop.
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def _init_worker(self) -> None:
+        """
+        Mark the current thread as a worker thread that uses the session pool.
+        """
+        _THREAD_STATE.worker = True
+        _THREAD_STATE.pool = self._pool
+
+    async def run(self, func: Callable, /, *args, **kwargs) -> Any:
+        """
+        Run a function in a worker thread once a slot is available.
+        """
+        loop = asyncio.get_running_loop()
+        if (semaphore := self._semaphores.get(loop)) is None:
+            semaphore = self._semaphores.setdefault(
+                loop, asyncio.Semaphore(self.max_pending)
+            )
+        await semaphore.acquire()
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            semaphore.release()
+            raise
+        # Free the slot once the call is finished or cancelled before it started,
+        # not when the awaiting task is cancelled while the call is still running.
+        future.add_done_callback(functools.partial(_release, loop, semaphore))
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """
+        Wait for the submitted calls to finish and close the session pool.
+
+        Parameters
+        ----------
+        cancel
+            If ``True``, cancel the calls that are waiting to run.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=cancel)
+        self._pool.close()
+
+
+def _release(
+    loop: asyncio.AbstractEventLoop, semaphore: asyncio.Semaphore, _: Future
+) -> None:
+    """
+    Release a slot of an event loop from a worker thread.
+    """
+    with contextlib.suppress(RuntimeError):  # The event loop is already closed.
+        loop.call_soon_threadsafe(semaphore.release)
+
+
+_RUNNER: _Runner | None = None
+_RUNNER_LOCK = threading.Lock()
+
+
+def _get_runner() -> _Runner:
+    """
+    Get the current runner, creating one with the default limits if needed.
+    """
+    with _RUNNER_LOCK:
+        if _RUNNER is None:
+            _configure()
+        return _RUNNER  # type: ignore[return-value]
+
+
+def _configure(max_workers: int | None = None, max_pending: int | None = None) -> None:
+    """
+    Replace the current runner. Must be called with the lock held.
+    """
+    global _RUNNER
+
+    if max_workers is None:
+        max_workers = min(4, os.cpu_count() or 1)
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    for value, description in [
+        (max_workers, "number of workers"),
+        (max_pending, "number of pending calls"),
+    ]:
+        if value < 1:
+            raise GMTValueError(
+                value, description=description, reason="Must be positive."
+            )
+    previous, _RUNNER = _RUNNER, _Runner(max_workers, max_pending)
+    if previous is not None:
+        previous.shutdown()
+
+
+def configure(max_workers: int | None = None, max_pending: int | None = None) -> None:
+    """
+    Set the limits of the worker threads that run the calls of :mod:`pygmt.aio`.
+
+    Calls that are running or waiting to run with the previous limits are completed
+    first.
+
+    Parameters
+    ----------
+    max_workers
+        The number of worker threads, i.e., the maximum number of calls running at the
+        same time. Defaults to the number of CPUs, up to 4.
+    max_pending
+        The maximum number of calls submitted to the worker threads, including the
+        running ones. Further calls wait until earlier calls finish. Must be at least
+        ``max_workers`` for all the worker threads to be used. Defaults to twice
+        ``max_workers``.
+    """
+    with _RUNNER_LOCK:
+        _configure(max_workers=max_workers, max_pending=max_pending)
+
+
+async def run(func: Callable, /, *args, **kwargs) -> Any:
+    """
+    Run any function that calls PyGMT in a worker thread of :mod:`pygmt.aio`.
+
+    Parameters
+    ----------
+    func
+        The function to run.
+    *args, **kwargs
+        The arguments passed to ``func``.
+
+    Returns
+    -------
+    result
+        The return value of ``func``.
+    """
+    return await _get_runner().run(func, *args, **kwargs)
+
+
+async def savefig(fig, fname: PathLike, **kwargs) -> None:
+    """
+    Save a figure to an image file without blocking the event loop.
+
+    Awaitable version of :meth:`pygmt.Figure.savefig`, with the same parameters. The
+    figure is converted (e.g., by Ghostscript) in a worker thread. Since figures are
+    part of the global modern mode session, concurrent calls are saved one after
+    another, and no figure should be plotted on until the call is finished.
+
+    Parameters
+    ----------
+    fig : pygmt.Figure
+        The figure to save.
+    fname
+        The image file name.
+    **kwargs
+        Other parameters passed to :meth:`pygmt.Figure.savefig`.
+    """
+    await run(_savefig, fig, fname, **kwargs)
+
+
+def _savefig(fig, fname: PathLike, **kwargs) -> None:
+    """
+    Save a figure in a worker thread, one figure at a time.
+    """
+    with _SAVEFIG_LOCK:
+        fig.savefig(fname, **kwargs)
+
+
+def _make_coroutine_function(func: Callable) -> Callable:
+    """
+    Create the awaitable version of a PyGMT function.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run(func, *args, **kwargs)
+
+    return wrapper
+
+
+def _mirrored_names() -> set[str]:
+    """
+    Names of the mirrored processing functions.
+    """
+    from pygmt.src import _FUNCTIONS  # ruff: ignore[import-outside-top-level]
+
+    return set(_FUNCTIONS) - _EXCLUDED
+
+
+def __getattr__(name: str) -> Callable:
+    """
+    Create the awaitable version of a processing function on first access.
+    """
+    if name not in _mirrored_names():
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    from pygmt import src  # ruff: ignore[import-outside-top-level]
+
+    func = _make_coroutine_function(getattr(src, name))
+    globals()[name] = func
+    return func
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes, including the functions not created yet.
+    """
+    return sorted({*globals(), *_mirrored_names()})
+
+
+@atexit.register
+def _shutdown() -> None:
+    """
+    Shut down the worker threads and close the session pool when Python exits.
+    """
+    with _RUNNER_LOCK:
+        if _RUNNER is not None:
+            _RUNNER.shutdown(cancel=True)
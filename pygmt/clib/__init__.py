@@ -5,16 +5,17 @@ The pygmt.clib.Session class wraps the GMT C shared library (libgmt) with a Pyth
 interface. Access to the C library is done through ctypes.
 """
 
-from packaging.version import Version
-from pygmt.clib.session import Session, __gmt_version__
-from pygmt.exceptions import GMTVersionError
+from pygmt.clib import session
+from pygmt.clib.session import Session, required_gmt_version, session_pool
 
-required_gmt_version = "6.5.0"
 
-# Check if the GMT version is older than the required version.
-if Version(__gmt_version__) < Version(required_gmt_version):
-    msg = (
-        f"Using an incompatible GMT version {__gmt_version__}. "
-        f"Must be equal or newer than {required_gmt_version}."
-    )
-    raise GMTVersionError(msg)
+def __getattr__(name: str) -> str:
+    """
+    Get the GMT version string ``__gmt_version__``, loading the GMT library if needed.
+
+    The GMT library is loaded and its version checked on first use, not at import time.
+    """
+    if name == "__gmt_version__":
+        return session.__gmt_version__
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
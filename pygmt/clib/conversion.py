@@ -4,14 +4,102 @@ Functions to convert data types into ctypes friendly formats.
 
 import contextlib
 import ctypes as ctp
+import importlib.util
+import io
+import logging
+import mmap
+import sys
 import warnings
 from collections.abc import Sequence
-from typing import Any
+from typing import Any, Literal, NamedTuple
 
 import numpy as np
 import pandas as pd
 import xarray as xr
-from pygmt.exceptions import GMTValueError
+from pygmt.exceptions import GMTTypeError, GMTValueError
+
+__doctest_requires__ = {("_arrow_to_numpy", "arrow_to_columns"): ["pyarrow"]}
+
+# pyarrow is imported lazily, only when Arrow data is actually passed in.
+_HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+_logger = logging.getLogger(__name__)
+
+
+class _GeometrySegments(NamedTuple):
+    """
+    Geometries flattened into the segments of a GMT dataset.
+
+    The rows of segment ``i`` are ``coords[:, offsets[i] : offsets[i + 1]]``.
+    """
+
+    #: The GMT geometry of the segments (e.g., ``"GMT_IS_POLY"``).
+    geometry: str
+    #: The coordinates of all segments as a C contiguous array of shape (ncols, nrows).
+    coords: np.ndarray
+    #: The row offsets of the segments, with a length of the number of segments plus 1.
+    offsets: np.ndarray
+    #: The header of each segment, or ``None`` if the segments have no headers.
+    headers: list[str] | None
+
+
+def _region_and_increments(
+    dataarray: xr.DataArray,
+) -> tuple[list[float], list[float]]:
+    """
+    Get the region and increments from the coordinates of the last two dimensions.
+
+    The increments can be negative if the coordinates are in descending order.
+
+    Parameters
+    ----------
+    dataarray
+        The input grid or image as a DataArray instance, with the y and x dimensions
+        as the last two dimensions.
+
+    Returns
+    -------
+    region
+        The West, East, South, North boundaries.
+    inc
+        The spacing in East-West and North-South, respectively.
+
+    Raises
+    ------
+    GMTValueError
+        If the DataArray has a zero increment.
+    """
+    region, inc = [], []
+    # Reverse the dims because it is rows, columns ordered. In geographic grids, this
+    # would be North-South, East-West. GMT's region and inc are East-West, North-South.
+    for dim in dataarray.dims[:-3:-1]:
+        coord = dataarray.coords[dim].to_numpy()
+        coord_incs = coord[1:] - coord[:-1]
+        coord_inc = coord_incs[0]
+        if not np.allclose(coord_incs, coord_inc):
+            # Calculate the increment if irregular spacing is found.
+            coord_inc = (coord[-1] - coord[0]) / (coord.size - 1)
+            msg = (
+                f"Grid may have irregular spacing in the {dim!r} dimension, "
+                "but GMT only supports regular spacing. Calculated regular spacing "
+                f"{coord_inc} is assumed in the {dim!r} dimension."
+            )
+            warnings.warn(msg, category=RuntimeWarning, stacklevel=3)
+        if coord_inc == 0:
+            raise GMTValueError(
+                coord_inc,
+                description="grid increment",
+                reason=f"Grid has a zero increment in the {dim!r} dimension.",
+            )
+        region.extend(
+            [
+                coord.min() - coord_inc / 2 * dataarray.gmt.registration,
+                coord.max() + coord_inc / 2 * dataarray.gmt.registration,
+            ]
+        )
+        inc.append(coord_inc)
+
+    return region, inc
 
 
 def dataarray_to_matrix(
@@ -24,12 +112,12 @@ def dataarray_to_matrix(
     for the grid.
 
     Only allows grids with two dimensions and constant grid spacings (GMT doesn't allow
-    variable grid spacings). If the latitude and/or longitude increments of the input
-    grid are negative, the output matrix will be sorted by the DataArray coordinates to
-    yield positive increments.
+    variable grid spacings). The output matrix has the rows from north to south and the
+    columns from west to east, as required by GMT, and the increments are positive.
 
-    If the underlying data array is not C contiguous, for example, if it's a slice of a
-    larger grid, a copy will need to be generated.
+    The data is copied at most once. No copy is made if the grid is already north-up,
+    west-to-east and C contiguous. Otherwise, for example, if the y coordinates are in
+    ascending order or if it's a slice of a larger grid, a copy will be generated.
 
     Parameters
     ----------
@@ -89,6 +177,15 @@ def dataarray_to_matrix(
     [-150.5, -78.5, -80.5, -48.5]
     >>> print(inc)
     [2.0, 2.0]
+    >>> # A north-up grid that is C-contiguous in memory is not copied.
+    >>> north_up = grid[::-1].copy()
+    >>> matrix, region, inc = dataarray_to_matrix(north_up)
+    >>> np.shares_memory(matrix, north_up.to_numpy())
+    True
+    >>> print(region)
+    [-180.0, 180.0, -90.0, 90.0]
+    >>> print(inc)
+    [1.0, 1.0]
     """
     if len(grid.dims) != 2:
         raise GMTValueError(
@@ -97,47 +194,169 @@ def dataarray_to_matrix(
             reason="The grid must be 2-D.",
         )
 
-    # Extract region and inc from the grid
-    region, inc = [], []
-    # Reverse the dims because it is rows, columns ordered. In geographic grids, this
-    # would be North-South, East-West. GMT's region and inc are East-West, North-South.
-    for dim in grid.dims[::-1]:
-        coord = grid.coords[dim].to_numpy()
-        coord_incs = coord[1:] - coord[:-1]
-        coord_inc = coord_incs[0]
-        if not np.allclose(coord_incs, coord_inc):
-            # Calculate the increment if irregular spacing is found.
-            coord_inc = (coord[-1] - coord[0]) / (coord.size - 1)
-            msg = (
-                f"Grid may have irregular spacing in the {dim!r} dimension, "
-                "but GMT only supports regular spacing. Calculated regular spacing "
-                f"{coord_inc} is assumed in the {dim!r} dimension."
-            )
-            warnings.warn(msg, category=RuntimeWarning, stacklevel=2)
-        if coord_inc == 0:
-            raise GMTValueError(
-                coord_inc,
-                description="grid increment",
-                reason=f"Grid has a zero increment in the {dim!r} dimension.",
-            )
-        region.extend(
-            [
-                coord.min() - coord_inc / 2 * grid.gmt.registration,
-                coord.max() + coord_inc / 2 * grid.gmt.registration,
-            ]
-        )
-        inc.append(coord_inc)
-
-    if any(i < 0 for i in inc):  # Sort grid when there are negative increments
-        inc = [abs(i) for i in inc]
-        grid = grid.sortby(variables=list(grid.dims), ascending=True)
+    region, inc = _region_and_increments(grid)
 
-    matrix = np.ascontiguousarray(grid[::-1].to_numpy())
+    # Flip the rows to north-up and the columns to west-to-east with views, so that
+    # np.ascontiguousarray makes the only copy, if any.
+    xstep, ystep = (1 if inc[0] > 0 else -1), (-1 if inc[1] > 0 else 1)
+    matrix = np.ascontiguousarray(grid.to_numpy()[::ystep, ::xstep])
     region = [float(i) for i in region]
-    inc = [float(i) for i in inc]
+    inc = [abs(float(i)) for i in inc]
     return matrix, region, inc
 
 
+def dataarray_to_image(
+    image: xr.DataArray,
+) -> tuple[np.ndarray, list[float], list[float]]:
+    """
+    Transform a 3-D xarray.DataArray image into a 3-D numpy array and metadata.
+
+    The image must be of uint8 type with the band dimension first, e.g., a shape like
+    (3, Y, X). The output array is in GMT's image memory layout, i.e., rows from north to south, with
+    the bands of each pixel next to each other (pixel interleaved). It's made in a
+    single copy, or without copying if the image data is already in this layout.
+
+    Parameters
+    ----------
+    image
+        The input image as a DataArray instance. Information is retrieved from the
+        coordinate arrays, not from headers.
+
+    Returns
+    -------
+    array
+        The C contiguous array of shape (Y, X, bands).
+    region
+        The West, East, South, North boundaries of the image.
+    inc
+        The spacing in East-West and North-South, respectively.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import xarray as xr
+    >>> image = xr.DataArray(
+    ...     data=np.arange(12, dtype=np.uint8).reshape(3, 2, 2),
+    ...     coords={"band": [1, 2, 3], "y": [0.5, 1.5], "x": [0.5, 1.5]},
+    ...     dims=("band", "y", "x"),
+    ... )
+    >>> image.gmt.registration = 1
+    >>> array, region, inc = dataarray_to_image(image)
+    >>> array.shape, array.flags.c_contiguous
+    ((2, 2, 3), True)
+    >>> array[0, 0].tolist()  # The north-west pixel
+    [2, 6, 10]
+    >>> region, inc
+    ([0.0, 2.0, 0.0, 2.0], [1.0, 1.0])
+    >>> dataarray_to_image(image.astype(np.uint16))
+    Traceback (most recent call last):
+    ...
+    pygmt.exceptions.GMTTypeError: Unrecognized data type: dtype('uint16'). ...
+    """
+    if image.dtype != np.uint8:
+        # GMT images only support 8-bit bands. Other types would be reinterpreted as
+        # bytes.
+        raise GMTTypeError(
+            image.dtype,
+            reason="The image must be of uint8 type. "
+            "Convert it with 'image.astype(np.uint8)' after scaling to 0-255.",
+        )
+    if len(image.dims) != 3:
+        raise GMTValueError(
+            len(image.dims),
+            description="number of image dimensions",
+            reason="The image must be 3-D.",
+        )
+
+    region, inc = _region_and_increments(image)
+    data = image.to_numpy()
+    # Reverse the rows/columns instead of sorting the image, so that rows go from north
+    # to south and columns from west to east.
+    if inc[1] > 0:
+        data = data[:, ::-1, :]
+    if inc[0] < 0:
+        data = data[:, :, ::-1]
+    array = np.ascontiguousarray(data.transpose(1, 2, 0))
+    region = [float(i) for i in region]
+    inc = [abs(float(i)) for i in inc]
+    return array, region, inc
+
+
+def _arrow_to_numpy(data: Any) -> np.ndarray | None:
+    """
+    Convert numeric Arrow data to a C contiguous NumPy array with the fewest copies.
+
+    A PyArrow Array or ChunkedArray, or a pandas.Series backed by PyArrow, with a single
+    chunk and no nulls is converted without copying. Otherwise, the chunks are
+    concatenated and the nulls are converted to NaN in a single copy.
+
+    Parameters
+    ----------
+    data
+        The object to convert.
+
+    Returns
+    -------
+    array
+        The C contiguous NumPy array, or ``None`` if the object is not numeric Arrow
+        data (e.g., strings or timestamps), which is left to ``_to_numpy``.
+
+    Examples
+    --------
+    >>> import pyarrow as pa
+    >>> array = pa.array(np.arange(5.0))
+    >>> np.shares_memory(_arrow_to_numpy(array), array.buffers()[1])
+    True
+    >>> _arrow_to_numpy(pa.chunked_array([[1, 2], [None, 4]]))
+    array([ 1.,  2., nan,  4.])
+    >>> _arrow_to_numpy(pa.array(["a", "b"])) is None
+    True
+    """
+    # If pyarrow hasn't been imported yet, the data can't be PyArrow data.
+    if (pa := sys.modules.get("pyarrow")) is None:
+        return None
+    if isinstance(getattr(data, "dtype", None), pd.ArrowDtype):
+        data = pa.array(data)  # A pandas.Series backed by PyArrow.
+    if not isinstance(data, pa.Array | pa.ChunkedArray) or not (
+        pa.types.is_integer(data.type) or pa.types.is_floating(data.type)
+    ):
+        return None
+    if isinstance(data, pa.ChunkedArray):
+        data = data.chunk(0) if data.num_chunks == 1 else data.combine_chunks()
+    # Only copies if there are nulls, which are converted to NaN.
+    return np.ascontiguousarray(data.to_numpy(zero_copy_only=False))
+
+
+def arrow_to_columns(table: Any) -> list[Any]:
+    """
+    Get the columns of an Arrow tabular object without copying.
+
+    Any object implementing the Arrow PyCapsule stream interface (e.g.,
+    pyarrow.Table, pyarrow.RecordBatch, or polars.DataFrame) is imported as a
+    pyarrow.Table, which shares the memory of the original object.
+
+    Parameters
+    ----------
+    table
+        The Arrow tabular object.
+
+    Returns
+    -------
+    columns
+        The columns as a list of pyarrow.ChunkedArray objects.
+
+    Examples
+    --------
+    >>> import pyarrow as pa
+    >>> batch = pa.RecordBatch.from_pydict({"x": [1.0, 2.0], "y": [3, 4]})
+    >>> [column.to_pylist() for column in arrow_to_columns(batch)]
+    [[1.0, 2.0], [3, 4]]
+    """
+    import pyarrow as pa  # ruff: ignore[import-outside-top-level]
+
+    return pa.table(table).columns
+
+
 def _to_numpy(data: Any) -> np.ndarray:
     """
     Convert an array-like object to a C contiguous NumPy array.
@@ -162,6 +381,10 @@ def _to_numpy(data: Any) -> np.ndarray:
     array
         The C contiguous NumPy array.
     """
+    # Numeric Arrow data are converted without copying if possible.
+    if (array := _arrow_to_numpy(data)) is not None:
+        return array
+
     # Mapping of unsupported dtypes to expected NumPy dtypes.
     dtypes: dict[str, type | str] = {
         # For string dtypes.
@@ -185,16 +408,17 @@ def _to_numpy(data: Any) -> np.ndarray:
         # pd.ArrowDtype[pa.Timestamp]
         numpy_dtype = getattr(dtype, "numpy_dtype", None)
 
-    array = np.ascontiguousarray(data, dtype=numpy_dtype)
+    array = np.asarray(data, dtype=numpy_dtype)
 
     # Check if a np.object_ array can be converted to np.datetime64 or np.str_.
     # Try np.datetime64 first then np.str_, because datetime-like objects usually have
-    # string representations.
+    # string representations. The conversion also makes a strided array C contiguous,
+    # so that the array is copied only once.
     if array.dtype.type == np.object_:
         for dtype in [np.datetime64, np.str_]:
             with contextlib.suppress(TypeError, ValueError):
                 return np.ascontiguousarray(array, dtype=dtype)
-    return array
+    return np.ascontiguousarray(array)
 
 
 def vectors_to_arrays(vectors: Sequence[Any]) -> list[np.ndarray]:
@@ -239,6 +463,172 @@ def vectors_to_arrays(vectors: Sequence[Any]) -> list[np.ndarray]:
     return [_to_numpy(vector) for vector in vectors]
 
 
+def plan_table_input(
+    data: Any, kind: Literal["matrix", "vectors"]
+) -> tuple[Literal["matrix", "vectors"], Any]:
+    """
+    Plan how to pass a table-like object to GMT with the fewest copies.
+
+    The layout of the input is inspected to pick the cheapest of three plans:
+
+    - ``"matrix pointer"``: a C-contiguous numeric matrix is passed as a matrix
+      without copying.
+    - ``"column views"``: the columns are contiguous in memory (e.g., a
+      Fortran-ordered matrix, a pandas.DataFrame with one consolidated block, or Arrow
+      columns), and are passed as vectors without copying.
+    - ``"one copy"``: the data are copied once, e.g., the fields of a structured array
+      or the strided columns of a non-numeric matrix are copied into contiguous
+      vectors, and a list of records is converted into a Fortran-ordered array.
+
+    The chosen plan is reported in debug logging.
+
+    Parameters
+    ----------
+    data
+        The table-like object of the ``"matrix"`` or ``"vectors"`` data kind.
+    kind
+        The data kind of ``data``.
+
+    Returns
+    -------
+    kind
+        Pass the returned data to ``virtualfile_from_matrix`` if ``"matrix"`` or to
+        ``virtualfile_from_vectors`` if ``"vectors"``.
+    data
+        The matrix or the sequence of vectors.
+
+    Examples
+    --------
+    >>> matrix = np.arange(6.0).reshape(3, 2)
+    >>> plan_table_input(matrix, kind="matrix")[0]
+    'matrix'
+    >>> kind, vectors = plan_table_input(np.asfortranarray(matrix), kind="matrix")
+    >>> kind, [vector.flags.c_contiguous for vector in vectors]
+    ('vectors', [True, True])
+    >>> kind, vectors = plan_table_input([[0, "a"], [1, "b"]], kind="vectors")
+    >>> kind, [vector.tolist() for vector in vectors]
+    ('vectors', [['0', '1'], ['a', 'b']])
+    """
+    if kind == "matrix":
+        plan, kind, data = _plan_matrix_input(np.asarray(data))
+    else:
+        plan, kind, data = _plan_vectors_input(data)
+    _logger.debug("Passing %s to GMT via %s (%s).", type(data).__name__, kind, plan)
+    return kind, data
+
+
+def _plan_matrix_input(
+    matrix: np.ndarray,
+) -> tuple[str, Literal["matrix", "vectors"], Any]:
+    """
+    Plan how to pass a 2-D numpy.ndarray to GMT. See ``plan_table_input``.
+    """
+    if matrix.flags.f_contiguous and not matrix.flags.c_contiguous:
+        # Fortran-ordered matrices, whose columns are contiguous.
+        return "column views", "vectors", matrix.T
+    if matrix.dtype.kind in "iuf":
+        plan = "matrix pointer" if matrix.flags.c_contiguous else "one copy"
+        return plan, "matrix", matrix
+    # GMT can only accept a 2-D matrix which are signed integer (i), unsigned integer
+    # (u) or floating point (f) types. For other data types (e.g., string or datetime),
+    # each strided column is copied into a vector.
+    return "one copy", "vectors", matrix.T
+
+
+def _plan_vectors_input(data: Any) -> tuple[str, Literal["matrix", "vectors"], Any]:
+    """
+    Plan how to pass table-like data of the "vectors" kind to GMT. See
+    ``plan_table_input``.
+    """
+    match data:
+        case _ if (
+            _HAS_PYARROW
+            and hasattr(data, "__arrow_c_stream__")
+            and hasattr(data, "schema")
+        ):
+            # Arrow tables, e.g., pyarrow.Table/RecordBatch or polars.DataFrame.
+            # Without pyarrow, they are handled below like a 2-D numpy.ndarray.
+            return "column views", "vectors", arrow_to_columns(data)
+        case pd.DataFrame() if (values := _dataframe_values_view(data)) is not None:
+            return _plan_matrix_input(values)
+        case _ if hasattr(data, "items") and not hasattr(data, "to_frame"):
+            # Dictionary, pandas.DataFrame or xarray.Dataset types.
+            # pandas.Series will be handled below like a 1-D numpy.ndarray.
+            columns = [array for _, array in data.items()]  # ruff: ignore[incorrect-dict-iterator]
+            return "column views", "vectors", columns
+        case np.ndarray() if data.dtype.names is not None:
+            # Structured arrays, whose fields are strided views of the records.
+            return "one copy", "vectors", [data[name] for name in data.dtype.names]
+        case list() | tuple():
+            # Python lists and tuples of records are converted to a Fortran-ordered
+            # array, so that the columns are contiguous.
+            records = np.asanyarray(data, order="F")
+            return "one copy", "vectors", np.atleast_2d(records.T)
+    # numpy.ndarray and pandas.Series types.
+    return "column views", "vectors", np.atleast_2d(np.asanyarray(data).T)
+
+
+def _dataframe_values_view(data: pd.DataFrame) -> np.ndarray | None:
+    """
+    Get the values of a pandas.DataFrame as a 2-D numpy.ndarray without copying.
+
+    The values are a view only if all columns have the same numeric dtype and are
+    stored in a single block. Otherwise, e.g., after adding a column with
+    ``data["z"] = ...``, ``DataFrame.to_numpy`` would copy the whole table, and the
+    columns are better passed as views one by one.
+
+    Parameters
+    ----------
+    data
+        The dataframe.
+
+    Returns
+    -------
+    values
+        The 2-D array viewing the values of the dataframe, or ``None`` if a view isn't
+        possible.
+
+    Examples
+    --------
+    >>> data = pd.DataFrame(np.arange(6.0).reshape(3, 2))
+    >>> _dataframe_values_view(data).shape
+    (3, 2)
+    >>> data[2] = np.arange(3.0)
+    >>> _dataframe_values_view(data) is None
+    True
+    """
+    if not _has_single_numeric_dtype(data):
+        return None
+    # Columns of the same block are views of the same array. Checked first, so that
+    # DataFrame.to_numpy isn't called when it would copy.
+    columns = [array.to_numpy() for _, array in data.items()]  # ruff: ignore[incorrect-dict-iterator]
+    if len({id(column.base) for column in columns}) != 1:
+        return None
+    values = data.to_numpy()
+    return values if np.shares_memory(values, columns[0]) else None
+
+
+def _has_single_numeric_dtype(data: pd.DataFrame) -> bool:
+    """
+    Check if all columns of a pandas.DataFrame have the same numeric NumPy dtype.
+
+    Parameters
+    ----------
+    data
+        The dataframe to be checked.
+
+    Returns
+    -------
+    ``True`` if all columns have the same signed integer, unsigned integer or floating
+    point NumPy dtype. Otherwise, return ``False``.
+    """
+    dtypes = set(data.dtypes)
+    if len(dtypes) != 1 or data.empty:
+        return False
+    dtype = dtypes.pop()
+    return isinstance(dtype, np.dtype) and dtype.kind in "iuf"
+
+
 def sequence_to_ctypes_array(
     sequence: Sequence[int | float] | np.ndarray | None, ctype, size: int
 ) -> ctp.Array | None:
@@ -297,6 +687,10 @@ def strings_to_ctypes_array(strings: Sequence[str] | np.ndarray) -> ctp.Array:
     Convert a sequence (e.g., a list) of strings or numpy.ndarray of strings into a
     ctypes array.
 
+    All strings are encoded at once into a single NUL-padded bytes buffer, and the
+    ctypes array holds the pointers to the strings in the buffer. The buffer is kept
+    alive by the ctypes array.
+
     Parameters
     ----------
     strings
@@ -323,4 +717,179 @@ def strings_to_ctypes_array(strings: Sequence[str] | np.ndarray) -> ctp.Array:
     >>> [s.decode() for s in ctypes_array]
     ['first', 'second', 'third']
     """
-    return (ctp.c_char_p * len(strings))(*[s.encode() for s in strings])
+    encoded = np.strings.encode(np.asarray(strings, dtype=np.str_), "utf-8")
+    # One more byte than the longest string, so that every string is NUL-terminated.
+    width = encoded.dtype.itemsize + 1
+    buffer = np.zeros(encoded.size, dtype=f"S{width}")
+    buffer[:] = encoded
+    pointers = buffer.ctypes.data + width * np.arange(buffer.size, dtype=np.uintp)
+    ctypes_array = (ctp.c_char_p * buffer.size).from_buffer(pointers)
+    ctypes_array._buffer = buffer  # The array only keeps the pointers alive.
+    return ctypes_array
+
+
+def text_to_segments(
+    textio: io.StringIO | io.BytesIO | mmap.mmap,
+) -> list[tuple[str, ctp.Array]]:
+    r"""
+    Split the lines of an in-memory text buffer into segments of ctypes strings.
+
+    Lines starting with ``"#"`` are comments and are skipped. Lines starting with
+    ``">"`` are segment headers. Segments without any data lines are dropped.
+
+    The text is copied once into a single bytes buffer, in which the line breaks are
+    replaced with NUL characters. The lines are classified with vectorized operations,
+    and the ctypes array of each segment holds the pointers to its lines in the buffer.
+    The buffer is kept alive by the ctypes arrays.
+
+    Parameters
+    ----------
+    textio
+        A :class:`io.StringIO` object, a :class:`io.BytesIO` object with UTF-8 encoded
+        text, or a :class:`mmap.mmap` object of a text file.
+
+    Returns
+    -------
+    segments
+        The header (an empty string if the segment has no header) and the ctypes array
+        of the data lines of each segment.
+
+    Examples
+    --------
+    >>> segments = text_to_segments(
+    ...     io.StringIO("# Comment\n> First\nL1\nL2\n>\n> Second\r\nL3\n")
+    ... )
+    >>> [(header, [s.decode() for s in text]) for header, text in segments]
+    [('First', ['L1', 'L2']), ('Second', ['L3'])]
+    >>> segments = text_to_segments(io.BytesIO("H 24p Légende\nN 2".encode()))
+    >>> [(header, [s.decode() for s in text]) for header, text in segments]
+    [('', ['H 24p Légende', 'N 2'])]
+    >>> segments = text_to_segments(io.StringIO("A\rB\r\nC\n"))
+    >>> [(header, [s.decode() for s in text]) for header, text in segments]
+    [('', ['A\rB', 'C'])]
+    """
+    if isinstance(textio, io.StringIO):
+        view = memoryview(textio.getvalue().encode())
+    elif isinstance(textio, io.BytesIO):
+        view = textio.getbuffer()
+    else:
+        view = memoryview(textio)
+    # One copy of the text with a trailing NUL, so that all lines are NUL-terminated.
+    with view:
+        size = view.nbytes
+        buffer = np.zeros(size + 1, dtype=np.uint8)
+        buffer[:size] = np.frombuffer(view, dtype=np.uint8)
+
+    newlines = np.flatnonzero(buffer == ord("\n"))
+    # Only the CR of CRLF line endings is removed. A lone CR is part of the line.
+    before = newlines[newlines > 0] - 1
+    buffer[before[buffer[before] == ord("\r")]] = 0
+    buffer[newlines] = 0
+    starts = np.concatenate([[0], newlines + 1])
+    ends = np.append(newlines, size)
+    if starts[-1] == size:  # No line after the last line break.
+        starts, ends = starts[:-1], ends[:-1]
+
+    first = buffer[starts]
+    is_header = first == ord(">")
+    is_data = ~is_header & (first != ord("#"))
+    # The segment of a data line is the number of headers before it. The header of
+    # segment i (i > 0) is the i-th header line.
+    segment_ids, indices, counts = np.unique(
+        np.cumsum(is_header)[is_data], return_index=True, return_counts=True
+    )
+    header_lines = np.column_stack([starts[is_header], ends[is_header]]).tolist()
+    pointers = buffer.ctypes.data + starts[is_data].astype(np.uintp)
+
+    segments = []
+    for segment_id, index, count in zip(
+        segment_ids.tolist(), indices.tolist(), counts.tolist(), strict=True
+    ):
+        header = ""
+        if segment_id > 0:
+            start, end = header_lines[segment_id - 1]
+            line = buffer[start:end].tobytes().split(b"\0", maxsplit=1)[0]
+            header = line.decode().strip(">").lstrip()
+        text = (ctp.c_char_p * count).from_buffer(pointers[index : index + count])
+        text._buffer = buffer  # The array only keeps the pointers alive.
+        segments.append((header, text))
+    return segments
+
+
+def geojson_to_segments(
+    geojson: Any, zcolumn: str | None = None
+) -> _GeometrySegments | None:
+    """
+    Flatten the geometries of a geo-like object into the segments of a GMT dataset.
+
+    Each part of a line or polygon geometry becomes one segment, and points are stored
+    in a single segment. The coordinates are extracted in a single vectorized pass using
+    shapely, without writing the geometries to an OGR_GMT file.
+
+    Only geopandas.GeoDataFrame/GeoSeries objects and shapely geometries are supported.
+    ``None`` is returned if the object is of other types, has no coordinates, has mixed
+    geometry types, or has polygons with holes (which can't be flagged in an in-memory
+    dataset), so that the caller can fall back to an OGR_GMT file.
+
+    Parameters
+    ----------
+    geojson
+        A geopandas.GeoDataFrame/GeoSeries object, or a shapely geometry.
+    zcolumn
+        Name of the attribute column to store as the z-value (``-Z<value>``) in the
+        header of each segment, e.g., for filling polygons with colors from a CPT.
+
+    Returns
+    -------
+    segments
+        The flattened segments, or ``None`` if the geometries can't be flattened.
+    """
+    try:
+        import shapely  # ruff: ignore[import-outside-top-level]
+    except ImportError:
+        return None
+
+    if isinstance(geojson, shapely.Geometry):
+        geometries = np.array([geojson], dtype=object)
+    elif isinstance(getattr(geojson, "geometry", None), pd.Series):
+        geometries = np.asarray(geojson.geometry, dtype=object)
+    else:
+        return None
+
+    # Split multi-part geometries and keep track of the geometry each part belongs to.
+    parts, owners = shapely.get_parts(geometries, return_index=True)
+    # Type IDs: 0 for Point, 1 for LineString, 2 for LinearRing, 3 for Polygon.
+    typeids = set(shapely.get_type_id(parts).tolist())
+    if typeids <= {0}:
+        geometry = "GMT_IS_POINT"
+    elif typeids <= {1, 2}:
+        geometry = "GMT_IS_LINE"
+    elif typeids == {3} and not shapely.get_num_interior_rings(parts).any():
+        geometry = "GMT_IS_POLY"
+        parts = shapely.get_exterior_ring(parts)
+    else:
+        return None
+
+    coords, index = shapely.get_coordinates(
+        parts, include_z=bool(shapely.has_z(parts).any()), return_index=True
+    )
+    if coords.size == 0:
+        return None
+    if geometry == "GMT_IS_POINT":
+        # All points go into a single segment.
+        index, owners = np.zeros_like(index), owners[:1]
+    counts = np.bincount(index, minlength=len(owners))
+    # Drop empty parts, which would become empty segments.
+    nonempty = counts > 0
+    offsets = np.concatenate([[0], np.cumsum(counts[nonempty])])
+
+    headers = None
+    if zcolumn is not None:
+        zvalues = np.asarray(geojson[zcolumn])[owners[nonempty]]
+        headers = [f"-Z{value}" for value in zvalues]
+    return _GeometrySegments(
+        geometry=geometry,
+        coords=np.ascontiguousarray(coords.T, dtype=np.float64),
+        offsets=offsets,
+        headers=headers,
+    )
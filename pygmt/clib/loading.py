@@ -5,7 +5,9 @@ The path to the shared library can be found automatically by ctypes or set throu
 environment variable :term:`GMT_LIBRARY_PATH`.
 """
 
+import contextlib
 import ctypes
+import json
 import os
 import shutil
 import subprocess as sp
@@ -130,7 +132,8 @@ def clib_full_names(env: Mapping[str, str] | None = None) -> Iterator[str]:
     The GMT shared library is searched for in following ways, sorted by priority:
 
     1. Path defined by the environment variable :term:`GMT_LIBRARY_PATH`
-    2. Path returned by the command ``gmt --show-library``
+    2. Path returned by the command ``gmt --show-library`` (cached across Python
+       sessions, see ``_gmt_show_library()``)
     3. Path defined by the environment variable :term:`PATH` (Windows only)
     4. System default search path
 
@@ -162,9 +165,7 @@ def clib_full_names(env: Mapping[str, str] | None = None) -> Iterator[str]:
     #    Use `str(Path(realpath))` to avoid mixture of separators "\\" and "/".
     if gmtbin := shutil.which("gmt"):
         try:
-            libfullpath = Path(
-                sp.check_output([gmtbin, "--show-library"], encoding="utf-8").rstrip()
-            )
+            libfullpath = Path(_gmt_show_library(gmtbin))
             if libfullpath.exists():
                 yield str(libfullpath)
         except sp.CalledProcessError:  # the 'gmt' executable is broken
@@ -181,6 +182,65 @@ def clib_full_names(env: Mapping[str, str] | None = None) -> Iterator[str]:
         yield libname
 
 
+def _library_path_cache() -> Path:
+    """
+    Return the path to the file that caches the output of ``gmt --show-library``.
+
+    The file is in the user cache directory of the operating system.
+    """
+    match sys.platform:
+        case "win32":
+            cachedir = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData"))
+        case "darwin":
+            cachedir = Path.home() / "Library" / "Caches"
+        case _:
+            cachedir = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return cachedir / "pygmt" / "libgmt-path.json"
+
+
+def _gmt_show_library(gmtbin: str) -> str:
+    """
+    Return the output of the command ``gmt --show-library``.
+
+    Running the command takes much longer than loading the library, so the output is
+    cached in a file and reused by later Python sessions. The cached output is keyed by
+    the path to the ``gmt`` executable and is discarded when the executable has been
+    modified (e.g., by upgrading GMT) or the cached library no longer exists. Errors in
+    reading or writing the cache file are ignored.
+
+    Parameters
+    ----------
+    gmtbin
+        Path to the ``gmt`` executable.
+
+    Returns
+    -------
+    libfullpath
+        Full path to the GMT shared library.
+    """
+    mtime = Path(gmtbin).stat().st_mtime_ns
+    cache: dict = {}
+    with contextlib.suppress(KeyError, OSError, RuntimeError, TypeError, ValueError):
+        cachefile = _library_path_cache()
+        cache = json.loads(cachefile.read_text(encoding="utf-8"))
+        entry = cache[gmtbin]
+        if entry["mtime"] == mtime and Path(entry["library"]).exists():
+            return entry["library"]
+
+    libfullpath = sp.check_output([gmtbin, "--show-library"], encoding="utf-8").rstrip()
+
+    # Write to a temporary file first so that concurrent Python sessions never read a
+    # partially written cache file.
+    with contextlib.suppress(OSError, RuntimeError, TypeError):
+        cache[gmtbin] = {"mtime": mtime, "library": libfullpath}
+        cachefile = _library_path_cache()
+        cachefile.parent.mkdir(parents=True, exist_ok=True)
+        tmpfile = cachefile.with_suffix(f".{os.getpid()}.tmp")
+        tmpfile.write_text(json.dumps(cache), encoding="utf-8")
+        tmpfile.replace(cachefile)
+    return libfullpath
+
+
 def check_libgmt(libgmt: ctypes.CDLL) -> None:
     """
     Make sure the GMT shared library was loaded correctly.
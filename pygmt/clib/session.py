@@ -7,33 +7,46 @@ Uses ctypes to wrap most of the core functions from the C API.
 
 import contextlib
 import ctypes as ctp
+import functools
 import io
+import mmap
 import sys
+import threading
+import warnings
 from collections.abc import Callable, Generator, Sequence
 from typing import Literal
 
 import numpy as np
 import pandas as pd
 import xarray as xr
+from packaging.version import Version
+from pygmt._typing import DTypeLike
 from pygmt.clib.conversion import (
+    _GeometrySegments,
+    dataarray_to_image,
     dataarray_to_matrix,
+    geojson_to_segments,
+    plan_table_input,
     sequence_to_ctypes_array,
     strings_to_ctypes_array,
+    text_to_segments,
     vectors_to_arrays,
 )
 from pygmt.clib.loading import get_gmt_version, load_libgmt
 from pygmt.datatypes import _GMT_DATASET, _GMT_GRID, _GMT_IMAGE
+from pygmt.datatypes.buffer import _can_adopt
+from pygmt.datatypes.dataset import _Segments
 from pygmt.exceptions import (
     GMTCLibError,
     GMTCLibNoSessionError,
     GMTTypeError,
     GMTValueError,
+    GMTVersionError,
 )
 from pygmt.helpers import (
     _validate_data_input,
     data_kind,
     tempfile_from_geojson,
-    tempfile_from_image,
 )
 
 FAMILIES = [
@@ -110,9 +123,75 @@ DTYPES = DTYPES_NUMERIC | DTYPES_TEXT
 # Dictionary for storing the values of GMT constants.
 GMT_CONSTANTS: dict[str, int] = {}
 
-# Load the GMT library outside the Session class to avoid repeated loading.
-_libgmt = load_libgmt()
-__gmt_version__ = get_gmt_version(_libgmt)
+# Dictionary for storing the ctypes function objects of libgmt, one object for each
+# prototype (name, argtypes and restype). The objects are never modified once created,
+# so that they can be used by many threads at the same time.
+_LIBGMT_FUNCS: dict[tuple, Callable] = {}
+
+# Lock for adding entries to the module-level caches from multiple threads.
+_CACHE_LOCK = threading.Lock()
+
+# Thread-local state of the worker threads of pygmt.parallel.map and pygmt.aio. The
+# "worker" attribute marks a worker thread and the "pool" attribute is the session pool
+# used by the thread.
+_THREAD_STATE = threading.local()
+
+# The minimum GMT version supported by PyGMT.
+required_gmt_version = "6.5.0"
+
+
+@functools.cache
+def _load_libgmt() -> ctp.CDLL:
+    """
+    Load the GMT library on first use and check its version.
+
+    The library is loaded outside the Session class to avoid repeated loading, and not
+    at import time so that ``import pygmt`` doesn't have to find and load it.
+
+    Raises
+    ------
+    GMTVersionError
+        If the GMT version is older than the required version.
+    """
+    libgmt = load_libgmt()
+    version = get_gmt_version(libgmt)
+    if Version(version) < Version(required_gmt_version):
+        msg = (
+            f"Using an incompatible GMT version {version}. "
+            f"Must be equal or newer than {required_gmt_version}."
+        )
+        raise GMTVersionError(msg)
+    return libgmt
+
+
+def __getattr__(name: str) -> str:
+    """
+    Get the GMT version string ``__gmt_version__``, loading the GMT library if needed.
+    """
+    if name == "__gmt_version__":
+        return get_gmt_version(_load_libgmt())
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+# The pool of reusable GMT API sessions that is currently active (if any). Managed by
+# the session_pool context manager.
+_SESSION_POOL: "_SessionPool | None" = None
+
+# GMT modules that change the state of a GMT API session (e.g., the GMT defaults), so
+# that a pooled session can't be reused after calling them.
+_STATEFUL_MODULES = {"begin", "end", "gmtset", "set"}
+
+
+def _use_nohistory() -> bool:
+    """
+    Check if new GMT API sessions must be created with ``GMT_SESSION_NOHISTORY``.
+
+    GMT reads and writes gmt.history in the current directory in classic mode (i.e.,
+    without a modern mode session), or in the shared session directory if running in a
+    worker thread. Neither should be used.
+    """
+    return not Session._modern_mode or getattr(_THREAD_STATE, "worker", False)
 
 
 class Session:
@@ -165,6 +244,10 @@ class Session:
     -55 -47 -24 -10 190 981 1 1 8 14 1 1
     """
 
+    # Whether the global modern mode session is running. Set by the functions in
+    # pygmt.session_management.
+    _modern_mode: bool = False
+
     @property
     def session_pointer(self) -> ctp.c_void_p:
         """
@@ -215,18 +298,126 @@ class Session:
         """
         Create a GMT API session.
 
-        Calls :meth:`pygmt.clib.Session.create`.
-        """
-        self.create("pygmt-session")
+        Calls :meth:`pygmt.clib.Session.create`. If a pool of sessions is active (see
+        :func:`pygmt.clib.session_pool`), borrows an already created session from the
+        pool instead. A pool assigned to the current thread (e.g., by :mod:`pygmt.aio`)
+        takes precedence over the global one. Worker threads never borrow from the
+        global pool, whose sessions may use the history of the modern mode session.
+        """
+        pool = getattr(_THREAD_STATE, "pool", None)
+        if pool is None and not getattr(_THREAD_STATE, "worker", False):
+            pool = _SESSION_POOL
+        pooled = pool.acquire() if pool is not None else None
+        if pooled is not None:
+            self._borrow(pooled)
+        else:
+            self.create("pygmt-session")
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         """
         Destroy the currently open GMT API session.
 
-        Calls :meth:`pygmt.clib.Session.destroy`.
+        Calls :meth:`pygmt.clib.Session.destroy`. A session borrowed from a pool is
+        returned to the pool instead, unless an exception was raised in the ``with``
+        block.
         """
-        self.destroy()
+        if getattr(self, "_pooled", None) is not None:
+            self._give_back(discard=exc_type is not None)
+        else:
+            self.destroy()
+
+    def _borrow(self, pooled: "Session") -> None:
+        """
+        Use the open GMT API session of a pooled session as the current session.
+
+        Parameters
+        ----------
+        pooled
+            A session with an open GMT API session, handed out by a session pool.
+        """
+        # The print callback of the pooled session appends to its error log, so share
+        # the same list and clear the messages left behind by the previous user.
+        pooled._error_log.clear()
+        self._error_log = pooled._error_log
+        self._print_callback = pooled._print_callback
+        self._containers: list[ctp.c_void_p] = []
+        self._output_vfnames: set[str] = set()
+        self._read_vfnames: set[str] = set()
+        self._state_changed = False
+        self._referenced_buffers = set()
+        self._vector_buffers = []
+        self._pooled = pooled
+        self.session_pointer = pooled.session_pointer
+
+    def _give_back(self, discard: bool = False) -> None:
+        """
+        Return the borrowed GMT API session to the pool it came from.
+
+        The data containers created while the session was borrowed and the outputs of
+        its virtual files (whether read or not) are freed first, so that the memory
+        doesn't accumulate over many uses of the same session. The session is destroyed
+        instead if its state was changed in a way that can't be reset (e.g., the type
+        of an input column was set to absolute time).
+
+        Parameters
+        ----------
+        discard
+            If ``True``, destroy the session instead of returning it to the pool.
+        """
+        discard = discard or self._state_changed
+        if not discard:
+            # Outputs that weren't read can still be retrieved after their virtual
+            # files were closed. If there is no output, the state is unknown.
+            for vfname in self._output_vfnames - self._read_vfnames:
+                discard |= not self.read_virtualfile(vfname)
+        self._destroy_containers(start=0)
+
+        pooled, self._pooled = self._pooled, None
+        self.session_pointer = None
+        pooled._pool.release(pooled, discard=discard)
+
+    def _track_container(self, pointer: ctp.c_void_p | int | None) -> None:
+        """
+        Keep track of a data container created in or read from the session.
+
+        The tracked containers can be freed before the session ends, by
+        ``_free_data`` or when returning a borrowed session to the pool (see
+        ``_give_back``).
+        """
+        if pointer is not None and pointer not in self._containers:
+            self._containers.append(pointer)
+
+    def _destroy_containers(self, start: int) -> None:
+        """
+        Free the tracked data containers from index ``start`` on, newest first.
+        """
+        c_destroy_data = self.get_libgmt_func(
+            "GMT_Destroy_Data", argtypes=[ctp.c_void_p, ctp.c_void_p], restype=ctp.c_int
+        )
+        # GMT_Destroy_Data expects the address of the pointer to the data container.
+        # Containers that were already freed by GMT are ignored.
+        for container in reversed(self._containers[start:]):
+            c_destroy_data(self.session_pointer, ctp.byref(ctp.c_void_p(container)))
+        del self._containers[start:]
+
+    @contextlib.contextmanager
+    def _free_data(self) -> Generator[None, None, None]:
+        """
+        Free the data containers created or read within a ``with`` block on exit.
+
+        Use it to process many inputs one after another in the same session, without
+        keeping the inputs and outputs of all of them in memory until the session ends.
+        Outputs must be converted (e.g., by :meth:`virtualfile_to_dataset`) within the
+        block.
+        """
+        ncontainers, nbuffers = len(self._containers), len(self._vector_buffers)
+        try:
+            yield
+        finally:
+            self._destroy_containers(start=ncontainers)
+            # GMT doesn't reference the arrays any more.
+            del self._vector_buffers[nbuffers:]
 
     def __getitem__(self, name: str) -> int:
         """
@@ -243,9 +434,11 @@ class Session:
             Integer value of the constant. Do not rely on this value because it might
             change.
         """
-        if name not in GMT_CONSTANTS:
-            GMT_CONSTANTS[name] = self.get_enum(name)
-        return GMT_CONSTANTS[name]
+        if (value := GMT_CONSTANTS.get(name)) is None:
+            value = self.get_enum(name)
+            with _CACHE_LOCK:
+                GMT_CONSTANTS[name] = value
+        return value
 
     def get_enum(self, name: str) -> int:
         """
@@ -293,7 +486,10 @@ class Session:
 
         Assigns the argument and return type conversions for the function.
 
-        Use this method to access a C function from libgmt.
+        Use this method to access a C function from libgmt. A separate function object
+        is created (and reused) for each combination of ``argtypes`` and ``restype``, so
+        the same API function can be used with different conversions by many threads at
+        the same time. The returned function object must not be modified.
 
         Parameters
         ----------
@@ -323,12 +519,17 @@ class Session:
         <class 'ctypes.CDLL.__init__.<locals>._FuncPtr'>
         """
         if not hasattr(self, "_libgmt"):
-            self._libgmt = _libgmt
-        function = getattr(self._libgmt, name)
-        if argtypes is not None:
-            function.argtypes = argtypes
-        if restype is not None:
-            function.restype = restype
+            self._libgmt = _load_libgmt()
+        key = (name, None if argtypes is None else tuple(argtypes), restype)
+        if (function := _LIBGMT_FUNCS.get(key)) is None:
+            # A new function object, independent of the one cached by the CDLL object.
+            function = self._libgmt._FuncPtr((name, self._libgmt))
+            if argtypes is not None:
+                function.argtypes = argtypes
+            if restype is not None:
+                function.restype = restype
+            with _CACHE_LOCK:
+                function = _LIBGMT_FUNCS.setdefault(key, function)
         return function
 
     def create(self, name: str) -> None:
@@ -378,6 +579,17 @@ class Session:
         # Capture the output printed by GMT into this list. Will use it later to
         # generate error messages for the exceptions raised by API calls.
         self._error_log: list[str] = []
+        # Addresses of the user memory passed to GMT by reference as grid, image or
+        # column data.
+        self._referenced_buffers: set[int] = set()
+        # Arrays created by put_vector/put_strings that GMT references until the
+        # session ends.
+        self._vector_buffers: list[np.ndarray | ctp.Array] = []
+        # Data containers created in or read from the session (see _track_container).
+        self._containers: list[ctp.c_void_p] = []
+        # Whether the session state was changed in a way that can't be reset, so that
+        # the session can't be reused by a session pool.
+        self._state_changed = False
 
         @ctp.CFUNCTYPE(ctp.c_int, ctp.c_void_p, ctp.c_char_p)
         def print_func(file_pointer, message):  # ruff: ignore[unused-function-argument]
@@ -408,6 +620,11 @@ class Session:
         # GMT_SESSION_EXTERNAL: GMT is called by an external wrapper.
         # GMT_SESSION_NOGDALCLOSE: Do not call GDALDestroyDriverManager when using GDAL.
         session_type = self["GMT_SESSION_EXTERNAL"] + self["GMT_SESSION_NOGDALCLOSE"]
+        # GMT_SESSION_NOHISTORY: Do not use gmt.history (see _use_nohistory). It's
+        # fixed for the lifetime of the session, so pooled sessions must remember it.
+        self._nohistory = _use_nohistory()
+        if self._nohistory:
+            session_type += self["GMT_SESSION_NOHISTORY"]
         session = c_create_session(name.encode(), padding, session_type, print_func)
 
         if session is None:
@@ -662,6 +879,8 @@ class Session:
                 reason="Parameter 'args' must either be a list of strings (recommended) or a string.",
             )
 
+        if module in _STATEFUL_MODULES:
+            self._state_changed = True
         status = c_call_module(self.session_pointer, module.encode(), mode, argv)
         if status != 0:
             msg = f"Module {module!r} failed with status code {status}:\n{self._error_message}"
@@ -823,6 +1042,7 @@ class Session:
         if data_ptr is None:
             msg = "Failed to create an empty GMT data pointer."
             raise GMTCLibError(msg)
+        self._track_container(data_ptr)
         return data_ptr
 
     def _parse_pad(self, family: str, pad: int | None) -> int:
@@ -961,7 +1181,8 @@ class Session:
 
         Not all numpy dtypes are supported, only: int8, int16, int32, int64, longlong,
         uint8, uint16, uint32, uint64, ulonglong, float32, float64, str\_, datetime64,
-        and timedelta64.
+        and timedelta64. Datetimes are passed to GMT as absolute times in seconds (or
+        :gmt-term:`TIME_UNIT`) relative to :gmt-term:`TIME_EPOCH`.
 
         .. warning::
             The numpy array must be C contiguous in memory. Use
@@ -992,12 +1213,21 @@ class Session:
 
         vector_pointer: ctp.Array | ctp.c_void_p
         gmt_type = self._check_dtype_and_dim(vector, ndim=1)
-        if gmt_type in {self["GMT_TEXT"], self["GMT_DATETIME"]}:
-            if gmt_type == self["GMT_DATETIME"]:
-                vector = np.datetime_as_string(vector)
+        if gmt_type == self["GMT_DATETIME"]:
+            # Pass datetimes as the numbers GMT uses internally instead of as strings
+            # that GMT has to parse. The array must outlive this method call.
+            times = self._datetime_to_gmt_time(vector)
+            self._vector_buffers.append(times)
+            self._set_abstime_column(column)
+            gmt_type = self["GMT_DOUBLE"]
+            vector_pointer = times.ctypes.data_as(ctp.c_void_p)
+            self._referenced_buffers.add(times.ctypes.data)
+        elif gmt_type == self["GMT_TEXT"]:
             vector_pointer = strings_to_ctypes_array(vector)
+            self._vector_buffers.append(vector_pointer)
         else:
             vector_pointer = vector.ctypes.data_as(ctp.c_void_p)
+            self._referenced_buffers.add(vector.ctypes.data)
         status = c_put_vector(
             self.session_pointer, dataset, column, gmt_type, vector_pointer
         )
@@ -1008,6 +1238,73 @@ class Session:
             )
             raise GMTCLibError(msg)
 
+    def _datetime_to_gmt_time(self, vector: np.ndarray) -> np.ndarray:
+        """
+        Convert datetimes to the numbers used by GMT to represent absolute times.
+
+        GMT represents absolute times as double-precision numbers relative to
+        :gmt-term:`TIME_EPOCH`, in the unit of :gmt-term:`TIME_UNIT`. Years are 365.2425
+        days and months are of equal length. NaT values are converted to NaN.
+
+        Parameters
+        ----------
+        vector
+            The 1-D array of datetime64 type.
+
+        Returns
+        -------
+        times
+            The 1-D C contiguous array of float64 type.
+        """
+        scale = {
+            "y": 365.2425 * 86400.0,
+            "o": 365.2425 / 12.0 * 86400.0,
+            "w": 7 * 86400.0,
+            "d": 86400.0,
+            "h": 3600.0,
+            "m": 60.0,
+            "s": 1.0,
+        }[self.get_default("TIME_UNIT")]
+        epoch = np.datetime64(self.get_default("TIME_EPOCH"))
+        times = (vector - epoch) / np.timedelta64(1, "s")
+        if scale != 1.0:
+            times /= scale
+        return np.ascontiguousarray(times, dtype=np.float64)
+
+    def _set_abstime_column(self, column: int) -> None:
+        """
+        Set the type of an input column to absolute time.
+
+        GMT has no API function to set column types, but ``GMT_Put_Vector`` sets the
+        type of a column to absolute time when it parses a datetime string column. So,
+        put a single datetime string in the same column of a one-row dataset.
+
+        Parameters
+        ----------
+        column
+            The column number (starting from 0).
+        """
+        c_put_vector = self.get_libgmt_func(
+            "GMT_Put_Vector",
+            argtypes=[ctp.c_void_p, ctp.c_void_p, ctp.c_uint, ctp.c_uint, ctp.c_void_p],
+            restype=ctp.c_int,
+        )
+        dataset = self.create_data(
+            family="GMT_IS_DATASET|GMT_VIA_VECTOR",
+            geometry="GMT_IS_POINT",
+            mode="GMT_CONTAINER_ONLY",
+            dim=[column + 1, 1, self["GMT_DOUBLE"], 0],
+        )
+        strings = strings_to_ctypes_array(np.array([self.get_default("TIME_EPOCH")]))
+        status = c_put_vector(
+            self.session_pointer, dataset, column, self["GMT_DATETIME"], strings
+        )
+        # The column type is kept by the session and can't be set back to a number.
+        self._state_changed = True
+        if status != 0:
+            msg = f"Failed to set column {column} to absolute time."
+            raise GMTCLibError(msg)
+
     def put_strings(
         self, dataset: ctp.c_void_p, family: str, strings: np.ndarray
     ) -> None:
@@ -1057,6 +1354,8 @@ class Session:
             family, valid=FAMILIES, valid_modifiers=METHODS
         )
         strings_pointer = strings_to_ctypes_array(strings)
+        # GMT may keep the pointers if the strings are not duplicated.
+        self._vector_buffers.append(strings_pointer)
         status = c_put_strings(
             self.session_pointer, family_int, dataset, strings_pointer
         )
@@ -1482,13 +1781,9 @@ class Session:
         # Have to use modifier "GMT_IS_DUPLICATE" to duplicate the strings.
         string_arrays = arrays[columns:]
         if string_arrays:
-            if len(string_arrays) == 1:
-                strings = string_arrays[0]
-            elif len(string_arrays) > 1:
-                strings = np.array(
-                    [" ".join(vals) for vals in zip(*string_arrays, strict=True)],
-                    dtype=np.str_,
-                )
+            strings = string_arrays[0]
+            for array in string_arrays[1:]:
+                strings = np.strings.add(np.strings.add(strings, " "), array)
             self.put_strings(
                 dataset, family="GMT_IS_VECTOR|GMT_IS_DUPLICATE", strings=strings
             )
@@ -1521,7 +1816,12 @@ class Session:
         and :meth:`pygmt.clib.Session.open_virtualfile`.
 
         The matrix must be C contiguous in memory. If it is not (e.g., it is a slice of
-        a larger array), the array will be copied to make sure it is.
+        a larger array), the array will be copied to make sure it is. The only
+        exception is a column-major (Fortran-ordered) matrix, whose columns are
+        contiguous and are passed as vectors instead, without any copy. Memory-mapped
+        arrays (e.g., :class:`numpy.memmap` or arrays returned by :func:`numpy.load`
+        with ``mmap_mode="r"``) in either order are passed to GMT without being read
+        into memory first.
 
         Parameters
         ----------
@@ -1552,6 +1852,13 @@ class Session:
         ...             print(fout.read().strip())
         <matrix memory>: N = 4 <0/9> <1/10> <2/11>
         """
+        matrix = np.asarray(matrix)
+        if matrix.flags.f_contiguous and not matrix.flags.c_contiguous:
+            # The rows of the transposed matrix are the contiguous columns.
+            with self.virtualfile_from_vectors(matrix.T) as vfile:
+                yield vfile
+            return
+
         # Conversion to a C-contiguous array needs to be done here and not in put_matrix
         # because we need to maintain a reference to the copy while it is being used by
         # the C API. Otherwise, the array would be garbage collected and the memory
@@ -1640,8 +1947,9 @@ class Session:
         # the C API. Otherwise, the array would be garbage collected and the memory
         # freed. Creating it in this context manager guarantees that the copy will be
         # around until the virtual file is closed. The conversion is implicit in
-        # dataarray_to_matrix.
-        matrix, region, inc = dataarray_to_matrix(grid)
+        # dataarray_to_matrix. A grid pinned with grid.gmt.pin() has been converted
+        # already, so the cached matrix is reused.
+        matrix, region, inc = grid.gmt._pinned or dataarray_to_matrix(grid)
 
         family = "GMT_IS_GRID|GMT_VIA_MATRIX"
         geometry = "GMT_IS_SURFACE"
@@ -1654,31 +1962,95 @@ class Session:
             registration=_reg,  # type: ignore[arg-type]
         )
         self.put_matrix(gmt_grid, matrix)
+        # GMT may use the matrix directly as the grid data, so it may show up in the
+        # output of a module and must never be adopted (see virtualfile_to_raster).
+        self._referenced_buffers.add(matrix.ctypes.data)
         with self.open_virtualfile(
             family, geometry, "GMT_IN|GMT_IS_REFERENCE", gmt_grid
         ) as vfile:
             yield vfile
 
+    @contextlib.contextmanager
+    def virtualfile_from_image(self, image: xr.DataArray) -> Generator[str, None, None]:
+        """
+        Store a 3-D image in a virtual file.
+
+        Use the virtual file name to pass in the data in your image to a GMT module.
+        Images must be :class:`xarray.DataArray` instances of uint8 type, with the band
+        dimension first, e.g., a shape like (3, Y, X).
+
+        The image is stored in a ``GMT_IMAGE`` data container, whose data points to a
+        pixel-interleaved copy of the image (no copy is needed if the image is already
+        in this layout). The container is passed to GMT by reference, so no GeoTIFF
+        file is written and read back.
+
+        Parameters
+        ----------
+        image
+            The image that will be included in the virtual file.
+
+        Yields
+        ------
+        fname
+            The name of virtual file. Pass this as a file name argument to a GMT module.
+        """
+        _gtype = {0: "GMT_GRID_IS_CARTESIAN", 1: "GMT_GRID_IS_GEO"}[image.gmt.gtype]
+        _reg = {0: "GMT_GRID_NODE_REG", 1: "GMT_GRID_PIXEL_REG"}[image.gmt.registration]
+
+        # The array must be kept alive while the virtual file is in use.
+        array, region, inc = dataarray_to_image(image)
+        n_rows, n_columns, n_bands = array.shape
+
+        family, geometry = "GMT_IS_IMAGE", "GMT_IS_SURFACE"
+        gmt_image = self.create_data(
+            family,
+            geometry,
+            mode=f"GMT_CONTAINER_ONLY|{_gtype}",
+            dim=[n_columns, n_rows, n_bands],
+            ranges=region,
+            inc=inc,
+            registration=_reg,  # type: ignore[arg-type]
+            pad=0,
+        )
+        container = ctp.cast(gmt_image, ctp.POINTER(_GMT_IMAGE)).contents
+        container.header.contents.n_bands = n_bands
+        container.data = array.ctypes.data_as(ctp.POINTER(ctp.c_ubyte))
+        self._referenced_buffers.add(array.ctypes.data)
+        with self.open_virtualfile(
+            family, geometry, "GMT_IN|GMT_IS_REFERENCE", gmt_image
+        ) as vfile:
+            try:
+                yield vfile
+            finally:
+                # Must set the pointer to None to avoid GMT freeing the memory owned by
+                # the numpy array.
+                container.data = None
+
     @contextlib.contextmanager
     def virtualfile_from_stringio(
-        self, stringio: io.StringIO
+        self, stringio: io.StringIO | io.BytesIO | mmap.mmap
     ) -> Generator[str, None, None]:
         r"""
         Store a :class:`io.StringIO` object in a virtual file.
 
         Store the contents of a :class:`io.StringIO` object in a GMT_DATASET container
-        and create a virtual file to pass to a GMT module.
+        and create a virtual file to pass to a GMT module. A :class:`io.BytesIO` object
+        or a :class:`mmap.mmap` object of a file with UTF-8 encoded text is also
+        accepted.
 
         For simplicity, currently we make following assumptions in the StringIO object
 
         - ``"#"`` indicates a comment line.
         - ``">"`` indicates a segment header.
 
+        The text is copied once into a single buffer, and the text records of the
+        GMT_DATASET point to the lines in the buffer.
+
         Parameters
         ----------
         stringio
-            The :class:`io.StringIO` object containing the data to be stored in the
-            virtual file.
+            The :class:`io.StringIO`, :class:`io.BytesIO` or :class:`mmap.mmap` object
+            containing the data to be stored in the virtual file.
 
         Yields
         ------
@@ -1704,28 +2076,14 @@ class Session:
         1                                          N 2
         2  S 0.1i c 0.15i p300/12 0.25p 0.3i My circle
         """
-        # Parse the io.StringIO object.
-        segments = []
-        current_segment = {"header": "", "data": []}
-        for line in stringio.getvalue().splitlines():
-            if line.startswith("#"):  # Skip comments
-                continue
-            if line.startswith(">"):  # Segment header
-                if current_segment["data"]:  # If we have data, start a new segment
-                    segments.append(current_segment)
-                    current_segment = {"header": "", "data": []}
-                current_segment["header"] = line.strip(">").lstrip()
-            else:
-                current_segment["data"].append(line)  # type: ignore[attr-defined]
-        if current_segment["data"]:  # Add the last segment if it has data
-            segments.append(current_segment)
+        segments = text_to_segments(stringio)
 
         # One table with one or more segments.
         # n_rows is the maximum number of rows/records for all segments.
         # n_columns is the number of numeric data columns, so it's 0 here.
         n_tables = 1
         n_segments = len(segments)
-        n_rows = max(len(segment["data"]) for segment in segments)
+        n_rows = max(len(text) for _, text in segments)
         n_columns = 0
 
         # Create the GMT_DATASET container
@@ -1737,11 +2095,11 @@ class Session:
             dim=[n_tables, n_segments, n_rows, n_columns],
         )
         table = ctp.cast(dataset, ctp.POINTER(_GMT_DATASET)).contents.table[0].contents
-        for i, segment in enumerate(segments):
+        for i, (header, text) in enumerate(segments):
             seg = table.segment[i].contents
-            if segment["header"]:
-                seg.header = segment["header"].encode()  # type: ignore[attr-defined]
-            seg.text = strings_to_ctypes_array(segment["data"])
+            if header:
+                seg.header = header.encode()
+            seg.text = text
 
         with self.open_virtualfile(family, geometry, "GMT_IN", dataset) as vfile:
             try:
@@ -1754,6 +2112,97 @@ class Session:
                     seg.header = None
                     seg.text = None
 
+    @contextlib.contextmanager
+    def virtualfile_from_segments(
+        self, segments: _GeometrySegments
+    ) -> Generator[str, None, None]:
+        """
+        Store geometries flattened into segments in a virtual file.
+
+        The segments (e.g., flattened from a :class:`geopandas.GeoDataFrame` by
+        ``geojson_to_segments``) are stored in a GMT_DATASET container with one table,
+        whose segments point to the memory of the coordinate array, so no coordinates
+        are written to a file.
+
+        Parameters
+        ----------
+        segments
+            The coordinates, row offsets and optional headers of the segments.
+
+        Yields
+        ------
+        fname
+            The name of the virtual file.
+        """
+        coords, offsets = segments.coords, segments.offsets.tolist()
+        n_columns, n_records = coords.shape
+        n_segments = len(offsets) - 1
+        # Per-segment and overall minimum/maximum of each column, ignoring NaNs.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            seg_min = np.fmin.reduceat(coords, offsets[:-1], axis=1).T.tolist()
+            seg_max = np.fmax.reduceat(coords, offsets[:-1], axis=1).T.tolist()
+            col_min, col_max = np.nanmin(coords, axis=1), np.nanmax(coords, axis=1)
+
+        family, geometry = "GMT_IS_DATASET", segments.geometry
+        dataset = self.create_data(
+            family,
+            geometry,
+            mode="GMT_CONTAINER_ONLY",
+            dim=[1, n_segments, 0, n_columns],
+        )
+        ds = ctp.cast(dataset, ctp.POINTER(_GMT_DATASET)).contents
+        table = ds.table[0].contents
+        ds.n_records = table.n_records = n_records
+        for minmax, values in [
+            (ds.min, col_min),
+            (ds.max, col_max),
+            (table.min, col_min),
+            (table.max, col_max),
+        ]:
+            if minmax:
+                for col, value in enumerate(values.tolist()):
+                    minmax[col] = value
+
+        # The segments point to the columns of the coordinate array, and the pointer
+        # arrays are allocated here if GMT hasn't allocated them.
+        address, itemsize = coords.ctypes.data, coords.itemsize
+        pointers = []
+        for i in range(n_segments):
+            seg = table.segment[i].contents
+            for field, ctype in [
+                ("data", ctp.POINTER(ctp.c_double)),
+                ("min", ctp.c_double),
+                ("max", ctp.c_double),
+            ]:
+                if not getattr(seg, field):
+                    array = (ctype * n_columns)()
+                    setattr(seg, field, array)
+                    pointers.append((seg, field, array))
+            start = offsets[i]
+            seg.n_rows = offsets[i + 1] - start
+            for col in range(n_columns):
+                column_address = address + (col * n_records + start) * itemsize
+                seg.data[col] = ctp.cast(column_address, ctp.POINTER(ctp.c_double))
+                self._referenced_buffers.add(column_address)
+                seg.min[col], seg.max[col] = seg_min[i][col], seg_max[i][col]
+            if segments.headers is not None:
+                seg.header = segments.headers[i].encode()
+
+        with self.open_virtualfile(family, geometry, "GMT_IN", dataset) as vfile:
+            try:
+                yield vfile
+            finally:
+                # Must set the pointers to None to avoid GMT freeing memory owned by
+                # Python when destroying the dataset.
+                for i in range(n_segments):
+                    seg = table.segment[i].contents
+                    seg.header = None
+                    for col in range(n_columns):
+                        seg.data[col] = None
+                for seg, field, _ in pointers:
+                    setattr(seg, field, None)
+
     def virtualfile_in(
         self,
         check_kind=None,
@@ -1763,6 +2212,7 @@ class Session:
         z=None,
         required=True,
         mincols=2,
+        geometry_only=False,
     ):
         """
         Store any data inside a virtual file.
@@ -1779,7 +2229,11 @@ class Session:
         data
             Any raster or vector data format. This could be a file name or
             path, a raster grid, a vector matrix/arrays, or other supported
-            data input.
+            data input. Arrow tables (e.g., pyarrow.Table or polars.DataFrame)
+            are passed column by column, without copying the numeric columns
+            that have a single chunk and no nulls. Other tables are passed as a
+            matrix or as column vectors, whichever needs fewer copies for the
+            memory layout of the data (see ``plan_table_input``).
         x/y/z : 1-D arrays or None
             x, y, and z columns as numpy arrays.
         required : bool
@@ -1788,6 +2242,12 @@ class Session:
         mincols
             Number of minimum required columns. Default is 2 (i.e. require x and y
             columns).
+        geometry_only : bool
+            Set to True if only the geometries of a geo-like object are needed, so that
+            they can be stored in memory instead of being written to a temporary OGR_GMT
+            file with all the attribute fields. Falls back to the OGR_GMT file if the
+            geometries can't be stored in memory (e.g., polygons with holes). Default is
+            False.
 
         Returns
         -------
@@ -1845,7 +2305,7 @@ class Session:
             "file": contextlib.nullcontext,
             "geojson": tempfile_from_geojson,
             "grid": self.virtualfile_from_grid,
-            "image": tempfile_from_image,
+            "image": self.virtualfile_from_image,
             "stringio": self.virtualfile_from_stringio,
             "matrix": self.virtualfile_from_matrix,
             "vectors": self.virtualfile_from_vectors,
@@ -1865,26 +2325,21 @@ class Session:
                         "skimage.exposure.equalize_hist."
                     ),
                 )
+            case "geojson" if geometry_only and (segments := geojson_to_segments(data)):
+                _virtualfile_from = self.virtualfile_from_segments
+                _data = segments
             case "empty":  # data is None, so data must be given via x/y/z.
                 _data = [x, y]
                 if z is not None:
                     _data.append(z)
-            case "vectors":
-                if hasattr(data, "items") and not hasattr(data, "to_frame"):
-                    # Dictionary, pandas.DataFrame or xarray.Dataset types.
-                    # pandas.Series will be handled below like a 1-D numpy.ndarray.
-                    _data = [array for _, array in data.items()]  # ruff: ignore[incorrect-dict-iterator]
-                else:
-                    # Python list, tuple, numpy.ndarray, and pandas.Series types
-                    _data = np.atleast_2d(np.asanyarray(data).T)
-            case "matrix" if data.dtype.kind not in "iuf":
-                # GMT can only accept a 2-D matrix which are signed integer (i),
-                # unsigned integer (u) or floating point (f) types. For other data
-                # types, we need to use virtualfile_from_vectors instead, which turns
-                # the matrix into a list of vectors and allows for better handling of
-                # non-integer/float type inputs (e.g. for string or datetime data types)
-                _virtualfile_from = self.virtualfile_from_vectors
-                _data = data.T
+            case "matrix" | "vectors":
+                # Pass the matrix pointer, column views or the columns copied once,
+                # depending on the layout of the data.
+                table_kind, _data = plan_table_input(data, kind=kind)
+                _virtualfile_from = {
+                    "matrix": self.virtualfile_from_matrix,
+                    "vectors": self.virtualfile_from_vectors,
+                }[table_kind]
 
         # Finally create the virtualfile from the data, to be passed into GMT
         file_context = _virtualfile_from(_data)
@@ -1955,6 +2410,10 @@ class Session:
             }[kind]
             direction = "GMT_OUT|GMT_IS_REFERENCE" if kind == "image" else "GMT_OUT"
             with self.open_virtualfile(family, geometry, direction, None) as vfile:
+                # The output of a borrowed session is freed when returning the session
+                # to the pool, usually after it's read outside of this block.
+                if getattr(self, "_pooled", None) is not None:
+                    self._output_vfnames.add(vfile)
                 yield vfile
 
     def inquire_virtualfile(self, vfname: str) -> int:
@@ -1986,6 +2445,34 @@ class Session:
         )
         return c_inquire_virtualfile(self.session_pointer, vfname.encode())
 
+    def init_virtualfile(self, vfname: str) -> None:
+        """
+        Reset a virtual file so that it can be read by another module call.
+
+        An input virtual file can be read only once. Resetting it allows passing the
+        same data to several module calls without creating the data container and the
+        virtual file again. Wraps ``GMT_Init_VirtualFile``.
+
+        Parameters
+        ----------
+        vfname
+            Name of the virtual file to reset.
+
+        Raises
+        ------
+        GMTCLibError
+            If ``GMT_Init_VirtualFile`` exits with a non-zero status.
+        """
+        c_init_virtualfile = self.get_libgmt_func(
+            "GMT_Init_VirtualFile",
+            argtypes=[ctp.c_void_p, ctp.c_uint, ctp.c_char_p],
+            restype=ctp.c_int,
+        )
+        status = c_init_virtualfile(self.session_pointer, 0, vfname.encode())
+        if status != 0:
+            msg = f"Failed to reset virtual file {vfname!r}."
+            raise GMTCLibError(msg)
+
     def read_virtualfile(
         self,
         vfname: str,
@@ -2046,6 +2533,9 @@ class Session:
             restype=ctp.c_void_p,
         )
         pointer = c_read_virtualfile(self.session_pointer, vfname.encode())
+        self._track_container(pointer)
+        if getattr(self, "_pooled", None) is not None:
+            self._read_vfnames.add(vfname)
         # The GMT C API function GMT_Read_VirtualFile returns a void pointer. It usually
         # needs to be cast into a pointer to a GMT data container (e.g., _GMT_GRID or
         # _GMT_DATASET).
@@ -2057,15 +2547,79 @@ class Session:
         dtype = {"dataset": _GMT_DATASET, "grid": _GMT_GRID, "image": _GMT_IMAGE}[kind]
         return ctp.cast(pointer, ctp.POINTER(dtype))
 
+    def _detach_data(self, family: str, pointer: ctp.c_void_p) -> None:
+        """
+        Detach the data of a GMT data container from GMT's memory management.
+
+        GMT won't free the data when destroying the container or the session, so the
+        data can be adopted by NumPy arrays (see ``pygmt.datatypes.buffer``) and outlive
+        the session. Wraps ``GMT_Set_AllocMode``.
+
+        Parameters
+        ----------
+        family
+            A valid GMT data family name (e.g., ``"GMT_IS_GRID"``).
+        pointer
+            The pointer to the GMT data container.
+        """
+        c_set_allocmode = self.get_libgmt_func(
+            "GMT_Set_AllocMode",
+            argtypes=[ctp.c_void_p, ctp.c_uint, ctp.c_void_p],
+            restype=ctp.c_int,
+        )
+        family_int = self._parse_constant(family, valid=FAMILIES)
+        status = c_set_allocmode(self.session_pointer, family_int, pointer)
+        if status != 0:
+            msg = f"Failed to detach the data of the {family} data container."
+            raise GMTCLibError(msg)
+
+    def _detach_columns(self, dataset: ctp.c_void_p) -> bool:
+        """
+        Detach the columns of a dataset from GMT's memory management, if possible.
+
+        Only a dataset with a single segment and no trailing text is detached, and only
+        if its columns are owned by GMT, i.e., they are not user memory passed to GMT
+        by reference.
+
+        Parameters
+        ----------
+        dataset
+            The pointer to the ``GMT_DATASET`` data container.
+
+        Returns
+        -------
+        detached
+            Whether the columns have been detached and can be adopted.
+        """
+        container = dataset.contents  # type: ignore[attr-defined]
+        if not _can_adopt() or container.n_segments != 1:
+            return False
+        seg = container._segments()[0]
+        addresses = [
+            ctp.cast(data, ctp.c_void_p).value
+            for data in seg.data[: container.n_columns]
+        ]
+        if (
+            seg.text
+            or not all(addresses)
+            or not self._referenced_buffers.isdisjoint(addresses)
+        ):
+            return False
+        self._detach_data("GMT_IS_DATASET", dataset)
+        return True
+
     def virtualfile_to_dataset(
         self,
         vfname: str,
-        output_type: Literal["pandas", "numpy", "file", "strings"] = "pandas",
+        output_type: Literal[
+            "pandas", "numpy", "file", "strings", "segments", "arrow", "polars"
+        ] = "pandas",
         header: int | None = None,
         column_names: list[str] | None = None,
         dtype: type | dict[str, type] | None = None,
         index_col: str | int | None = None,
-    ) -> pd.DataFrame | np.ndarray | None:
+        segment_ids: bool = False,
+    ) -> pd.DataFrame | np.ndarray | _Segments | None:
         """
         Output a tabular dataset stored in a virtual file to a different format.
 
@@ -2082,6 +2636,14 @@ class Session:
             - ``"numpy"`` will return a :class:`numpy.ndarray` object.
             - ``"file"`` means the result was saved to a file and will return ``None``.
             - ``"strings"`` will return the trailing text only as an array of strings.
+            - ``"segments"`` will return a named tuple with the rows of all segments
+              as a :class:`pandas.DataFrame` (``data``), the row offsets of the
+              segments (``offsets``) and the segment headers (``headers``). The rows of
+              segment ``i`` are ``data.iloc[offsets[i] : offsets[i + 1]]``.
+            - ``"arrow"`` will return a :class:`pyarrow.Table` object. A single segment
+              without trailing text is handed over without copying.
+            - ``"polars"`` will return a :class:`polars.DataFrame` object, built on top
+              of the ``"arrow"`` output.
         header
             Row number containing column names for the :class:`pandas.DataFrame` output.
             ``header=None`` means not to parse the column names from table header.
@@ -2093,6 +2655,9 @@ class Session:
             single type for all columns or a dictionary mapping column names to types.
         index_col
             Column to set as the index of the :class:`pandas.DataFrame` output.
+        segment_ids
+            If ``True``, add a ``"segment_id"`` column with the index of the segment
+            that each row belongs to to the :class:`pandas.DataFrame` output.
 
         Returns
         -------
@@ -2187,13 +2752,30 @@ class Session:
             return None
 
         # Read the virtual file as a _GMT_DATASET object
-        result = self.read_virtualfile(vfname, kind="dataset").contents
+        dataset = self.read_virtualfile(vfname, kind="dataset")
+        result = dataset.contents
 
         if output_type == "strings":  # strings output
             return result.to_strings()
+        if output_type == "segments":  # Flat columns plus segment offsets and headers
+            return result.to_segments(
+                header=header, column_names=column_names, dtype=dtype
+            )
+        if output_type in {"arrow", "polars"}:  # Arrow-based outputs
+            to_table = result.to_arrow if output_type == "arrow" else result.to_polars
+            return to_table(
+                header=header,
+                column_names=column_names,
+                dtype=dtype,
+                own_data=self._detach_columns(dataset),
+            )
 
         result = result.to_pandas(
-            header=header, column_names=column_names, dtype=dtype, index_col=index_col
+            header=header,
+            column_names=column_names,
+            dtype=dtype,
+            index_col=index_col,
+            segment_ids=segment_ids,
         )
         if output_type == "numpy":  # numpy.ndarray output
             return result.to_numpy()
@@ -2204,6 +2786,7 @@ class Session:
         vfname: str,
         kind: Literal["grid", "image", "cube", None] = "grid",
         outgrid: str | None = None,
+        dtype: DTypeLike | None = None,
     ) -> xr.DataArray | None:
         """
         Output raster data stored in a virtual file to an :class:`xarray.DataArray`
@@ -2222,6 +2805,11 @@ class Session:
         outgrid
             Name of the output grid/image/cube. If specified, it means the raster data
             was already saved into an actual file and will return ``None``.
+        dtype
+            The dtype of the output grid. Only used for grids. GMT grids are always
+            float32 and are returned without a copy if ``dtype`` is ``None`` or
+            float32. Otherwise, the grid is converted in a single copy (see
+            ``_GMT_GRID.to_xarray``).
 
         Returns
         -------
@@ -2261,7 +2849,17 @@ class Session:
                 self["GMT_IS_IMAGE"]: "image",
                 self["GMT_IS_CUBE"]: "cube",
             }[family]
-        return self.read_virtualfile(vfname, kind=kind).contents.to_xarray()
+        raster = self.read_virtualfile(vfname, kind=kind)
+        container = raster.contents
+        kwargs = {"dtype": dtype} if kind == "grid" else {}
+        if kind == "grid" or (kind == "image" and container._is_band_first()):
+            # Hand over the grid/image data to the DataArray to avoid copying it, unless
+            # it's a buffer that GMT doesn't own.
+            address = ctp.cast(container.data, ctp.c_void_p).value
+            if _can_adopt() and address and address not in self._referenced_buffers:
+                self._detach_data(f"GMT_IS_{kind.upper()}", raster)
+                return container.to_xarray(own_data=True, **kwargs)
+        return container.to_xarray(**kwargs)
 
     def extract_region(self) -> np.ndarray:
         """
@@ -2324,3 +2922,150 @@ class Session:
             msg = "Failed to extract region from current figure."
             raise GMTCLibError(msg)
         return region
+
+
+class _SessionPool:
+    """
+    A thread-safe pool of already created GMT API sessions.
+
+    Sessions are created on demand, up to ``size`` sessions. If all of them are in use,
+    :meth:`acquire` returns ``None`` and the caller should create a regular session.
+
+    Parameters
+    ----------
+    size
+        The maximum number of sessions kept in the pool.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: list[Session] = []
+        self._nsessions = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def acquire(self) -> Session | None:
+        """
+        Get an idle session from the pool, creating a new one if allowed.
+
+        Idle sessions that were created with a different ``GMT_SESSION_NOHISTORY``
+        setting than required now (e.g., before the global modern mode session was
+        started) are destroyed instead of being reused.
+
+        Returns
+        -------
+        session
+            A session with an open GMT API session or ``None`` if the pool is exhausted.
+        """
+        nohistory = _use_nohistory()
+        with self._lock:
+            stale = [s for s in self._idle if s._nohistory != nohistory]
+            self._idle = [s for s in self._idle if s._nohistory == nohistory]
+            self._nsessions -= len(stale)
+            session = self._idle.pop() if self._idle else None
+            create = (
+                session is None and not self._closed and self._nsessions < self.size
+            )
+            if create:
+                self._nsessions += 1
+        for stale_session in stale:
+            stale_session.destroy()
+        if not create:
+            return session
+        session = Session()
+        try:
+            session.create("pygmt-session")
+        except GMTCLibError:
+            with self._lock:
+                self._nsessions -= 1
+            raise
+        session._pool = self
+        return session
+
+    def release(self, session: Session, discard: bool = False) -> None:
+        """
+        Return a session to the pool.
+
+        Parameters
+        ----------
+        session
+            The session handed out by :meth:`acquire`.
+        discard
+            If ``True`` or if the pool is closed, destroy the session instead.
+        """
+        with self._lock:
+            if not (discard or self._closed):
+                self._idle.append(session)
+                return
+            self._nsessions -= 1
+        session.destroy()
+
+    def close(self) -> None:
+        """
+        Destroy all idle sessions. Sessions in use are destroyed when released.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._nsessions -= len(idle)
+        for session in idle:
+            session.destroy()
+
+
+@contextlib.contextmanager
+def session_pool(size: int = 4) -> Generator[None, None, None]:
+    """
+    Reuse GMT API sessions within a ``with`` block.
+
+    Creating and destroying a GMT API session (``GMT_Create_Session`` and
+    ``GMT_Destroy_Session``) for every call of a PyGMT function can dominate the run
+    time when calling functions on small inputs many times, e.g., in a loop. Within this
+    context manager, :class:`pygmt.clib.Session` objects borrow already created sessions
+    from a pool and give them back when exiting their ``with`` block, so that all PyGMT
+    functions reuse the sessions transparently.
+
+    The messages logged by GMT, the data containers created in a borrowed session and
+    the outputs read from it are cleared before it is reused. A session is destroyed
+    instead of being reused if an exception was raised while it was borrowed, or if its
+    state was changed in a way that can't be reset (e.g., by passing datetime input,
+    which sets the type of the input columns to absolute time, or by changing the GMT
+    defaults). Sessions created before the global modern mode session was started (by
+    the first :class:`pygmt.Figure`) are not reused after it, since they don't use the
+    history of the modern mode session (e.g., the last used ``region`` and
+    ``projection``). Note that GMT reads its configuration only when creating a session,
+    so changes to the GMT defaults (e.g., by :class:`pygmt.config`) made inside the
+    ``with`` block may not be seen by pooled sessions.
+
+    Parameters
+    ----------
+    size
+        The maximum number of sessions kept in the pool. Once all of them are in use
+        (e.g., by nested or concurrent calls), new sessions are created and destroyed as
+        usual.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pygmt
+    >>> from pygmt.clib import Session, session_pool
+    >>> with session_pool(size=2):
+    ...     with Session() as lib:
+    ...         pointer = lib.session_pointer
+    ...     with Session() as lib:
+    ...         reused = lib.session_pointer == pointer
+    ...     results = [pygmt.info(np.arange(i + 2)) for i in range(3)]
+    >>> reused
+    True
+    >>> print(results[0].strip())
+    <vector memory>: N = 2 <0/1>
+    """
+    global _SESSION_POOL
+
+    if size < 1:
+        raise GMTValueError(size, description="pool size", reason="Must be positive.")
+    previous, _SESSION_POOL = _SESSION_POOL, _SessionPool(size=size)
+    try:
+        yield
+    finally:
+        pool, _SESSION_POOL = _SESSION_POOL, previous
+        pool.close()
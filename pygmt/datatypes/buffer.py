@@ -0,0 +1,73 @@
+"""
+Helpers for handing over memory allocated by GMT to NumPy arrays.
+"""
+
+import ctypes as ctp
+import sys
+import weakref
+
+import numpy as np
+
+# Data buffers allocated by GMT can be freed by the C standard library, except on
+# Windows where GMT uses aligned allocations that need a special deallocator.
+_libc = None if sys.platform == "win32" else ctp.CDLL(None)
+if _libc is not None:
+    _libc.free.argtypes = [ctp.c_void_p]
+    _libc.free.restype = None
+
+
+def _can_adopt() -> bool:
+    """
+    Check if memory allocated by GMT can be adopted by NumPy arrays on this platform.
+    """
+    return _libc is not None
+
+
+class _GMTBuffer:
+    """
+    A memory block allocated by GMT and owned by Python.
+
+    The memory block must have been detached from GMT's memory management, i.e., GMT
+    must no longer free it when destroying the session. The memory block is freed when
+    the object and all the NumPy arrays created from it are garbage collected.
+
+    Parameters
+    ----------
+    pointer
+        The ctypes pointer to the first element of the memory block.
+    shape
+        The shape of the NumPy array to create from the memory block.
+    """
+
+    def __init__(self, pointer, shape: tuple[int, ...]):
+        address = ctp.cast(pointer, ctp.c_void_p).value
+        self.__array_interface__ = {
+            "data": (address, False),
+            "shape": shape,
+            "typestr": np.dtype(pointer._type_).str,
+            "version": 3,
+        }
+        weakref.finalize(self, _libc.free, address)  # type: ignore[union-attr]
+
+
+def adopt_array(pointer, shape: tuple[int, ...]) -> np.ndarray:
+    """
+    Create a NumPy array that takes ownership of a memory block allocated by GMT.
+
+    No data is copied. The memory block is freed once the returned array and all the
+    views into it are garbage collected.
+
+    Parameters
+    ----------
+    pointer
+        The ctypes pointer to the first element of the memory block. The memory block
+        must have been detached from GMT's memory management.
+    shape
+        The shape of the array.
+
+    Returns
+    -------
+    array
+        The NumPy array that wraps the memory block.
+    """
+    return np.asarray(_GMTBuffer(pointer, shape=shape))
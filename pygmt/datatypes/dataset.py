@@ -5,10 +5,27 @@ Wrapper for the GMT_DATASET data type.
 import ctypes as ctp
 import warnings
 from collections.abc import Mapping
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NamedTuple
 
 import numpy as np
 import pandas as pd
+from pygmt.datatypes.buffer import adopt_array
+
+
+class _Segments(NamedTuple):
+    """
+    A multi-segment dataset stored as flat columns plus segment boundaries.
+
+    The rows of segment ``i`` are ``data.iloc[offsets[i] : offsets[i + 1]]``, which is
+    the same layout as ragged arrays in Apache Arrow or Awkward Array.
+    """
+
+    #: All rows of all segments as a single DataFrame.
+    data: pd.DataFrame
+    #: The row offsets of the segments, with a length of the number of segments plus 1.
+    offsets: np.ndarray
+    #: The header of each segment (an empty string if the segment has no header).
+    headers: list[str]
 
 
 class _GMT_DATASEGMENT(ctp.Structure):  # ruff: ignore[invalid-class-name]
@@ -150,15 +167,60 @@ class _GMT_DATASET(ctp.Structure):  # ruff: ignore[invalid-class-name]
         ("hidden", ctp.c_void_p),
     ]
 
-    def to_strings(self) -> np.ndarray[Any, np.dtype[np.str_]]:
+    def _segments(self) -> list[_GMT_DATASEGMENT]:
         """
-        Convert the trailing text column to an array of strings.
+        Get all segments of all tables in a single walk through the dataset.
         """
-        textvector = []
+        segments = []
         for table in self.table[: self.n_tables]:
-            for segment in table.contents.segment[: table.contents.n_segments]:
-                if segment.contents.text:
-                    textvector.extend(segment.contents.text[: segment.contents.n_rows])
+            tbl = table.contents
+            segments.extend(seg.contents for seg in tbl.segment[: tbl.n_segments])
+        return segments
+
+    def _to_columns(self, segments: list[_GMT_DATASEGMENT]) -> np.ndarray:
+        """
+        Concatenate the numeric columns of the segments into a single array.
+
+        The output array is preallocated and the column buffers of each segment are
+        copied into it directly.
+
+        Parameters
+        ----------
+        segments
+            The segments returned by :meth:`_segments`.
+
+        Returns
+        -------
+        columns
+            An array of shape (n_columns, n_records).
+        """
+        n_rows = np.fromiter(
+            (seg.n_rows for seg in segments), dtype=np.int64, count=len(segments)
+        )
+        columns = np.empty((self.n_columns, n_rows.sum()), dtype=np.float64)
+        if columns.size == 0:
+            return columns
+        itemsize = columns.itemsize
+        # Addresses of the first item of each column and each segment in the output.
+        starts = (
+            columns.ctypes.data
+            + np.arange(self.n_columns)[:, np.newaxis] * columns.strides[0]
+            + (np.cumsum(n_rows) - n_rows) * itemsize
+        ).tolist()
+        for iseg, seg in enumerate(segments):
+            nbytes = seg.n_rows * itemsize
+            for icol, data in enumerate(seg.data[: self.n_columns]):
+                ctp.memmove(starts[icol][iseg], data, nbytes)
+        return columns
+
+    def _to_text(self, segments: list[_GMT_DATASEGMENT]) -> list[bytes]:
+        """
+        Concatenate the trailing text of the segments into a list of bytes.
+        """
+        textvector = []
+        for seg in segments:
+            if seg.text:
+                textvector.extend(seg.text[: seg.n_rows])
         if None in textvector:
             # Workaround for upstream GMT bug reported in
             # https://github.com/GenericMappingTools/pygmt/issues/3170.
@@ -170,6 +232,13 @@ class _GMT_DATASET(ctp.Structure):  # ruff: ignore[invalid-class-name]
             )
             warnings.warn(msg, category=RuntimeWarning, stacklevel=1)
             textvector = [item if item is not None else b"" for item in textvector]
+        return textvector
+
+    def to_strings(self) -> np.ndarray[Any, np.dtype[np.str_]]:
+        """
+        Convert the trailing text column to an array of strings.
+        """
+        textvector = self._to_text(self._segments())
         return np.char.decode(textvector) if textvector else np.array([], dtype=np.str_)
 
     def to_pandas(
@@ -178,6 +247,7 @@ class _GMT_DATASET(ctp.Structure):  # ruff: ignore[invalid-class-name]
         column_names: pd.Index | None = None,
         dtype: type | Mapping[Any, type] | None = None,
         index_col: str | int | None = None,
+        segment_ids: bool = False,
     ) -> pd.DataFrame:
         """
         Convert a _GMT_DATASET object to a :class:`pandas.DataFrame` object.
@@ -202,6 +272,9 @@ class _GMT_DATASET(ctp.Structure):  # ruff: ignore[invalid-class-name]
             column names to types.
         index_col
             Column to set as index.
+        segment_ids
+            If ``True``, add a ``"segment_id"`` column with the index of the segment
+            (counting across all tables) that each row belongs to.
 
         Returns
         -------
@@ -244,22 +317,36 @@ class _GMT_DATASET(ctp.Structure):  # ruff: ignore[invalid-class-name]
         >>> df.dtypes["colstr"].name
         'string'
         """
-        vectors = []
+        return self._to_pandas(
+            self._segments(),
+            header=header,
+            column_names=column_names,
+            dtype=dtype,
+            index_col=index_col,
+            segment_ids=segment_ids,
+        )
+
+    def _to_pandas(
+        self,
+        segments: list[_GMT_DATASEGMENT],
+        header: int | None = None,
+        column_names: pd.Index | None = None,
+        dtype: type | Mapping[Any, type] | None = None,
+        index_col: str | int | None = None,
+        segment_ids: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Convert the segments returned by :meth:`_segments` to a DataFrame.
+
+        See :meth:`to_pandas` for the parameters.
+        """
         # Deal with numeric columns
-        for icol in range(self.n_columns):
-            colvector = [
-                np.ctypeslib.as_array(
-                    seg.contents.data[icol], shape=(seg.contents.n_rows,)
-                )
-                for tbl in self.table[: self.n_tables]
-                for seg in tbl.contents.segment[: tbl.contents.n_segments]
-            ]
-            vectors.append(pd.Series(data=np.concatenate(colvector)))
+        vectors: list = list(self._to_columns(segments))
 
         # Deal with trailing text column
-        textvector = self.to_strings()
+        textvector = self._to_text(segments)
         if len(textvector) != 0:
-            vectors.append(pd.Series(data=textvector, dtype=pd.StringDtype()))
+            vectors.append(pd.array(np.char.decode(textvector), dtype=pd.StringDtype()))
 
         if header is not None:
             tbl = self.table[0].contents  # Use the first table!
@@ -270,12 +357,212 @@ class _GMT_DATASET(ctp.Structure):  # ruff: ignore[invalid-class-name]
             # Return an empty DataFrame if no columns are found.
             df = pd.DataFrame(columns=column_names)
         else:
-            # Create a DataFrame object by concatenating multiple columns
-            df = pd.concat(objs=vectors, axis="columns")
+            # Create a DataFrame object from all columns in one go
+            df = pd.DataFrame(dict(enumerate(vectors)), copy=False)
             if column_names is not None:  # Assign column names
                 df.columns = column_names[: df.shape[1]]
+        if segment_ids:
+            n_rows = [seg.n_rows for seg in segments]
+            df["segment_id"] = np.repeat(np.arange(len(segments)), n_rows)
         if dtype is not None:  # Set dtype for the whole dataset or individual columns
             df = df.astype(dtype)
         if index_col is not None:  # Use a specific column as index
             df = df.set_index(index_col)
         return df
+
+    def _column_names(
+        self, n_columns: int, header: int | None, column_names: Any
+    ) -> list[str]:
+        """
+        Get the names of the columns from the table header or the given names.
+
+        See :meth:`to_pandas` for the parameters. Columns are named by their numbers
+        if no names are given.
+        """
+        if header is not None:
+            tbl = self.table[0].contents  # Use the first table!
+            if header < tbl.n_headers:
+                column_names = tbl.header[header].decode().split()
+        if column_names is None:
+            return [str(i) for i in range(n_columns)]
+        return [str(name) for name in list(column_names)[:n_columns]]
+
+    def to_arrow(
+        self,
+        header: int | None = None,
+        column_names: pd.Index | None = None,
+        dtype: type | Mapping[Any, type] | None = None,
+        own_data: bool = False,
+    ):
+        """
+        Convert a _GMT_DATASET object to a :class:`pyarrow.Table` object.
+
+        The same column in all segments of all tables are concatenated with a single
+        copy, and the Arrow arrays are built on top of the concatenated columns without
+        copying again. The trailing text column is converted to a single Arrow string
+        array in one pass.
+
+        Parameters
+        ----------
+        header
+            Row number containing column names. See :meth:`to_pandas`.
+        column_names
+            A list of column names. Columns are named ``"0"``, ``"1"``, etc. if no
+            names are given.
+        dtype
+            Data type. Can be a single type for all columns or a dictionary mapping
+            column names to types.
+        own_data
+            Whether the columns of the dataset have been detached from GMT's memory
+            management (see ``Session._detach_data``). The dataset must have a single
+            segment and no trailing text, and the columns are then handed over to the
+            Arrow arrays without copying.
+
+        Returns
+        -------
+        table
+            A :class:`pyarrow.Table` object.
+
+        Examples
+        --------
+        >>> from pathlib import Path
+        >>> from pygmt.helpers import GMTTempFile
+        >>> from pygmt.clib import Session
+        >>>
+        >>> with GMTTempFile(suffix=".txt") as tmpfile:
+        ...     with Path(tmpfile.name).open(mode="w") as fp:
+        ...         print("# col1 col2 colstr", file=fp)
+        ...         print(">", file=fp)
+        ...         print("1.0 2.0 TEXT1 TEXT23", file=fp)
+        ...         print(">", file=fp)
+        ...         print("3.0 4.0 TEXT4", file=fp)
+        ...     with Session() as lib:
+        ...         with lib.virtualfile_out(kind="dataset") as vouttbl:
+        ...             lib.call_module("read", [tmpfile.name, vouttbl, "-Td"])
+        ...             ds = lib.read_virtualfile(vouttbl, kind="dataset")
+        ...             table = ds.contents.to_arrow(header=0)
+        >>> table.column_names
+        ['col1', 'col2', 'colstr']
+        >>> table.to_pydict()
+        {'col1': [1.0, 3.0], 'col2': [2.0, 4.0], 'colstr': ['TEXT1 TEXT23', 'TEXT4']}
+        """
+        import pyarrow as pa  # ruff: ignore[import-outside-top-level]
+
+        segments = self._segments()
+        if own_data:
+            seg = segments[0]
+            vectors = [
+                adopt_array(data, shape=(seg.n_rows,))
+                for data in seg.data[: self.n_columns]
+            ]
+        else:
+            vectors = list(self._to_columns(segments))
+        arrays = [pa.array(vector) for vector in vectors]
+
+        textvector = self._to_text(segments)
+        if len(textvector) != 0:
+            arrays.append(pa.array(textvector, type=pa.string()))
+
+        names = self._column_names(len(arrays), header, column_names)
+        table = pa.table(arrays, names=names)
+        if dtype is not None:  # Set dtype for the whole dataset or individual columns
+            dtypes = (
+                dtype if isinstance(dtype, Mapping) else dict.fromkeys(names, dtype)
+            )
+            for name, _dtype in dtypes.items():
+                index = table.schema.get_field_index(str(name))
+                column = table.column(index).cast(pa.from_numpy_dtype(_dtype))
+                table = table.set_column(index, str(name), column)
+        return table
+
+    def to_polars(
+        self,
+        header: int | None = None,
+        column_names: pd.Index | None = None,
+        dtype: type | Mapping[Any, type] | None = None,
+        own_data: bool = False,
+    ):
+        """
+        Convert a _GMT_DATASET object to a :class:`polars.DataFrame` object.
+
+        The DataFrame is built on top of the output of :meth:`to_arrow` without copying
+        the numeric columns. See :meth:`to_arrow` for the parameters.
+
+        Returns
+        -------
+        df
+            A :class:`polars.DataFrame` object.
+        """
+        import polars as pl  # ruff: ignore[import-outside-top-level]
+
+        return pl.from_arrow(
+            self.to_arrow(
+                header=header, column_names=column_names, dtype=dtype, own_data=own_data
+            )
+        )
+
+    def to_segments(
+        self,
+        header: int | None = None,
+        column_names: pd.Index | None = None,
+        dtype: type | Mapping[Any, type] | None = None,
+    ) -> _Segments:
+        """
+        Convert a _GMT_DATASET object to flat columns plus segment offsets and headers.
+
+        Unlike :meth:`to_pandas`, the boundaries and headers of the segments are kept,
+        so that the rows of each segment can be accessed without splitting the data
+        again. All segments are converted in a single pass.
+
+        Parameters
+        ----------
+        header
+            Row number containing column names. See :meth:`to_pandas`.
+        column_names
+            A list of column names.
+        dtype
+            Data type. Can be a single type for all columns or a dictionary mapping
+            column names to types.
+
+        Returns
+        -------
+        segments
+            A named tuple with the ``data``, ``offsets`` and ``headers`` of the
+            segments.
+
+        Examples
+        --------
+        >>> from pathlib import Path
+        >>> from pygmt.helpers import GMTTempFile
+        >>> from pygmt.clib import Session
+        >>>
+        >>> with GMTTempFile(suffix=".txt") as tmpfile:
+        ...     with Path(tmpfile.name).open(mode="w") as fp:
+        ...         print("> -Z1", file=fp)
+        ...         print("1.0 2.0", file=fp)
+        ...         print("3.0 4.0", file=fp)
+        ...         print("> -Z2", file=fp)
+        ...         print("5.0 6.0", file=fp)
+        ...     with Session() as lib:
+        ...         with lib.virtualfile_out(kind="dataset") as vouttbl:
+        ...             lib.call_module("read", [tmpfile.name, vouttbl, "-Td"])
+        ...             ds = lib.read_virtualfile(vouttbl, kind="dataset")
+        ...             segments = ds.contents.to_segments(column_names=["x", "y"])
+        >>> segments.data
+             x    y
+        0  1.0  2.0
+        1  3.0  4.0
+        2  5.0  6.0
+        >>> segments.offsets
+        array([0, 2, 3])
+        >>> segments.headers
+        ['-Z1', '-Z2']
+        """
+        segments = self._segments()
+        data = self._to_pandas(
+            segments, header=header, column_names=column_names, dtype=dtype
+        )
+        offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+        np.cumsum([seg.n_rows for seg in segments], out=offsets[1:])
+        headers = [seg.header.decode() if seg.header else "" for seg in segments]
+        return _Segments(data=data, offsets=offsets, headers=headers)
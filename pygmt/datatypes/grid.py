@@ -7,7 +7,10 @@ from typing import ClassVar
 
 import numpy as np
 import xarray as xr
+from pygmt._typing import DTypeLike
+from pygmt.datatypes.buffer import adopt_array
 from pygmt.datatypes.header import _GMT_GRID_HEADER, gmt_grdfloat
+from pygmt.exceptions import GMTValueError
 
 
 class _GMT_GRID(ctp.Structure):  # ruff: ignore[invalid-class-name]
@@ -95,10 +98,27 @@ class _GMT_GRID(ctp.Structure):  # ruff: ignore[invalid-class-name]
         ("hidden", ctp.c_void_p),
     ]
 
-    def to_xarray(self) -> xr.DataArray:
+    def to_xarray(
+        self, own_data: bool = False, dtype: DTypeLike | None = None
+    ) -> xr.DataArray:
         """
         Convert a _GMT_GRID object to a :class:`xarray.DataArray` object.
 
+        Parameters
+        ----------
+        own_data
+            If ``True``, the returned object takes ownership of the grid data buffer and
+            wraps it without copying. The data buffer must have been detached from GMT's
+            memory management (see ``Session._detach_data``). Otherwise, only the grid
+            without paddings is copied.
+        dtype
+            The dtype of the grid data. GMT grids are always float32. If ``None`` or
+            float32, the data are kept as is. Otherwise, the grid without paddings is
+            converted to the dtype in a single copy, which also replaces the copy made
+            if ``own_data`` is ``False``. Values are rounded to the nearest integer for
+            integer dtypes, and a :class:`pygmt.exceptions.GMTValueError` is raised if
+            the grid has NaN nodes or values out of the range of the integer dtype.
+
         Returns
         -------
         dataarray
@@ -178,9 +198,17 @@ class _GMT_GRID(ctp.Structure):  # ruff: ignore[invalid-class-name]
         coords = [(dims[0], y, dim_attrs[0]), (dims[1], x, dim_attrs[1])]
 
         # The data array without paddings
-        data = np.ctypeslib.as_array(self.data, shape=(header.my, header.mx)).copy()
+        shape = (header.my, header.mx)
+        if own_data:
+            data = adopt_array(self.data, shape=shape)
+        else:
+            data = np.ctypeslib.as_array(self.data, shape=shape)
         pad = header.pad[:]
         data = data[pad[2] : header.my - pad[3], pad[0] : header.mx - pad[1]]
+        if dtype is not None and np.dtype(dtype) != data.dtype:
+            data = _grid_astype(data, dtype=np.dtype(dtype), inplace=own_data)
+        elif not own_data:
+            data = data.copy()
 
         # Create the xarray.DataArray object
         grid = xr.DataArray(
@@ -199,3 +227,53 @@ class _GMT_GRID(ctp.Structure):  # ruff: ignore[invalid-class-name]
         grid.gmt.registration = header.registration
         grid.gmt.gtype = header.gtype
         return grid
+
+
+def _grid_astype(data: np.ndarray, dtype: np.dtype, inplace: bool) -> np.ndarray:
+    """
+    Convert the float32 data of a GMT grid to another dtype in a single copy.
+
+    Parameters
+    ----------
+    data
+        The grid data.
+    dtype
+        The dtype to convert to.
+    inplace
+        If ``True``, the values can be rounded in place before converting to an integer
+        dtype. Otherwise, a temporary rounded copy is made.
+
+    Returns
+    -------
+    data
+        The converted grid data.
+
+    Examples
+    --------
+    >>> data = np.array([[-1.5, 0.4], [2.6, 32767.0]], dtype=np.float32)
+    >>> _grid_astype(data, dtype=np.dtype(np.int16), inplace=False)
+    array([[   -2,     0],
+           [    3, 32767]], dtype=int16)
+    >>> _grid_astype(data, dtype=np.dtype(np.float64), inplace=False).dtype
+    dtype('float64')
+    >>> _grid_astype(data, dtype=np.dtype(np.int8), inplace=False)
+    Traceback (most recent call last):
+    ...
+    pygmt.exceptions.GMTValueError: Invalid grid dtype: dtype('int8'). Grid values in the range [-1.5, 32767.0] can't be represented by int8. Fill the NaN nodes (e.g., with grdfill) or choose another dtype.
+    """  # ruff: ignore[doc-line-too-long]
+    if dtype.kind in "iu":
+        # NaN is propagated by min() and max(), so NaN nodes are caught here too.
+        low, high = data.min(), data.max()
+        limits = np.iinfo(dtype)
+        if not (limits.min <= low and high <= limits.max):
+            raise GMTValueError(
+                dtype,
+                description="grid dtype",
+                reason=(
+                    f"Grid values in the range [{low}, {high}] can't be represented by "
+                    f"{dtype}. Fill the NaN nodes (e.g., with grdfill) or choose "
+                    "another dtype."
+                ),
+            )
+        data = np.rint(data, out=data if inplace else None)
+    return data.astype(dtype)
@@ -8,6 +8,7 @@ from typing import ClassVar
 import numpy as np
 import xarray as xr
 from packaging.version import Version
+from pygmt.datatypes.buffer import adopt_array
 from pygmt.datatypes.header import _GMT_GRID_HEADER
 
 # TODO(xarray>=2025.10.1): Remove the __doctest_skip__ on _GMT_IMAGE.to_xarray
@@ -102,10 +103,34 @@ class _GMT_IMAGE(ctp.Structure):  # ruff: ignore[invalid-class-name]
         ("hidden", ctp.c_void_p),
     ]
 
-    def to_xarray(self) -> xr.DataArray:
+    def _is_band_first(self) -> bool:
+        """
+        Check if the image is band-interleaved without a separate alpha layer.
+
+        The third character of the memory layout code tells how the bands are stored:
+        band-interleaved (``"B"``, i.e., band, row, column) or pixel-interleaved
+        (``"P"``, i.e., row, column, band).
+        """
+        return self.header.contents.mem_layout[2:3] == b"B" and not self.alpha
+
+    def to_xarray(self, own_data: bool = False) -> xr.DataArray:
         """
         Convert a _GMT_IMAGE object to an :class:`xarray.DataArray` object.
 
+        The image is returned with the band dimension first, and any separate
+        transparency (alpha) layer is added as the last band. The data is copied into a
+        C-contiguous array in a single pass.
+
+        Parameters
+        ----------
+        own_data
+            If ``True``, the returned object takes ownership of the image data buffer
+            and wraps it without copying if the image has no paddings. Only allowed for
+            band-interleaved images without an alpha layer, and the data buffer must
+            have been detached from GMT's memory management (see
+            ``Session._detach_data``). A padded image is copied once into a C-contiguous
+            array without paddings. Otherwise, the image without paddings is copied.
+
         Returns
         -------
         dataarray
@@ -177,14 +202,7 @@ class _GMT_IMAGE(ctp.Structure):  # ruff: ignore[invalid-class-name]
         """
         # The image header
         header = self.header.contents
-
-        if header.n_bands != 3:
-            msg = (
-                f"The raster image has {header.n_bands} band(s). "
-                "Currently only 3-band images are supported. "
-                "Please consider submitting a feature request to us. "
-            )
-            raise NotImplementedError(msg)
+        n_bands, has_alpha = header.n_bands, bool(self.alpha)
 
         # Get dimensions and their attributes from the header.
         dims, dim_attrs = header.dims, header.dim_attrs
@@ -192,25 +210,46 @@ class _GMT_IMAGE(ctp.Structure):  # ruff: ignore[invalid-class-name]
         x = np.ctypeslib.as_array(self.x, shape=(header.n_columns,)).copy()
         y = np.ctypeslib.as_array(self.y, shape=(header.n_rows,)).copy()
         coords = [
+            ("band", np.arange(1, n_bands + has_alpha + 1, dtype=np.uint8), None),
             (dims[0], y, dim_attrs[0]),
             (dims[1], x, dim_attrs[1]),
-            ("band", np.array([1, 2, 3], dtype=np.uint8), None),
         ]
 
-        # Get DataArray without padding
-        data = np.ctypeslib.as_array(
-            self.data, shape=(header.my, header.mx, header.n_bands)
-        ).copy()
+        # Views of the bands and the alpha layer without paddings.
         pad = header.pad[:]
-        data = data[pad[2] : header.my - pad[3], pad[0] : header.mx - pad[1], :]
+        rows, columns = (
+            slice(pad[2], header.my - pad[3]),
+            slice(pad[0], header.mx - pad[1]),
+        )
+        band_interleaved = header.mem_layout[2:3] == b"B"
+        shape = (
+            (n_bands, header.my, header.mx)
+            if band_interleaved
+            else (header.my, header.mx, n_bands)
+        )
+        if own_data and self._is_band_first():
+            # Already band-first, so the bands are wrapped without copying, unless the
+            # paddings have to be removed to get a C-contiguous array.
+            bands = adopt_array(self.data, shape=shape)[:, rows, columns]
+            data = np.ascontiguousarray(bands)
+        else:
+            bands = np.ctypeslib.as_array(self.data, shape=shape)
+            bands = (
+                bands[:, rows, columns]
+                if band_interleaved
+                else bands[rows, columns, :].transpose(2, 0, 1)
+            )
+            # Copy the bands into a C-contiguous band-first array in a single pass.
+            data = np.empty((n_bands + has_alpha, *bands.shape[1:]), dtype=np.uint8)
+            data[:n_bands] = bands
+            if has_alpha:
+                alpha = np.ctypeslib.as_array(self.alpha, shape=(header.my, header.mx))
+                data[n_bands] = alpha[rows, columns]
 
         # Create the xarray.DataArray object
         image = xr.DataArray(
-            data=data,
-            coords=coords,
-            name=header.name,
-            attrs=header.data_attrs,
-        ).transpose("band", dims[0], dims[1])
+            data=data, coords=coords, name=header.name, attrs=header.data_attrs
+        )
 
         # Set GMT accessors.
         # Must put at the end, otherwise info gets lost after certain image operations.
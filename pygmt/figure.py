@@ -3,7 +3,10 @@ Define the Figure class that handles all plotting.
 """
 
 import base64
+import contextlib
+import functools
 import os
+from collections.abc import Callable
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from typing import Literal, overload
@@ -57,6 +60,7 @@ import numpy as np
 from pygmt.clib import Session
 from pygmt.exceptions import GMTValueError
 from pygmt.helpers import launch_external_viewer, unique_name
+from pygmt.session_management import _begin_global_session
 
 
 def _get_default_display_method() -> Literal["external", "notebook", "none"]:
@@ -102,6 +106,39 @@ SHOW_CONFIG = {
 }
 
 
+def _modifies_figure(method: Callable) -> Callable:
+    """
+    Make a plotting method bump the revision of the figure, so that the cached previews
+    of the figure are rendered again.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._revision += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+def _modifies_figure_context(method: Callable) -> Callable:
+    """
+    Make a plotting method that returns a context manager bump the revision of the
+    figure when the context is entered and exited.
+    """
+
+    @functools.wraps(method)
+    @contextlib.contextmanager
+    def wrapper(self, *args, **kwargs):
+        self._revision += 1
+        try:
+            with method(self, *args, **kwargs) as value:
+                yield value
+        finally:
+            self._revision += 1
+
+    return wrapper
+
+
 class Figure:
     """
     A GMT figure to handle all plotting.
@@ -134,8 +171,13 @@ class Figure:
     """
 
     def __init__(self) -> None:
+        _begin_global_session()
         self._name = unique_name()
         self._preview_dir = TemporaryDirectory(prefix=f"{self._name}-preview-")
+        # The revision is bumped by every plotting method. Previews are rendered once
+        # per revision and format/resolution/options, and cached in _preview_dir.
+        self._revision = 0
+        self._previews: dict[tuple, Path] = {}
         self._activate_figure()
 
     def __del__(self) -> None:
@@ -401,6 +443,11 @@ class Figure:
         """
         Grab a preview of the figure.
 
+        The preview is rendered only once for each revision of the figure, i.e., until a
+        plotting method is called again, and the same format, resolution and options.
+        Changes made to the figure by calling GMT modules directly (e.g., through
+        :meth:`pygmt.clib.Session.call_module`) are not tracked.
+
         Parameters
         ----------
         fmt
@@ -418,8 +465,16 @@ class Figure:
             If ``as_bytes = False``, this is the file name of the preview image file.
             Otherwise, it is the file content loaded as a bytes object.
         """
-        fname = Path(self._preview_dir.name) / f"{self._name}.{fmt}"
-        self.savefig(fname, dpi=dpi, **kwargs)
+        key = (self._revision, fmt, dpi, repr(sorted(kwargs.items())))
+        if (fname := self._previews.get(key)) is None:
+            # Remove the previews of earlier revisions of the figure.
+            for oldkey in [k for k in self._previews if k[0] != self._revision]:
+                self._previews.pop(oldkey).unlink(missing_ok=True)
+            fname = Path(self._preview_dir.name) / (
+                f"{self._name}-{self._revision}-{len(self._previews)}.{fmt}"
+            )
+            self.savefig(fname, dpi=dpi, **kwargs)
+            self._previews[key] = fname
         if as_bytes:
             return fname.read_bytes()
         return fname
@@ -444,43 +499,66 @@ class Figure:
         html = '<img src="data:image/png;base64,{image}" width="{width}px">'
         return html.format(image=base64_png.decode("utf-8"), width=500)
 
-    # Attach plotting functions implemented in pygmt/src as Figure methods.
-    basemap = _basemap
-    choropleth = _choropleth
-    coast = _coast
-    colorbar = _colorbar
-    contour = _contour
-    directional_rose = _directional_rose
-    fill_between = _fill_between
-    grdcontour = _grdcontour
-    grdimage = _grdimage
-    grdview = _grdview
-    histogram = _histogram
-    hlines = _hlines
-    image = _image
-    inset = _inset
-    legend = _legend
-    logo = _logo
-    magnetic_rose = _magnetic_rose
-    meca = _meca
-    paragraph = _paragraph
-    plot = _plot
-    plot3d = _plot3d
+    def _repr_mimebundle_(self, include=None, exclude=None) -> tuple[dict, dict]:
+        """
+        Show the PNG and HTML previews, rendered only once.
+
+        IPython calls this method instead of :meth:`_repr_png_` and :meth:`_repr_html_`,
+        which would render the figure at two resolutions. The PNG preview is the
+        high-resolution image of the HTML preview, displayed at the same width.
+        """
+        data = {
+            "text/html": self._repr_html_(),
+            "image/png": self._preview(
+                fmt="png", dpi=300, anti_alias=True, as_bytes=True
+            ),
+        }
+        data = {
+            mimetype: value
+            for mimetype, value in data.items()
+            if (include is None or mimetype in include)
+            and (exclude is None or mimetype not in exclude)
+        }
+        return data, {"image/png": {"width": 500}}
+
+    # Attach plotting functions implemented in pygmt/src as Figure methods. All of them
+    # except psconvert add to the figure and bump its revision.
+    basemap = _modifies_figure(_basemap)
+    choropleth = _modifies_figure(_choropleth)
+    coast = _modifies_figure(_coast)
+    colorbar = _modifies_figure(_colorbar)
+    contour = _modifies_figure(_contour)
+    directional_rose = _modifies_figure(_directional_rose)
+    fill_between = _modifies_figure(_fill_between)
+    grdcontour = _modifies_figure(_grdcontour)
+    grdimage = _modifies_figure(_grdimage)
+    grdview = _modifies_figure(_grdview)
+    histogram = _modifies_figure(_histogram)
+    hlines = _modifies_figure(_hlines)
+    image = _modifies_figure(_image)
+    inset = _modifies_figure_context(_inset)
+    legend = _modifies_figure(_legend)
+    logo = _modifies_figure(_logo)
+    magnetic_rose = _modifies_figure(_magnetic_rose)
+    meca = _modifies_figure(_meca)
+    paragraph = _modifies_figure(_paragraph)
+    plot = _modifies_figure(_plot)
+    plot3d = _modifies_figure(_plot3d)
     psconvert = _psconvert
-    pygmtlogo = _pygmtlogo
-    rose = _rose
-    scalebar = _scalebar
-    set_panel = _set_panel
-    shift_origin = _shift_origin
-    solar = _solar
-    subplot = _subplot
-    ternary = _ternary
-    text = _text
-    tilemap = _tilemap
-    timestamp = _timestamp
-    velo = _velo
-    vlines = _vlines
-    wiggle = _wiggle
+    pygmtlogo = _modifies_figure(_pygmtlogo)
+    rose = _modifies_figure(_rose)
+    scalebar = _modifies_figure(_scalebar)
+    set_panel = _modifies_figure_context(_set_panel)
+    shift_origin = _modifies_figure(_shift_origin)
+    solar = _modifies_figure(_solar)
+    subplot = _modifies_figure_context(_subplot)
+    ternary = _modifies_figure(_ternary)
+    text = _modifies_figure(_text)
+    tilemap = _modifies_figure(_tilemap)
+    timestamp = _modifies_figure(_timestamp)
+    velo = _modifies_figure(_velo)
+    vlines = _modifies_figure(_vlines)
+    wiggle = _modifies_figure(_wiggle)
 
 
 def set_display(method: Literal["external", "notebook", "none", None] = None) -> None:
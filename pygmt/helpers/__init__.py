@@ -11,7 +11,6 @@ from pygmt.helpers.decorators import (
 from pygmt.helpers.tempfile import (
     GMTTempFile,
     tempfile_from_geojson,
-    tempfile_from_image,
     unique_name,
 )
 from pygmt.helpers.utils import (
@@ -23,6 +22,7 @@ from pygmt.helpers.utils import (
     is_given,
     is_nonstr_iter,
     launch_external_viewer,
+    non_ascii_array_to_octal,
     non_ascii_to_octal,
     sequence_join,
 )
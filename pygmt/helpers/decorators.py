@@ -250,6 +250,8 @@ COMMON_DOCSTRINGS = {
 
             - ``pandas`` will return a :class:`pandas.DataFrame` object.
             - ``numpy`` will return a :class:`numpy.ndarray` object.
+            - ``arrow`` will return a :class:`pyarrow.Table` object.
+            - ``polars`` will return a :class:`polars.DataFrame` object.
             - ``file`` will save the result to the file specified by the ``outfile``
               parameter.""",
     "outgrid": """
@@ -258,6 +260,18 @@ COMMON_DOCSTRINGS = {
             :class:`xarray.DataArray` object. For writing a specific grid file format or
             applying basic data operations to the output grid, see
             :gmt-docs:`gmt.html#grd-inout-full` for the available modifiers.""",
+    "out_dtype": """
+        out_dtype
+            The dtype of the output :class:`xarray.DataArray` object. GMT grids are
+            always float32, so the output grid is float32 by default. If ``None`` or
+            float32, the grid data allocated by GMT are returned without a copy (peak
+            memory of one float32 grid). For other dtypes (e.g., ``"int16"``), the
+            grid is converted in a single copy (peak memory of one float32 grid plus
+            one grid of the requested dtype), and values are rounded for integer
+            dtypes. Grids with NaN nodes or values out of the range can't be converted
+            to integer dtypes. Input grids are passed to GMT in their own dtype, and
+            GMT makes its own float32 copy with paddings for the computation. Ignored
+            if ``outgrid`` is set.""",
     "panel": r"""
         panel
             Select a specific subplot panel. Only allowed when used in
@@ -2,7 +2,9 @@
 Utilities and common tasks for wrapping the GMT modules.
 """
 
+import functools
 import io
+import mmap
 import os
 import shutil
 import string
@@ -183,7 +185,8 @@ def _is_printable_ascii(argstr: str) -> bool:
     >>> _is_printable_ascii("12AB±β①②")
     False
     """
-    return all(32 <= ord(c) <= 126 for c in argstr)
+    # For ASCII strings, str.isprintable() is True only for characters 32 to 126.
+    return argstr.isascii() and argstr.isprintable()
 
 
 def _contains_apostrophe_or_backtick(argstr: str) -> bool:
@@ -221,6 +224,40 @@ def _contains_apostrophe_or_backtick(argstr: str) -> bool:
     return "'" in argstr or "`" in argstr
 
 
+@functools.cache
+def _charset_chars(encoding: Encoding) -> frozenset[str]:
+    """
+    Get the characters that can be typeset with a charset encoding.
+
+    Characters in the Adobe Symbol and ZapfDingbats encodings are included because
+    they're independent on the choice of encodings. The result is cached per encoding.
+
+    Parameters
+    ----------
+    encoding
+        The charset encoding.
+
+    Returns
+    -------
+    chars
+        The set of characters.
+
+    Examples
+    --------
+    >>> "β" in _charset_chars("ISO-8859-4") and "ā" in _charset_chars("ISO-8859-4")
+    True
+    >>> "ā" in _charset_chars("ISOLatin1+")
+    False
+    """
+    return frozenset(
+        [
+            *charset["Symbol"].values(),
+            *charset["ZapfDingbats"].values(),
+            *charset[encoding].values(),
+        ]
+    )
+
+
 def _check_encoding(argstr: str) -> Encoding:
     """
     Check the charset encoding of a string.
@@ -261,12 +298,9 @@ def _check_encoding(argstr: str) -> Encoding:
     # are in the charset of the encoding. If all characters are in the charset, return
     # the encoding. The ISOLatin1+ encoding is checked first because it is the default
     # and most common encoding.
-    adobe_chars = set(charset["Symbol"].values()) | set(
-        charset["ZapfDingbats"].values()
-    )
+    chars = set(argstr)
     for encoding in ["ISOLatin1+"] + [f"ISO-8859-{i}" for i in range(1, 17) if i != 12]:
-        chars = set(charset[encoding].values()) | adobe_chars
-        if all(c in chars for c in argstr):
+        if chars <= _charset_chars(encoding):  # type: ignore[arg-type]
             return encoding  # type: ignore[return-value]
     # Return the "ISOLatin1+" encoding if the string contains characters from multiple
     # charset encodings or contains characters that are not in any charset encoding.
@@ -294,7 +328,8 @@ def data_kind(
       (e.g., geopandas.GeoDataFrame or shapely.geometry)
     - ``"grid"``: a :class:`xarray.DataArray` object that is not 3-D
     - ``"image"``: a 3-D :class:`xarray.DataArray` object
-    - ``"stringio"``: a :class:`io.StringIO` object
+    - ``"stringio"``: a :class:`io.StringIO`, :class:`io.BytesIO` or
+      :class:`mmap.mmap` object
     - ``"matrix"``: a 2-D array-like object that implements ``__array_interface__``
       (e.g., :class:`numpy.ndarray`)
     - ``"vectors"``: any unrecognized data. Common data types include, a
@@ -361,6 +396,8 @@ def data_kind(
 
     >>> data_kind(data=io.StringIO("TEXT1\nTEXT23\n"))
     'stringio'
+    >>> data_kind(data=io.BytesIO(b"TEXT1\nTEXT23\n"))
+    'stringio'
 
     The "matrix" kind:
 
@@ -395,7 +432,7 @@ def data_kind(
             isinstance(_file, str | os.PathLike) for _file in data
         ):  # A list/tuple of files.
             kind = "file"
-        case io.StringIO():
+        case io.StringIO() | io.BytesIO() | mmap.mmap():
             kind = "stringio"
         case (bool() | int() | float()) | None if not required:
             # An option argument, mainly for dealing with optional virtual files.
@@ -459,7 +496,67 @@ def non_ascii_to_octal(argstr: str, encoding: Encoding = "ISOLatin1+") -> str:
         _is_printable_ascii(argstr) and not _contains_apostrophe_or_backtick(argstr)
     ):
         return argstr
+    return argstr.translate(_octal_translation_table(encoding))
+
+
+def non_ascii_array_to_octal(
+    texts: np.ndarray, encoding: Encoding = "ISOLatin1+"
+) -> np.ndarray:
+    r"""
+    Translate non-ASCII characters in an array of strings to their octal codes.
+
+    It's the same as calling :func:`non_ascii_to_octal` on each string, but all the
+    strings are translated in bulk with a single call to ``str.translate``.
+
+    Parameters
+    ----------
+    texts
+        The array of strings to be translated.
+    encoding
+        The encoding of characters in the strings, usually detected by
+        ``_check_encoding`` on all the strings joined together.
+
+    Returns
+    -------
+    translated_texts
+        The array of translated strings, with the same shape as the input array.
+
+    Examples
+    --------
+    >>> non_ascii_array_to_octal(np.array([["ABC ±120°", "α"], ["♥", "DEF"]]))
+    array([['ABC \\261120\\260', '@~\\141@~'],
+           ['@%34%\\252@%%', 'DEF']], dtype='<U16')
+    """  # ruff: ignore[ambiguous-unicode-character-docstring]
+    texts = np.asarray(texts, dtype=np.str_)
+    if encoding == "ascii" or texts.size == 0:
+        return texts
+    table = _octal_translation_table(encoding)
+    strings = texts.ravel().tolist()
+    # Newline characters are never translated, so the strings can be joined with a
+    # newline, translated at once and split again, unless a string has a newline.
+    translated = "\n".join(strings).translate(table).split("\n")
+    if len(translated) != len(strings):
+        translated = [text.translate(table) for text in strings]
+    return np.asarray(translated, dtype=np.str_).reshape(texts.shape)
+
+
+@functools.cache
+def _octal_translation_table(encoding: Encoding) -> dict[int, str]:
+    """
+    Build the table to translate non-ASCII characters to octal codes.
 
+    The table is built once per encoding and cached for later calls.
+
+    Parameters
+    ----------
+    encoding
+        The encoding of characters, except ``"ascii"``.
+
+    Returns
+    -------
+    table
+        The translation table to be passed to ``str.translate``.
+    """
     # Dictionary mapping non-ASCII characters to octal codes
     mapping: dict = {}
     # Adobe Symbol charset.
@@ -478,7 +575,7 @@ def non_ascii_to_octal(argstr: str, encoding: Encoding = "ISOLatin1+") -> str:
         # Map apostrophe (') and backtick (`) to correct octal codes.
         # See _contains_apostrophe_or_backtick() for explanations.
         mapping.update({"'": "\\234", "`": "\\221"})
-    return argstr.translate(str.maketrans(mapping))
+    return str.maketrans(mapping)
 
 
 def build_arg_list(  # ruff: ignore[too-many-branches]
@@ -10,8 +10,10 @@ from pygmt.exceptions import GMTParameterError, GMTValueError
 
 
 def validate_output_table_type(
-    output_type: Literal["pandas", "numpy", "file"], outfile: PathLike | None = None
-) -> Literal["pandas", "numpy", "file"]:
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars", "segments"],
+    outfile: PathLike | None = None,
+    segments: bool = False,
+) -> Literal["pandas", "numpy", "file", "arrow", "polars", "segments"]:
     """
     Check if the ``output_type`` and ``outfile`` parameters are valid.
 
@@ -19,10 +21,14 @@ def validate_output_table_type(
     ----------
     output_type
         Desired output type of tabular data. Valid values are ``"pandas"``, ``"numpy"``,
-        and ``"file"``.
+        ``"file"``, ``"arrow"``, and ``"polars"``, plus ``"segments"`` if
+        ``segments=True``.
     outfile
         File name for saving the result data. Required if ``output_type`` is ``"file"``.
         If specified, ``output_type`` will be forced to be ``"file"``.
+    segments
+        Whether ``"segments"`` is a valid output type, i.e., whether the output can
+        contain multiple segments that are worth keeping apart.
 
     Returns
     -------
@@ -34,8 +40,12 @@ def validate_output_table_type(
     'pandas'
     >>> validate_output_table_type(output_type="numpy")
     'numpy'
+    >>> validate_output_table_type(output_type="arrow")
+    'arrow'
     >>> validate_output_table_type(output_type="file", outfile="output-fname.txt")
     'file'
+    >>> validate_output_table_type(output_type="segments", segments=True)
+    'segments'
     >>> validate_output_table_type(output_type="invalid-type")
     Traceback (most recent call last):
         ...
@@ -49,7 +59,9 @@ def validate_output_table_type(
     ...     assert len(w) == 1
     'file'
     """
-    _valids = {"file", "numpy", "pandas"}
+    _valids = {"file", "numpy", "pandas", "arrow", "polars"}
+    if segments:
+        _valids.add("segments")
     if output_type not in _valids:
         raise GMTValueError(
             output_type,
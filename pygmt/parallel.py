@@ -0,0 +1,248 @@
+"""
+Run PyGMT functions in parallel threads or processes.
+"""
+
+import multiprocessing
+import multiprocessing.util
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from pygmt._typing import PathLike
+from pygmt.clib.session import _THREAD_STATE, Session
+from pygmt.exceptions import GMTTypeError, GMTValueError
+from pygmt.helpers import unique_name
+
+# Number of figures rendered by a worker process of render_many before it's replaced by
+# a new process, so that the figures kept in its session directory don't pile up.
+_MAX_FIGURES_PER_WORKER = 100
+
+# State of a worker process of render_many, set by _init_render_worker.
+_RENDER_WORKER: dict[str, Any] = {}
+
+
+def _init_worker() -> None:
+    """
+    Mark the current thread as a worker thread of :func:`pygmt.parallel.map`.
+    """
+    _THREAD_STATE.worker = True
+
+
+def map(  # ruff: ignore[builtin-variable-shadowing]
+    func: Callable[[Any], Any], iterable: Iterable, max_workers: int | None = None
+) -> list:
+    """
+    Apply a PyGMT processing function to every item of an iterable in parallel threads.
+
+    The GMT modules run in a :class:`concurrent.futures.ThreadPoolExecutor`. Since
+    :mod:`ctypes` releases the Python global interpreter lock while a GMT module is
+    running, the calls run concurrently on multiple CPU cores.
+
+    Each call runs in its own GMT API session, which is never borrowed from a
+    :func:`pygmt.clib.session_pool` of the calling thread. The worker threads don't read
+    or write the history of the global modern mode session (e.g., the last used
+    ``region`` and ``projection``), so each call must be fully specified. Only use
+    functions that process data and return their results (e.g., :func:`pygmt.grdfilter`
+    or :func:`pygmt.blockmean`). Plotting with :class:`pygmt.Figure` or changing the GMT
+    defaults with :class:`pygmt.config` in the worker threads is not supported.
+
+    Concurrent calls are only supported for in-memory inputs and outputs (e.g.,
+    :class:`xarray.DataArray`, :class:`pandas.DataFrame` or :class:`numpy.ndarray`).
+    Reading or writing grid files (e.g., netCDF grids, which use a library that isn't
+    thread-safe) and downloading remote files (e.g., ``"@earth_relief_01d"``) in the
+    worker threads may fail or corrupt data. Load such files before calling this
+    function (e.g., with :func:`pygmt.datasets.load_earth_relief` or
+    :func:`pygmt.load_dataarray`).
+
+    Parameters
+    ----------
+    func
+        The function to call with every item of ``iterable``. Use
+        :func:`functools.partial` or a ``lambda`` to pass other arguments.
+    iterable
+        The items to process.
+    max_workers
+        The maximum number of threads. Defaults to the default of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
+
+    Returns
+    -------
+    results
+        The return values of ``func``, in the same order as the items of ``iterable``.
+        If any call raises an exception, the first one (in the order of the items) is
+        raised here after all the calls are finished.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pygmt
+    >>> results = pygmt.parallel.map(pygmt.info, [np.arange(i + 2) for i in range(3)])
+    >>> print(results[1].strip())
+    <vector memory>: N = 3 <0/2>
+    """
+    if max_workers is not None and max_workers < 1:
+        raise GMTValueError(
+            max_workers, description="number of workers", reason="Must be positive."
+        )
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+        return list(pool.map(func, iterable))
+
+
+def _end_render_worker() -> None:
+    """
+    End the modern mode session of a worker process of :func:`render_many`.
+    """
+    from pygmt.session_management import end  # ruff: ignore[import-outside-top-level]
+
+    if Session._modern_mode:
+        end()
+
+
+def _init_render_worker(build_fn: Callable, fmt: str, kwargs: dict) -> None:
+    """
+    Set up a worker process of :func:`render_many`.
+
+    Gives the worker its own GMT modern mode session, which is started by the first
+    figure and ended when the worker exits.
+    """
+    os.environ["GMT_SESSION_NAME"] = unique_name()
+    _RENDER_WORKER.update(build_fn=build_fn, fmt=fmt, kwargs=kwargs)
+    # Pool workers don't run atexit handlers, but run the multiprocessing finalizers.
+    multiprocessing.util.Finalize(None, _end_render_worker, exitpriority=10)
+
+
+def _render(task: tuple[Any, PathLike | None]) -> str | bytes:
+    """
+    Build a figure for an item and save it, in a worker process of :func:`render_many`.
+    """
+    from pygmt.figure import Figure  # ruff: ignore[import-outside-top-level]
+
+    item, output = task
+    fig = _RENDER_WORKER["build_fn"](item)
+    if not isinstance(fig, Figure):
+        raise GMTTypeError(
+            type(fig), reason="The build function must return a pygmt.Figure object."
+        )
+    if output is not None:
+        fig.savefig(output, **_RENDER_WORKER["kwargs"])
+        return str(output)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fname = Path(tmpdir) / f"{unique_name()}.{_RENDER_WORKER['fmt']}"
+        fig.savefig(fname, **_RENDER_WORKER["kwargs"])
+        return fname.read_bytes()
+
+
+def render_many(
+    build_fn: Callable[[Any], Any],
+    items: Iterable,
+    processes: int | None = None,
+    outputs: Sequence[PathLike] | None = None,
+    fmt: str = "png",
+    **kwargs,
+) -> Iterator[str | bytes]:
+    """
+    Build and save many figures in parallel worker processes.
+
+    A :class:`pygmt.Figure` is built and plotted in the global modern mode session of
+    the Python process, so figures are made one after another within one process. This
+    function builds figures in a pool of worker processes instead. Each worker runs its
+    own GMT modern mode session, with its own session name and session directory, so
+    that the workers don't interfere with each other or with the calling process.
+
+    The workers are started with the ``"spawn"`` method of :mod:`multiprocessing`. So
+    ``build_fn`` and the items must be picklable (e.g., ``build_fn`` must be a function
+    defined at the top level of a module, not a ``lambda``) and scripts using this
+    function must be protected by ``if __name__ == "__main__":``. Each worker process is
+    replaced by a new one after rendering a number of figures, so that the figures kept
+    in its session directory don't pile up.
+
+    Parameters
+    ----------
+    build_fn
+        The function that builds the figure for an item. It's called with an item as
+        the only argument and must return the :class:`pygmt.Figure` object.
+    items
+        The items to build figures for.
+    processes
+        The number of worker processes. Defaults to the number of CPUs.
+    outputs
+        The file names to save the figures to, one for each item. The file extensions
+        determine the formats. If ``None``, the figures are returned as bytes instead.
+    fmt
+        The format of the figures returned as bytes (e.g., ``"png"``, ``"pdf"``). Only
+        used when ``outputs`` is ``None``.
+    **kwargs
+        Additional keyword arguments passed to :meth:`pygmt.Figure.savefig` (e.g.,
+        ``dpi``).
+
+    Returns
+    -------
+    results
+        An iterator over the file name (if ``outputs`` is given) or the bytes of each
+        figure, in the same order as the items. The figures are rendered in the
+        background and each result is available as soon as it's ready.
+
+    Examples
+    --------
+    Save maps of two regions to PNG files in a script::
+
+        import pygmt
+
+
+        def build(region):
+            fig = pygmt.Figure()
+            fig.basemap(region=region, projection="X10c", frame=True)
+            return fig
+
+
+        if __name__ == "__main__":
+            regions = [[0, 10, 0, 10], [0, 20, 0, 20]]
+            outputs = ["map-1.png", "map-2.png"]
+            for fname in pygmt.render_many(build, regions, outputs=outputs):
+                print(fname)
+    """
+    if processes is not None and processes < 1:
+        raise GMTValueError(
+            processes, description="number of processes", reason="Must be positive."
+        )
+    items = list(items)
+    if outputs is None:
+        tasks = [(item, None) for item in items]
+    elif len(outputs) == len(items):
+        tasks = list(zip(items, outputs, strict=True))
+    else:
+        raise GMTValueError(
+            len(outputs),
+            description="number of outputs",
+            reason=f"Must be equal to the number of items ({len(items)}).",
+        )
+
+    return _render_in_pool(tasks, processes, initargs=(build_fn, fmt, kwargs))
+
+
+def _render_in_pool(
+    tasks: list[tuple[Any, PathLike | None]], processes: int | None, initargs: tuple
+) -> Iterator[str | bytes]:
+    """
+    Render the figures in a pool of worker processes and yield the results in order.
+    """
+    context = multiprocessing.get_context("spawn")
+    pool = context.Pool(
+        processes=processes,
+        initializer=_init_render_worker,
+        initargs=initargs,
+        maxtasksperchild=_MAX_FIGURES_PER_WORKER,
+    )
+    try:
+        yield from pool.imap(_render, tasks)
+    except BaseException:
+        pool.terminate()
+        raise
+    else:
+        # Let the workers exit normally so that they end their sessions.
+        pool.close()
+    finally:
+        pool.join()
@@ -2,8 +2,10 @@
 Modern mode session management modules.
 """
 
+import atexit
 import os
 import sys
+import threading
 
 from pygmt.clib import Session
 from pygmt.helpers import unique_name
@@ -22,6 +24,7 @@ def begin() -> None:
         os.environ["GMT_SESSION_NAME"] = unique_name()
 
     prefix = "pygmt-session"
+    Session._modern_mode = True
     with Session() as lib:
         lib.call_module(module="begin", args=[prefix])
         # PyGMT relies on GMT modern mode with GMT_COMPATIBILITY at version 6.
@@ -37,3 +40,40 @@ def end() -> None:
     """
     with Session() as lib:
         lib.call_module(module="end", args=[])
+    Session._modern_mode = False
+
+
+# Lock for starting the global session from multiple threads.
+_BEGIN_LOCK = threading.Lock()
+
+
+def _begin_global_session() -> None:
+    """
+    Start the global modern mode session on first use.
+
+    Instead of at ``import pygmt``, the session is started by the first
+    :class:`pygmt.Figure` or by the first function that changes the session state (e.g.,
+    :class:`pygmt.config`). It is terminated by :func:`pygmt.end` when Python exits.
+    Does nothing if the session is already running.
+    """
+    with _BEGIN_LOCK:
+        if Session._modern_mode:
+            return
+        begin()
+        # Tell Python to run end when shutting down (only once)
+        atexit.unregister(end)
+        atexit.register(end)
+
+
+def _reset_after_fork() -> None:
+    """
+    Let a forked child process start its own global modern mode session.
+    """
+    global _BEGIN_LOCK  # ruff: ignore[global-statement]
+
+    Session._modern_mode = False
+    _BEGIN_LOCK = threading.Lock()  # The lock may have been held by another thread.
+
+
+if hasattr(os, "register_at_fork"):  # Not available on Windows
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -2,40 +2,125 @@
 Source code for PyGMT methods.
 """
 
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING
+
 # Re-export standalone functions that can be used directly.
 # Figure plotting methods are attached in pygmt/figure.py and are not exported here.
-from pygmt.src.binstats import binstats
-from pygmt.src.blockm import blockmean, blockmedian, blockmode
-from pygmt.src.config import config
-from pygmt.src.dimfilter import dimfilter
-from pygmt.src.filter1d import filter1d
-from pygmt.src.grd2cpt import grd2cpt
-from pygmt.src.grd2xyz import grd2xyz
-from pygmt.src.grdclip import grdclip
-from pygmt.src.grdcut import grdcut
-from pygmt.src.grdfill import grdfill
-from pygmt.src.grdfilter import grdfilter
-from pygmt.src.grdgradient import grdgradient
-from pygmt.src.grdhisteq import grdhisteq
-from pygmt.src.grdinfo import grdinfo
-from pygmt.src.grdlandmask import grdlandmask
-from pygmt.src.grdmask import grdmask
-from pygmt.src.grdpaste import grdpaste
-from pygmt.src.grdproject import grdproject
-from pygmt.src.grdsample import grdsample
-from pygmt.src.grdtrack import grdtrack
-from pygmt.src.grdvolume import grdvolume
-from pygmt.src.info import info
-from pygmt.src.makecpt import makecpt
-from pygmt.src.nearneighbor import nearneighbor
-from pygmt.src.project import project
-from pygmt.src.select import select
-from pygmt.src.sph2grd import sph2grd
-from pygmt.src.sphdistance import sphdistance
-from pygmt.src.sphinterpolate import sphinterpolate
-from pygmt.src.surface import surface
-from pygmt.src.triangulate import triangulate
-from pygmt.src.which import which
-from pygmt.src.x2sys_cross import x2sys_cross
-from pygmt.src.x2sys_init import x2sys_init
-from pygmt.src.xyz2grd import xyz2grd
+# The functions are imported lazily on first access, so that importing pygmt doesn't
+# have to import all the modules.
+if TYPE_CHECKING:
+    from pygmt.src.binstats import binstats
+    from pygmt.src.blockm import blockmean, blockmedian, blockmode
+    from pygmt.src.config import config
+    from pygmt.src.dimfilter import dimfilter
+    from pygmt.src.filter1d import filter1d
+    from pygmt.src.grd2cpt import grd2cpt
+    from pygmt.src.grd2xyz import grd2xyz
+    from pygmt.src.grdclip import grdclip
+    from pygmt.src.grdcut import grdcut
+    from pygmt.src.grdfill import grdfill
+    from pygmt.src.grdfilter import grdfilter
+    from pygmt.src.grdgradient import grdgradient
+    from pygmt.src.grdhisteq import grdhisteq
+    from pygmt.src.grdinfo import grdinfo
+    from pygmt.src.grdlandmask import grdlandmask
+    from pygmt.src.grdmask import grdmask
+    from pygmt.src.grdpaste import grdpaste
+    from pygmt.src.grdproject import grdproject
+    from pygmt.src.grdsample import grdsample
+    from pygmt.src.grdtrack import grdtrack
+    from pygmt.src.grdvolume import grdvolume
+    from pygmt.src.info import info
+    from pygmt.src.makecpt import makecpt
+    from pygmt.src.nearneighbor import nearneighbor
+    from pygmt.src.project import project
+    from pygmt.src.select import select
+    from pygmt.src.sph2grd import sph2grd
+    from pygmt.src.sphdistance import sphdistance
+    from pygmt.src.sphinterpolate import sphinterpolate
+    from pygmt.src.surface import surface
+    from pygmt.src.triangulate import triangulate
+    from pygmt.src.which import which
+    from pygmt.src.x2sys_cross import x2sys_cross
+    from pygmt.src.x2sys_init import x2sys_init
+    from pygmt.src.xyz2grd import xyz2grd
+
+# Mapping of the re-exported functions to the modules they are defined in.
+_FUNCTIONS = {
+    "binstats": "binstats",
+    "blockmean": "blockm",
+    "blockmedian": "blockm",
+    "blockmode": "blockm",
+    "config": "config",
+    "dimfilter": "dimfilter",
+    "filter1d": "filter1d",
+    "grd2cpt": "grd2cpt",
+    "grd2xyz": "grd2xyz",
+    "grdclip": "grdclip",
+    "grdcut": "grdcut",
+    "grdfill": "grdfill",
+    "grdfilter": "grdfilter",
+    "grdgradient": "grdgradient",
+    "grdhisteq": "grdhisteq",
+    "grdinfo": "grdinfo",
+    "grdlandmask": "grdlandmask",
+    "grdmask": "grdmask",
+    "grdpaste": "grdpaste",
+    "grdproject": "grdproject",
+    "grdsample": "grdsample",
+    "grdtrack": "grdtrack",
+    "grdvolume": "grdvolume",
+    "info": "info",
+    "makecpt": "makecpt",
+    "nearneighbor": "nearneighbor",
+    "project": "project",
+    "select": "select",
+    "sph2grd": "sph2grd",
+    "sphdistance": "sphdistance",
+    "sphinterpolate": "sphinterpolate",
+    "surface": "surface",
+    "triangulate": "triangulate",
+    "which": "which",
+    "x2sys_cross": "x2sys_cross",
+    "x2sys_init": "x2sys_init",
+    "xyz2grd": "xyz2grd",
+}
+
+
+def __getattr__(name: str):
+    """
+    Import a re-exported function on first access.
+    """
+    if (module := _FUNCTIONS.get(name)) is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    func = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = func
+    return func
+
+
+def __dir__() -> list[str]:
+    """
+    List the module attributes, including the functions not imported yet.
+    """
+    return sorted({*globals(), *_FUNCTIONS})
+
+
+class _SourceModule(types.ModuleType):
+    """
+    Module type of pygmt.src that keeps the functions shadowing submodule names.
+
+    Importing a submodule (e.g., ``pygmt.src.grdinfo``) sets it as an attribute of the
+    package, which would hide the function of the same name from ``__getattr__``.
+    """
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in _FUNCTIONS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _SourceModule
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike, TableLike
+from pygmt._typing import DTypeLike, PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTTypeError, GMTValueError
@@ -51,6 +51,7 @@ def binstats(
     | bool = False,
     incols: int | str | Sequence[int | str] | None = None,
     registration: Literal["gridline", "pixel"] | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -80,6 +81,7 @@ def binstats(
     data
         A file name of an ASCII data table or a 2-D $table_classes.
     $outgrid
+    $out_dtype
     statistic
         Choose the statistic that will be computed per node based on the points that are
         within *radius* distance of the node. Select one of:
@@ -189,4 +191,6 @@ def binstats(
             lib.call_module(
                 module="binstats", args=build_arg_list(aliasdict, infile=vintbl)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -51,7 +51,7 @@ def _blockm(
     output_type = validate_output_table_type(output_type, outfile=outfile)
 
     column_names = None
-    if output_type == "pandas" and isinstance(data, pd.DataFrame):
+    if output_type in {"pandas", "arrow", "polars"} and isinstance(data, pd.DataFrame):
         column_names = data.columns.to_list()
 
     with Session() as lib:
@@ -86,7 +86,7 @@ def blockmean(
     x=None,
     y=None,
     z=None,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     center: bool = False,
     spacing: Sequence[float | str] | None = None,
@@ -207,7 +207,7 @@ def blockmedian(
     x=None,
     y=None,
     z=None,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     center: bool = False,
     spacing: Sequence[float | str] | None = None,
@@ -328,7 +328,7 @@ def blockmode(
     x=None,
     y=None,
     z=None,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     center: bool = False,
     spacing: Sequence[float | str] | None = None,
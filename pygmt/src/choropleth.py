@@ -8,6 +8,7 @@ from typing import Literal
 from pygmt._typing import GeoLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
+from pygmt.clib.conversion import geojson_to_segments
 from pygmt.helpers import build_arg_list, fmt_docstring
 from pygmt.params import Axis, Frame
 
@@ -101,12 +102,16 @@ def choropleth(
     >>> fig.colorbar(frame=True)
     >>> fig.show()
     """
+    # Store the polygons in memory with the fill values as the segment z-values (-Z)
+    # if possible, otherwise GMT reads the values from an OGR_GMT file via -aZ=column.
+    segments = geojson_to_segments(data, zcolumn=column)
+
     aliasdict = AliasSystem(
         C=Alias(cmap, name="cmap"),
         I=Alias(intensity, name="intensity"),
         N=Alias(no_clip, name="no_clip"),
         W=Alias(pen, name="pen"),
-        a=Alias(f"Z={column}", name="column"),
+        a=Alias(f"Z={column}" if segments is None else None, name="column"),
     ).add_common(
         B=frame,
         J=projection,
@@ -121,7 +126,11 @@ def choropleth(
 
     self._activate_figure()
     with Session() as lib:
-        with lib.virtualfile_in(check_kind="vector", data=data) as vintbl:
+        with (
+            lib.virtualfile_in(check_kind="vector", data=data)
+            if segments is None
+            else lib.virtualfile_from_segments(segments)
+        ) as vintbl:
             lib.call_module(
                 module="plot", args=build_arg_list(aliasdict, infile=vintbl)
             )
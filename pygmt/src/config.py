@@ -7,6 +7,7 @@ from inspect import Parameter, Signature
 from typing import ClassVar
 
 from pygmt.clib import Session
+from pygmt.session_management import _begin_global_session
 
 
 class config:  # ruff: ignore[invalid-class-name]
@@ -205,6 +206,9 @@ class config:  # ruff: ignore[invalid-class-name]
             )
             kwargs.pop("PS_CONVERT")
 
+        # GMT defaults are changed in the modern mode session
+        _begin_global_session()
+
         # Save values so that we can revert to their initial values
         self.old_defaults = {}
         with Session() as lib:
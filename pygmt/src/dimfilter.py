@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -24,6 +24,7 @@ def dimfilter(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -61,6 +62,7 @@ def dimfilter(
     ----------
     $grid
     $outgrid
+    $out_dtype
     distance : int or str
         Distance flag tells how grid (x,y) relates to filter width, as follows:
 
@@ -167,4 +169,6 @@ def dimfilter(
             lib.call_module(
                 module="dimfilter", args=build_arg_list(aliasdict, infile=vingrd)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
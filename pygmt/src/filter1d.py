@@ -22,7 +22,7 @@ from pygmt.helpers import (
 @use_alias(E="end", F="filter_type", N="time_col")
 def filter1d(
     data: PathLike | TableLike,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
@@ -35,7 +35,7 @@ __doctest_skip__ = ["grd2xyz"]
 )
 def grd2xyz(
     grid: PathLike | xr.DataArray,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
@@ -148,7 +148,9 @@ def grd2xyz(
     """
     output_type = validate_output_table_type(output_type, outfile=outfile)
 
-    if kwargs.get("o", outcols) is not None and output_type == "pandas":
+    # Output types with column names.
+    named_columns = output_type in {"pandas", "arrow", "polars"}
+    if kwargs.get("o", outcols) is not None and named_columns:
         raise GMTValueError(
             output_type,
             description="value for parameter 'output_type'",
@@ -157,7 +159,7 @@ def grd2xyz(
     # Set the default column names for the pandas DataFrame header.
     column_names: list[str] = ["x", "y", "z"]
     # Let output pandas column names match input DataArray dimension names
-    if output_type == "pandas" and isinstance(grid, xr.DataArray):
+    if named_columns and isinstance(grid, xr.DataArray):
         # Reverse the dims because it is rows, columns ordered.
         column_names = [str(grid.dims[1]), str(grid.dims[0]), str(grid.name)]
 
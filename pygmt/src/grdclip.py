@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -26,6 +26,7 @@ def grdclip(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     """
@@ -62,6 +63,7 @@ def grdclip(
     ----------
     $grid
     $outgrid
+    $out_dtype
     above
         Pass a sequence of two values in the form of (*high*, *above*), to set all node
         values greater than *high* to *above*.
@@ -132,4 +134,6 @@ def grdclip(
             lib.call_module(
                 module="grdclip", args=build_arg_list(aliasdict, infile=vingrd)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTTypeError, GMTValueError
@@ -30,6 +30,7 @@ def grdcut(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -61,6 +62,7 @@ def grdcut(
         or an image, so we need to specify the raster kind explicitly. The default is
         ``"grid"``.
     $outgrid
+    $out_dtype
     extend : bool or float
         Allow grid to be extended if new ``region`` exceeds existing
         boundaries. Give a value to initialize nodes outside current region.
@@ -140,5 +142,5 @@ def grdcut(
                 module="grdcut", args=build_arg_list(aliasdict, infile=vingrd)
             )
             return lib.virtualfile_to_raster(
-                vfname=voutgrd, kind=outkind, outgrid=outgrid
+                vfname=voutgrd, kind=outkind, outgrid=outgrid, dtype=out_dtype
             )
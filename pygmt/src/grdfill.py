@@ -7,7 +7,7 @@ from typing import Literal
 
 import numpy as np
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -35,6 +35,7 @@ def grdfill(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | np.ndarray | None:
     r"""
@@ -63,6 +64,7 @@ def grdfill(
     ----------
     $grid
     $outgrid
+    $out_dtype
     constant_fill
         Fill the holes with a constant value. Specify the constant value to use.
     grid_fill
@@ -167,4 +169,6 @@ def grdfill(
                 lib.call_module(
                     module="grdfill", args=build_arg_list(aliasdict, infile=vingrd)
                 )
-                return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+                return lib.virtualfile_to_raster(
+                    vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+                )
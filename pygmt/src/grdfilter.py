@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -95,6 +95,7 @@ def grdfilter(
     | bool = False,
     registration: Literal["gridline", "pixel"] | bool = False,
     cores: int | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     """
@@ -128,6 +129,7 @@ def grdfilter(
     ----------
     $grid
     $outgrid
+    $out_dtype
     filter
         The filter type. Choose among convolution and non-convolution filters.
 
@@ -297,4 +299,6 @@ def grdfilter(
             lib.call_module(
                 module="grdfilter", args=build_arg_list(aliasdict, infile=vingrd)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -84,6 +84,7 @@ def grdgradient(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -111,6 +112,7 @@ def grdgradient(
     ----------
     $grid
     $outgrid
+    $out_dtype
     azimuth
         *azim* or (*azim*, *azim2*).
         Azimuthal direction for a directional derivative; *azim* is the angle in the x-y
@@ -263,4 +265,6 @@ def grdgradient(
             lib.call_module(
                 module="grdgradient", args=build_arg_list(aliasdict, infile=vingrd)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -8,7 +8,7 @@ from typing import Literal
 import numpy as np
 import pandas as pd
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -64,6 +64,7 @@ class grdhisteq:  # ruff: ignore[invalid-class-name]
             "quiet", "error", "warning", "timing", "info", "compat", "debug"
         ]
         | bool = False,
+        out_dtype: DTypeLike | None = None,
         **kwargs,
     ) -> xr.DataArray | None:
         r"""
@@ -86,6 +87,7 @@ class grdhisteq:  # ruff: ignore[invalid-class-name]
         ----------
         $grid
         $outgrid
+        $out_dtype
         divisions : int
             Set the number of divisions of the data range.
         gaussian : bool or int or float
@@ -141,14 +143,16 @@ class grdhisteq:  # ruff: ignore[invalid-class-name]
                 lib.call_module(
                     module="grdhisteq", args=build_arg_list(aliasdict, infile=vingrd)
                 )
-                return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+                return lib.virtualfile_to_raster(
+                    vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+                )
 
     @staticmethod
     @fmt_docstring
     @use_alias(C="divisions", N="gaussian", Q="quadratic", h="header")
     def compute_bins(
         grid: PathLike | xr.DataArray,
-        output_type: Literal["pandas", "numpy", "file"] = "pandas",
+        output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
         outfile: PathLike | None = None,
         region: Sequence[float | str] | str | None = None,
         verbose: Literal[
@@ -131,12 +131,29 @@ def grdinfo(
     )
     aliasdict.merge(kwargs)
 
-    with GMTTempFile() as outfile:
-        with Session() as lib:
-            with lib.virtualfile_in(check_kind="raster", data=grid) as vingrd:
-                lib.call_module(
-                    module="grdinfo",
-                    args=build_arg_list(aliasdict, infile=vingrd, outfile=outfile.name),
-                )
-        result = outfile.read()
-    return result
+    # Numerical records (e.g., with per_column or the bounding box polygons of
+    # spacing="b") are formatted by GMT only when written to a file. Other reports are
+    # text records, which are read from a virtual file as they are.
+    if aliasdict.get("C") or str(aliasdict.get("I", "")).startswith("b"):
+        with GMTTempFile() as outfile:
+            with Session() as lib:
+                with lib.virtualfile_in(check_kind="raster", data=grid) as vingrd:
+                    lib.call_module(
+                        module="grdinfo",
+                        args=build_arg_list(
+                            aliasdict, infile=vingrd, outfile=outfile.name
+                        ),
+                    )
+            return outfile.read()
+
+    with Session() as lib:
+        with (
+            lib.virtualfile_in(check_kind="raster", data=grid) as vingrd,
+            lib.virtualfile_out(kind="dataset") as vouttbl,
+        ):
+            lib.call_module(
+                module="grdinfo",
+                args=build_arg_list(aliasdict, infile=vingrd, outfile=vouttbl),
+            )
+            lines = lib.virtualfile_to_dataset(vfname=vouttbl, output_type="strings")
+    return "".join(f"{line}\n" for line in lines)
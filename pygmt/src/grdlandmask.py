@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -30,6 +30,7 @@ def grdlandmask(
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
     cores: int | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     """
@@ -63,6 +64,7 @@ def grdlandmask(
     Parameters
     ----------
     $outgrid
+    $out_dtype
     $spacing
     $area_thresh
     resolution
@@ -150,4 +152,6 @@ def grdlandmask(
         with lib.virtualfile_out(kind="grid", fname=outgrid) as voutgrd:
             aliasdict["G"] = voutgrd
             lib.call_module(module="grdlandmask", args=build_arg_list(aliasdict))
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError, GMTValueError
@@ -123,6 +123,7 @@ def grdmask(
     id_start: float | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     """
@@ -159,6 +160,7 @@ def grdmask(
         - **Polygon mode**: One or more polygons with closed coordinates
         - **Point coverage mode**: Data points (used with ``search_radius`` parameter)
     $outgrid
+    $out_dtype
     $spacing
     outside
     edge
@@ -229,4 +231,6 @@ def grdmask(
                 module="grdmask",
                 args=build_arg_list(aliasdict, infile=vintbl),
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -5,7 +5,7 @@ grdpaste - Join two grids along their common edge.
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTTypeError
@@ -20,6 +20,7 @@ def grdpaste(
     outgrid: PathLike | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     """
@@ -54,6 +55,7 @@ def grdpaste(
         #. Passing two ``xarray.DataArray`` objects requires GMT>6.6.0 due to
            an upstream GMT bug.
     $outgrid
+    $out_dtype
     $verbose
     $coltypes
 
@@ -87,4 +89,6 @@ def grdpaste(
                 module="grdpaste",
                 args=build_arg_list(aliasdict, infile=[vingrd1, vingrd2]),
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -31,6 +31,7 @@ def grdproject(
     registration: Literal["gridline", "pixel"] | bool = False,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -69,6 +70,7 @@ def grdproject(
     ----------
     $grid
     $outgrid
+    $out_dtype
     center
         If ``True``, let the projected coordinates be relative to the projection center
         [Default is relative to the lower left corner]. Optionally, set offsets
@@ -147,4 +149,6 @@ def grdproject(
             lib.call_module(
                 module="grdproject", args=build_arg_list(aliasdict, infile=vingrd)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike
+from pygmt._typing import DTypeLike, PathLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -34,6 +34,7 @@ def grdsample(
     | bool = False,
     registration: Literal["gridline", "pixel"] | bool = False,
     cores: int | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     """
@@ -72,6 +73,7 @@ def grdsample(
     ----------
     $grid
     $outgrid
+    $out_dtype
     $spacing
     toggle
         Toggle between grid and pixel registration; if the input is grid-registered, the
@@ -129,4 +131,6 @@ def grdsample(
             lib.call_module(
                 module="grdsample", args=build_arg_list(aliasdict, infile=vingrd)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -2,7 +2,7 @@
 grdtrack - Sample one or more grids at specified locations.
 """
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from typing import Literal
 
 import numpy as np
@@ -11,7 +11,7 @@ import xarray as xr
 from pygmt._typing import PathLike, TableLike
 from pygmt.alias import AliasSystem
 from pygmt.clib import Session
-from pygmt.exceptions import GMTParameterError
+from pygmt.exceptions import GMTParameterError, GMTValueError
 from pygmt.helpers import (
     build_arg_list,
     fmt_docstring,
@@ -23,6 +23,113 @@ from pygmt.helpers import (
 __doctest_skip__ = ["grdtrack"]
 
 
+def _check_streaming_table(table: object, newcolname: str | None) -> None:
+    """
+    Check that a table can be split into chunks of rows in streaming mode.
+
+    Only numpy.ndarray, pandas.DataFrame and Arrow tables (e.g., pyarrow.Table or
+    polars.DataFrame) can be sliced by rows. Tables with named columns also need
+    ``newcolname``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> _check_streaming_table(np.arange(5), newcolname=None)
+    >>> _check_streaming_table("@tut_ship.xyz", newcolname=None)
+    Traceback (most recent call last):
+    ...
+    pygmt.exceptions.GMTParameterError: ...
+    """
+    is_arrow = hasattr(table, "__arrow_c_stream__") and hasattr(table, "slice")
+    if not isinstance(table, np.ndarray | pd.DataFrame) and not is_arrow:
+        raise GMTParameterError(
+            reason=(
+                "Parameter 'points' must be a numpy.ndarray, pandas.DataFrame or "
+                "Arrow table, or an iterator of them, if 'chunksize' is set or "
+                f"'points' is an iterator, not {type(table).__name__!r}."
+            )
+        )
+    if hasattr(table, "columns") and newcolname is None:
+        raise GMTParameterError(
+            required="newcolname", reason="Pass in a string to 'newcolname'."
+        )
+
+
+def _iter_chunks(
+    points: TableLike | Iterable[TableLike],
+    chunksize: int | None,
+    newcolname: str | None = None,
+) -> Iterator[TableLike]:
+    """
+    Split a table, or each table from an iterable of tables, into chunks of rows.
+
+    Each table is checked by ``_check_streaming_table`` before it is split.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> [chunk.tolist() for chunk in _iter_chunks(np.arange(5), chunksize=2)]
+    [[0, 1], [2, 3], [4]]
+    >>> tables = iter([np.arange(3), np.arange(3, 4)])
+    >>> [chunk.tolist() for chunk in _iter_chunks(tables, chunksize=None)]
+    [[0, 1, 2], [3]]
+    """
+    tables = points if isinstance(points, Iterator) else [points]
+    for table in tables:
+        _check_streaming_table(table, newcolname=newcolname)
+        nrows = len(table)
+        step = chunksize or nrows
+        for start in range(0, nrows, step):
+            match table:
+                case pd.DataFrame():
+                    yield table.iloc[start : start + step]
+                case np.ndarray():
+                    yield table[start : start + step]
+                case _:  # Arrow tables, e.g., pyarrow.Table or polars.DataFrame.
+                    yield table.slice(start, step)
+
+
+def _grdtrack_chunks(
+    grid: PathLike | xr.DataArray,
+    chunks: Iterator[TableLike],
+    aliasdict: AliasSystem,
+    output_type: str,
+    newcolname: str | None,
+) -> Iterator[pd.DataFrame | np.ndarray | tuple]:
+    """
+    Sample a grid at the points of each chunk within a single GMT session.
+
+    The grid is passed to GMT only once and its virtual file is reset after each
+    chunk. The GMT data containers of each chunk's points and output are freed before
+    the chunk is yielded, so that only one chunk of points and its output are in memory
+    at a time.
+    """
+    with Session() as lib:
+        with lib.virtualfile_in(check_kind="raster", data=grid) as vingrd:
+            aliasdict["G"] = vingrd
+            for chunk in chunks:
+                column_names = None
+                named_columns = output_type in {"pandas", "arrow", "polars", "segments"}
+                if named_columns and isinstance(chunk, pd.DataFrame):
+                    column_names = [*chunk.columns.to_list(), newcolname]
+                with (
+                    lib._free_data(),
+                    lib.virtualfile_in(check_kind="vector", data=chunk) as vintbl,
+                    lib.virtualfile_out(kind="dataset") as vouttbl,
+                ):
+                    lib.call_module(
+                        module="grdtrack",
+                        args=build_arg_list(aliasdict, infile=vintbl, outfile=vouttbl),
+                    )
+                    result = lib.virtualfile_to_dataset(
+                        vfname=vouttbl,
+                        output_type=output_type,
+                        column_names=column_names,
+                    )
+                lib.init_virtualfile(vingrd)
+                yield result
+
+
 @fmt_docstring
 @use_alias(
     A="resample",
@@ -50,7 +157,9 @@ __doctest_skip__ = ["grdtrack"]
 def grdtrack(
     grid: PathLike | xr.DataArray,
     points: PathLike | TableLike | None = None,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal[
+        "pandas", "numpy", "file", "arrow", "polars", "segments"
+    ] = "pandas",
     outfile: PathLike | None = None,
     newcolname=None,
     region: Sequence[float | str] | str | None = None,
@@ -58,8 +167,9 @@ def grdtrack(
     | bool = False,
     incols: int | str | Sequence[int | str] | None = None,
     outcols: int | str | Sequence[int | str] | None = None,
+    chunksize: int | None = None,
     **kwargs,
-) -> pd.DataFrame | np.ndarray | None:
+) -> pd.DataFrame | np.ndarray | tuple | Iterator | None:
     r"""
     Sample one or more grids at specified locations.
 
@@ -92,12 +202,33 @@ def grdtrack(
     points
         Pass in either a file name to an ASCII data table, a 2-D
         $table_classes.
-    $output_type
+        Can also be an iterator of tables (e.g., from :func:`pandas.read_csv` with
+        ``chunksize``), which are sampled one after another (see ``chunksize``).
+    output_type
+        Desired output type of the result data.
+
+        - ``pandas`` will return a :class:`pandas.DataFrame` object.
+        - ``numpy`` will return a :class:`numpy.ndarray` object.
+        - ``segments`` will keep the segments (e.g., the cross-profiles generated by
+          ``crossprofile``) apart and return a named tuple with the rows of all
+          segments as a :class:`pandas.DataFrame` (``data``), the row offsets of the
+          segments (``offsets``) and the segment headers (``headers``).
+        - ``file`` will save the result to the file specified by the ``outfile``
+          parameter.
     $outfile
     newcolname : str
         Required if ``points`` is a :class:`pandas.DataFrame`. The name for the
         new column in the track :class:`pandas.DataFrame` table where the
         sampled values will be placed.
+    chunksize
+        Sample the grid at ``chunksize`` points at a time and return an iterator over
+        the sampled chunks, instead of a single table. The grid is passed to GMT only
+        once and reused for all chunks, so that very large point tables can be sampled
+        with bounded memory. Also enabled if ``points`` is an iterator of tables, in
+        which case each table is a chunk unless it has more than ``chunksize`` rows.
+        Only :class:`numpy.ndarray`, :class:`pandas.DataFrame` and Arrow tables can
+        be split into chunks, not file names or other table types. Can't be used with
+        ``profile`` or ``outfile``.
     resample : str
         **f**\|\ **p**\|\ **m**\|\ **r**\|\ **R**\ [**+l**]
         For track resampling (if ``crossprofile`` or ``profile`` are set) we
@@ -278,8 +409,10 @@ def grdtrack(
 
         - ``None`` if ``outfile`` is set (output will be stored in file set by
           ``outfile``)
-        - :class:`pandas.DataFrame` or :class:`numpy.ndarray` if ``outfile`` is not set
-          (depends on ``output_type``)
+        - :class:`pandas.DataFrame`, :class:`numpy.ndarray` or a named tuple of
+          segments if ``outfile`` is not set (depends on ``output_type``)
+        - An iterator over the results of the chunks if ``chunksize`` is set or
+          ``points`` is an iterator of tables
 
     Example
     -------
@@ -303,15 +436,24 @@ def grdtrack(
     if points is None and kwargs.get("E") is None:
         raise GMTParameterError(at_least_one=["points", "profile"])
 
+    streaming = chunksize is not None or isinstance(points, Iterator)
+    if streaming and (outfile is not None or kwargs.get("E") is not None):
+        raise GMTParameterError(conflicts_with=("chunksize", ["outfile", "profile"]))
+    if chunksize is not None and chunksize < 1:
+        raise GMTValueError(chunksize, description="chunksize", reason="Must be >= 1.")
+
     if hasattr(points, "columns") and newcolname is None:
         raise GMTParameterError(
             required="newcolname", reason="Pass in a string to 'newcolname'."
         )
 
-    output_type = validate_output_table_type(output_type, outfile=outfile)
+    output_type = validate_output_table_type(
+        output_type, outfile=outfile, segments=True
+    )
 
     column_names = None
-    if output_type == "pandas" and isinstance(points, pd.DataFrame):
+    named_columns = output_type in {"pandas", "arrow", "polars", "segments"}
+    if named_columns and isinstance(points, pd.DataFrame):
         column_names = [*points.columns.to_list(), newcolname]
 
     aliasdict = AliasSystem().add_common(
@@ -322,6 +464,17 @@ def grdtrack(
     )
     aliasdict.merge(kwargs)
 
+    if streaming:
+        if not isinstance(points, Iterator):
+            # Tables from an iterator are checked one by one in _iter_chunks.
+            _check_streaming_table(points, newcolname=newcolname)
+        chunks = _iter_chunks(
+            points,  # type: ignore[arg-type]
+            chunksize=chunksize,
+            newcolname=newcolname,
+        )
+        return _grdtrack_chunks(grid, chunks, aliasdict, output_type, newcolname)
+
     with Session() as lib:
         with (
             lib.virtualfile_in(check_kind="raster", data=grid) as vingrd,
@@ -7,9 +7,10 @@ from typing import Literal
 
 import xarray as xr
 from packaging.version import Version
+from pygmt import clib
 from pygmt._typing import PathLike
 from pygmt.alias import Alias, AliasSystem
-from pygmt.clib import Session, __gmt_version__
+from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
 from pygmt.helpers import (
     build_arg_list,
@@ -298,7 +299,7 @@ def grdview(
     #    case since we can't parse zmin/zmax from 'region' if 'region' was set in
     #    previous plotting commands.
     # TODO(GMT>6.7.0): Remove this workaround.
-    if Version(__gmt_version__) <= Version("6.7.0") and plane is True:
+    if Version(clib.__gmt_version__) <= Version("6.7.0") and plane is True:
         plane = grdinfo(grid, per_column=True).split()[4]
 
     aliasdict = AliasSystem(
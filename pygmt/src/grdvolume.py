@@ -27,7 +27,7 @@ __doctest_skip__ = ["grdvolume"]
 @kwargs_to_strings(C="sequence")
 def grdvolume(
     grid: PathLike | xr.DataArray,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
@@ -6,12 +6,59 @@ from collections.abc import Sequence
 from typing import Literal
 
 import numpy as np
+import pandas as pd
+import xarray as xr
 from pygmt._typing import PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.helpers import GMTTempFile, build_arg_list, fmt_docstring, use_alias
 
 
+def _is_numeric_table(data: PathLike | TableLike) -> bool:
+    """
+    Check if the input is an in-memory table with numeric columns only.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> _is_numeric_table([[1, 2], [3, 4]])
+    True
+    >>> _is_numeric_table(
+    ...     pd.DataFrame({"x": [1.0], "y": pd.to_datetime(["2020-01-01"])})
+    ... )
+    False
+    >>> _is_numeric_table("table.txt")
+    False
+    """
+    if isinstance(data, pd.DataFrame):
+        dtypes = data.dtypes.to_list()
+    elif isinstance(data, xr.Dataset):
+        dtypes = list(data.dtypes.values())
+    elif hasattr(data, "dtype"):
+        dtypes = [data.dtype]
+    else:
+        dtypes = [np.asarray(data).dtype]
+    return all(pd.api.types.is_numeric_dtype(dtype) for dtype in dtypes)
+
+
+def _parse_numeric_output(lines: Sequence[str]) -> np.ndarray:
+    """
+    Parse the text output of the info module into a numpy array.
+    """
+    # Converts certain output types into a numpy array instead of a raw string that is
+    # less useful.
+    # e.g. -R0/1/2/3 or -T0/9/1
+    lines = [
+        line[2:].replace("/", " ") if line.startswith(("-R", "-T")) else line
+        for line in lines
+    ]
+    try:
+        return np.loadtxt(lines)
+    except ValueError:
+        # Load non-numerical outputs in str type, e.g. for datetime
+        return np.loadtxt(lines, dtype=np.str_)
+
+
 @fmt_docstring
 @use_alias(T="nearest_multiple", a="aspatial", f="coltypes")
 def info(
@@ -93,28 +140,40 @@ def info(
     )
     aliasdict.merge(kwargs)
 
+    numeric_output = (
+        kwargs.get("C", per_column) is not False
+        or kwargs.get("I", spacing) is not None
+        or kwargs.get("T") is not None
+    )
+
     with Session() as lib:
-        with GMTTempFile() as tmpfile:
-            with lib.virtualfile_in(check_kind="vector", data=data) as vintbl:
-                lib.call_module(
-                    module="info",
-                    args=build_arg_list(aliasdict, infile=vintbl, outfile=tmpfile.name),
-                )
-            result = tmpfile.read()
-
-        if (
-            kwargs.get("C", per_column) is not False
-            or kwargs.get("I", spacing) is not None
-            or kwargs.get("T") is not None
+        # GMT stores absolute times as plain numbers in virtual files, so numerical
+        # outputs of tables that may contain time columns are written as text instead.
+        if numeric_output and (
+            kwargs.get("f") is not None or not _is_numeric_table(data)
+        ):
+            with GMTTempFile() as tmpfile:
+                with lib.virtualfile_in(check_kind="vector", data=data) as vintbl:
+                    lib.call_module(
+                        module="info",
+                        args=build_arg_list(
+                            aliasdict, infile=vintbl, outfile=tmpfile.name
+                        ),
+                    )
+                return _parse_numeric_output(tmpfile.read().splitlines())
+
+        with (
+            lib.virtualfile_in(check_kind="vector", data=data) as vintbl,
+            lib.virtualfile_out(kind="dataset") as vouttbl,
         ):
-            # Converts certain output types into a numpy array
-            # instead of a raw string that is less useful.
-            if result.startswith(("-R", "-T")):  # e.g. -R0/1/2/3 or -T0/9/1
-                result = result[2:].replace("/", " ")
-            try:
-                result = np.loadtxt(result.splitlines())
-            except ValueError:
-                # Load non-numerical outputs in str type, e.g. for datetime
-                result = np.loadtxt(result.splitlines(), dtype=np.str_)
-
-        return result
+            lib.call_module(
+                module="info",
+                args=build_arg_list(aliasdict, infile=vintbl, outfile=vouttbl),
+            )
+        if not numeric_output:
+            lines = lib.virtualfile_to_dataset(vfname=vouttbl, output_type="strings")
+            return "".join(f"{line}\n" for line in lines).replace("\t", " ")
+        result = lib.virtualfile_to_dataset(vfname=vouttbl, output_type="numpy")
+        if result.dtype == object:  # Text outputs, e.g. -R0/1/2/3 or -T0/9/1
+            return _parse_numeric_output(result[:, -1].astype(str))
+        return result[0] if result.shape[0] == 1 else result
@@ -18,7 +18,7 @@ from pygmt.src._common import _parse_position
 @fmt_docstring
 def legend(
     self,
-    spec: PathLike | io.StringIO | None = None,
+    spec: PathLike | io.StringIO | io.BytesIO | None = None,
     position: Position | Sequence[float | str] | AnchorCode | None = None,
     width: float | str | None = None,
     height: float | str | None = None,
@@ -70,7 +70,8 @@ def legend(
         - ``None`` which means using the automatically generated legend specification
           file
         - Path to the legend specification file
-        - A :class:`io.StringIO` object containing the legend specification
+        - A :class:`io.StringIO` or :class:`io.BytesIO` object containing the legend
+          specification
 
         See :gmt-docs:`legend.html` for the definition of the legend specification.
     position
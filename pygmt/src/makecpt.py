@@ -9,6 +9,7 @@ from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
 from pygmt.helpers import build_arg_list, fmt_docstring, kwargs_to_strings, use_alias
+from pygmt.session_management import _begin_global_session
 
 
 @fmt_docstring
@@ -174,6 +175,8 @@ def makecpt(
 
     if (output := kwargs.pop("H", None)) is not None:
         kwargs["H"] = True
+    else:  # The CPT becomes the current CPT of the modern mode session.
+        _begin_global_session()
 
     aliasdict = AliasSystem(
         C=Alias(cmap, name="cmap"),
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike, TableLike
+from pygmt._typing import DTypeLike, PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.helpers import build_arg_list, fmt_docstring, use_alias
@@ -40,6 +40,7 @@ def nearneighbor(
     | bool = False,
     incols: int | str | Sequence[int | str] | None = None,
     registration: Literal["gridline", "pixel"] | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -101,6 +102,7 @@ def nearneighbor(
         Set the search radius that determines which data points are considered
         close to a node.
     $outgrid
+    $out_dtype
     empty : str
         Optional. Set the value assigned to empty nodes. Defaults to NaN.
 
@@ -174,4 +176,6 @@ def nearneighbor(
             lib.call_module(
                 module="nearneighbor", args=build_arg_list(aliasdict, infile=vintbl)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
@@ -319,7 +319,9 @@ def plot(  # ruff: ignore[too-many-branches]
 
     self._activate_figure()
     with Session() as lib:
-        with lib.virtualfile_in(check_kind="vector", data=data) as vintbl:
+        with lib.virtualfile_in(
+            check_kind="vector", data=data, geometry_only=kwargs.get("a") is None
+        ) as vintbl:
             lib.call_module(
                 module="plot", args=build_arg_list(aliasdict, infile=vintbl)
             )
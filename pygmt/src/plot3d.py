@@ -292,7 +292,12 @@ def plot3d(  # ruff: ignore[too-many-branches]
 
     self._activate_figure()
     with Session() as lib:
-        with lib.virtualfile_in(check_kind="vector", data=data, mincols=3) as vintbl:
+        with lib.virtualfile_in(
+            check_kind="vector",
+            data=data,
+            mincols=3,
+            geometry_only=kwargs.get("a") is None,
+        ) as vintbl:
             lib.call_module(
                 module="plot3d", args=build_arg_list(aliasdict, infile=vintbl)
             )
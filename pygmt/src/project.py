@@ -34,7 +34,9 @@ def project(
     x=None,
     y=None,
     z=None,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal[
+        "pandas", "numpy", "file", "arrow", "polars", "segments"
+    ] = "pandas",
     outfile: PathLike | None = None,
     azimuth: float | None = None,
     center: Sequence[float | str] | None = None,
@@ -45,7 +47,7 @@ def project(
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
     **kwargs,
-) -> pd.DataFrame | np.ndarray | None:
+) -> pd.DataFrame | np.ndarray | tuple | None:
     r"""
     Project data onto lines or great circles, or generate tracks.
 
@@ -125,7 +127,17 @@ def project(
         Pass in (x, y, z) or (longitude, latitude, elevation) values by
         providing a file name to an ASCII data table, a 2-D
         $table_classes.
-    $output_type
+    output_type
+        Desired output type of the result data.
+
+        - ``pandas`` will return a :class:`pandas.DataFrame` object.
+        - ``numpy`` will return a :class:`numpy.ndarray` object.
+        - ``segments`` will keep the segments of a multi-segment input apart and
+          return a named tuple with the rows of all segments as a
+          :class:`pandas.DataFrame` (``data``), the row offsets of the segments
+          (``offsets``) and the segment headers (``headers``).
+        - ``file`` will save the result to the file specified by the ``outfile``
+          parameter.
     $outfile
     center
         Set the origin of the projection, in the form of (*cx*, *cy*), in Definitions 1
@@ -217,8 +229,8 @@ def project(
 
         - ``None`` if ``outfile`` is set (output will be stored in file set by
           ``outfile``)
-        - :class:`pandas.DataFrame` or :class:`numpy.ndarray` if ``outfile`` is not set
-          (depends on ``output_type``)
+        - :class:`pandas.DataFrame`, :class:`numpy.ndarray` or a named tuple of
+          segments if ``outfile`` is not set (depends on ``output_type``)
     """
     if kwargs.get("C", center) is None:
         raise GMTParameterError(required="center")
@@ -238,10 +250,15 @@ def project(
     if sum(geometry_params) > 1:
         raise GMTParameterError(at_most_one=["azimuth", "endpoint", "pole"])
 
-    output_type = validate_output_table_type(output_type, outfile=outfile)
+    output_type = validate_output_table_type(
+        output_type, outfile=outfile, segments=True
+    )
 
     column_names = None
-    if output_type == "pandas" and kwargs.get("G") is not None:
+    if (
+        output_type in {"pandas", "arrow", "polars", "segments"}
+        and kwargs.get("G") is not None
+    ):
         column_names = list("rsp")
 
     aliasdict = AliasSystem(
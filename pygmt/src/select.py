@@ -42,7 +42,7 @@ __doctest_skip__ = ["select"]
 @kwargs_to_strings(N="sequence")
 def select(
     data: PathLike | TableLike | None = None,
-    output_type: Literal["pandas", "numpy", "file"] = "pandas",
+    output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
     outfile: PathLike | None = None,
     resolution: Literal[
         "auto", "full", "high", "intermediate", "low", "crude", None
@@ -218,7 +218,7 @@ def select(
     output_type = validate_output_table_type(output_type, outfile=outfile)
 
     column_names = None
-    if output_type == "pandas" and isinstance(data, pd.DataFrame):
+    if output_type in {"pandas", "arrow", "polars"} and isinstance(data, pd.DataFrame):
         column_names = data.columns.to_list()
 
     aliasdict = AliasSystem(
@@ -246,7 +246,9 @@ def select(
 
     with Session() as lib:
         with (
-            lib.virtualfile_in(check_kind="vector", data=data) as vintbl,
+            lib.virtualfile_in(
+                check_kind="vector", data=data, geometry_only=kwargs.get("a") is None
+            ) as vintbl,
             lib.virtualfile_out(kind="dataset", fname=outfile) as vouttbl,
         ):
             lib.call_module(
@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike, TableLike
+from pygmt._typing import DTypeLike, PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.helpers import build_arg_list, fmt_docstring, use_alias
@@ -26,6 +26,7 @@ def sph2grd(
     incols: int | str | Sequence[int | str] | None = None,
     registration: Literal["gridline", "pixel"] | bool = False,
     cores: int | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -53,6 +54,7 @@ def sph2grd(
         providing a file name to an ASCII data table, a 2-D
         $table_classes.
     $outgrid
+    $out_dtype
     $spacing
     $region
     $verbose
@@ -98,4 +100,6 @@ def sph2grd(
             lib.call_module(
                 module="sph2grd", args=build_arg_list(aliasdict, infile=vintbl)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
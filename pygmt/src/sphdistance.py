@@ -7,7 +7,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike, TableLike
+from pygmt._typing import DTypeLike, PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.exceptions import GMTParameterError
@@ -34,6 +34,7 @@ def sphdistance(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -61,6 +62,7 @@ def sphdistance(
     x/y : 1-D arrays
         Arrays of x and y coordinates.
     $outgrid
+    $out_dtype
     $spacing
     single_form : bool
         For large data sets you can save some memory (at the expense of more
@@ -142,4 +144,6 @@ def sphdistance(
             lib.call_module(
                 module="sphdistance", args=build_arg_list(aliasdict, infile=vintbl)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
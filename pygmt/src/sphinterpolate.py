@@ -6,7 +6,7 @@ from collections.abc import Sequence
 from typing import Literal
 
 import xarray as xr
-from pygmt._typing import PathLike, TableLike
+from pygmt._typing import DTypeLike, PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.helpers import build_arg_list, fmt_docstring
@@ -22,6 +22,7 @@ def sphinterpolate(
     region: Sequence[float | str] | str | None = None,
     verbose: Literal["quiet", "error", "warning", "timing", "info", "compat", "debug"]
     | bool = False,
+    out_dtype: DTypeLike | None = None,
     **kwargs,
 ) -> xr.DataArray | None:
     r"""
@@ -52,6 +53,7 @@ def sphinterpolate(
         providing a file name to an ASCII data table, a 2-D
         $table_classes.
     $outgrid
+    $out_dtype
     $spacing
     $region
     $verbose
@@ -91,4 +93,6 @@ def sphinterpolate(
             lib.call_module(
                 module="sphinterpolate", args=build_arg_list(aliasdict, infile=vintbl)
             )
-            return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+            return lib.virtualfile_to_raster(
+                vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+            )
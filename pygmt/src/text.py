@@ -16,7 +16,7 @@ from pygmt.helpers import (
     data_kind,
     fmt_docstring,
     is_nonstr_iter,
-    non_ascii_to_octal,
+    non_ascii_array_to_octal,
     use_alias,
 )
 from pygmt.params import Axis, Frame
@@ -265,10 +265,8 @@ def text(  # ruff: ignore[too-many-branches, too-many-statements]
 
         # Append text to the last column. Text must be passed in as str type.
         text = np.asarray(text, dtype=np.str_)
-        if (encoding := _check_encoding("".join(text.flatten()))) != "ascii":
-            text = np.vectorize(non_ascii_to_octal, excluded="encoding")(
-                text, encoding=encoding
-            )
+        if (encoding := _check_encoding("".join(text.ravel().tolist()))) != "ascii":
+            text = non_ascii_array_to_octal(text, encoding=encoding)
             confdict["PS_CHAR_ENCODING"] = encoding
         data["text"] = text
     else:
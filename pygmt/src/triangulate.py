@@ -9,7 +9,7 @@ from typing import Literal
 import numpy as np
 import pandas as pd
 import xarray as xr
-from pygmt._typing import PathLike, TableLike
+from pygmt._typing import DTypeLike, PathLike, TableLike
 from pygmt.alias import Alias, AliasSystem
 from pygmt.clib import Session
 from pygmt.helpers import (
@@ -74,6 +74,7 @@ class triangulate:  # ruff: ignore[invalid-class-name]
         | bool = False,
         incols: int | str | Sequence[int | str] | None = None,
         registration: Literal["gridline", "pixel"] | bool = False,
+        out_dtype: DTypeLike | None = None,
         **kwargs,
     ) -> xr.DataArray | None:
         """
@@ -118,6 +119,7 @@ class triangulate:  # ruff: ignore[invalid-class-name]
             $table_classes.
         $spacing
         $outgrid
+        $out_dtype
             The interpolation is performed in the original coordinates, so if
             your triangles are close to the poles you are better off projecting
             all data to a local coordinate system before using ``triangulate``
@@ -173,7 +175,9 @@ class triangulate:  # ruff: ignore[invalid-class-name]
                 lib.call_module(
                     module="triangulate", args=build_arg_list(aliasdict, infile=vintbl)
                 )
-                return lib.virtualfile_to_raster(vfname=voutgrd, outgrid=outgrid)
+                return lib.virtualfile_to_raster(
+                    vfname=voutgrd, outgrid=outgrid, dtype=out_dtype
+                )
 
     @staticmethod
     @fmt_docstring
@@ -192,7 +196,7 @@ class triangulate:  # ruff: ignore[invalid-class-name]
         y=None,
         z=None,
         *,
-        output_type: Literal["pandas", "numpy", "file"] = "pandas",
+        output_type: Literal["pandas", "numpy", "file", "arrow", "polars"] = "pandas",
         outfile: PathLike | None = None,
         spacing: Sequence[float | str] | None = None,
         projection: str | None = None,
@@ -0,0 +1,198 @@
+"""
+Test the awaitable functions in pygmt.aio.
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+import xarray as xr
+from pygmt import Figure, aio, grdcut, grdinfo, grdtrack
+from pygmt.exceptions import GMTValueError
+from pygmt.helpers.testing import load_static_earth_relief
+
+
+@pytest.fixture(scope="module", name="grid")
+def fixture_grid():
+    """
+    Load the grid data from the static earth relief file.
+    """
+    return load_static_earth_relief()
+
+
+@pytest.fixture(name="limits")
+def fixture_limits():
+    """
+    Restore the default limits of pygmt.aio after a test.
+    """
+    yield aio.configure
+    aio.configure()
+
+
+def test_aio_mirrors_processing_functions():
+    """
+    Check that the processing functions are mirrored as coroutine functions.
+    """
+    assert {"grdcut", "grdinfo", "grdtrack", "blockmean"}.issubset(dir(aio))
+    assert {"config", "grd2cpt", "makecpt"}.isdisjoint(dir(aio))
+    assert inspect.iscoroutinefunction(aio.grdtrack)
+    assert aio.grdtrack.__doc__ == grdtrack.__doc__
+    with pytest.raises(AttributeError):
+        _ = aio.config
+
+
+def test_aio_processing(grid):
+    """
+    Check that the awaitable functions give the same results as the original ones.
+    """
+    points = pd.DataFrame({"x": [-51.5, -50.0], "y": [-19.0, -18.0]})
+
+    async def main():
+        return await asyncio.gather(
+            aio.grdcut(grid, region=[-52, -50, -20, -18]),
+            aio.grdinfo(grid, per_column="n"),
+            aio.grdtrack(grid=grid, points=points, newcolname="z"),
+        )
+
+    cut, info, track = asyncio.run(main())
+    xr.testing.assert_identical(cut, grdcut(grid, region=[-52, -50, -20, -18]))
+    assert info == grdinfo(grid, per_column="n")
+    pd.testing.assert_frame_equal(
+        track, grdtrack(grid=grid, points=points, newcolname="z")
+    )
+
+
+def test_aio_savefig(tmp_path):
+    """
+    Check that a figure can be saved without blocking the event loop.
+    """
+    fig = Figure()
+    fig.basemap(region=[0, 10, 0, 10], projection="X10c", frame=True)
+    fname = tmp_path / "aio-savefig.png"
+    asyncio.run(aio.savefig(fig, fname, dpi=100))
+    assert fname.read_bytes().startswith(b"\x89PNG")
+
+
+def test_aio_savefig_concurrent(tmp_path, limits):
+    """
+    Check that figures saved at the same time are each converted from the right figure.
+    """
+    limits(max_workers=4)
+    figs, fnames = [], []
+    for i in range(4):
+        fig = Figure()
+        width = 4 * (i + 1)
+        fig.basemap(region=[0, 10, 0, 10], projection=f"X{width}c/4c", frame=True)
+        figs.append(fig)
+        fnames.append(tmp_path / f"aio-savefig-{i}.png")
+
+    async def main():
+        await asyncio.gather(
+            *[
+                aio.savefig(fig, fname, dpi=100)
+                for fig, fname in zip(figs, fnames, strict=True)
+            ]
+        )
+
+    asyncio.run(main())
+    # The width of a PNG image is stored in bytes 16 to 20 of the file.
+    widths = [int.from_bytes(fname.read_bytes()[16:20], "big") for fname in fnames]
+    assert widths == sorted(widths)
+    assert len(set(widths)) == len(widths)
+
+
+def test_aio_backpressure(limits):
+    """
+    Check that no more than max_pending calls are submitted at the same time.
+    """
+    limits(max_workers=4, max_pending=2)
+    lock = threading.Lock()
+    active, peak = 0, 0
+
+    def work():
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*[aio.run(work) for _ in range(8)])
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_aio_cancellation(limits):
+    """
+    Check that a cancelled call waiting to run is removed from the queue.
+    """
+    limits(max_workers=1, max_pending=4)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    async def main():
+        blocking = asyncio.create_task(aio.run(lambda: started.set() or release.wait()))
+        queued = asyncio.create_task(aio.run(calls.append, "queued"))
+        await asyncio.to_thread(started.wait)
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        release.set()
+        await blocking
+        # The slots are freed and new calls run as usual.
+        await aio.run(calls.append, "later")
+
+    asyncio.run(main())
+    assert calls == ["later"]
+
+
+def test_aio_configure_invalid(limits):
+    """
+    Check that invalid limits are rejected.
+    """
+    with pytest.raises(GMTValueError):
+        limits(max_workers=0)
+    with pytest.raises(GMTValueError):
+        limits(max_workers=2, max_pending=0)
+
+
+@pytest.mark.benchmark
+def test_aio_latency_under_load(grid):
+    """
+    Benchmark many concurrent grdtrack calls while checking that the event loop stays
+    responsive.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = [
+        pd.DataFrame(rng.uniform(low=[-52, -19.5], high=[-49, -17.5], size=(500, 2)))
+        for _ in range(32)
+    ]
+
+    async def main():
+        lags = []
+
+        async def ticker():
+            while True:
+                start = time.perf_counter()
+                await asyncio.sleep(0.01)
+                lags.append(time.perf_counter() - start - 0.01)
+
+        task = asyncio.create_task(ticker())
+        results = await asyncio.gather(
+            *[aio.grdtrack(grid=grid, points=pts, newcolname="z") for pts in points]
+        )
+        task.cancel()
+        return results, lags
+
+    results, lags = asyncio.run(main())
+    assert len(results) == 32
+    # The event loop kept running while the GMT modules were running.
+    assert len(lags) > 0
@@ -2,6 +2,7 @@
 Test the wrappers for the C API.
 """
 
+import ctypes as ctp
 import importlib
 from contextlib import contextmanager
 
@@ -68,6 +69,24 @@ def test_getitem():
             lib["A_WHOLE_LOT_OF_JUNK"]
 
 
+def test_get_libgmt_func_prototypes():
+    """
+    Test that each prototype of an API function gets its own function object.
+    """
+    with clib.Session() as lib:
+        argtypes = [ctp.c_void_p, ctp.c_char_p]
+        func = lib.get_libgmt_func("GMT_Get_Enum", argtypes=argtypes, restype=ctp.c_int)
+        # The same prototype gives the same object.
+        assert func is lib.get_libgmt_func(
+            "GMT_Get_Enum", argtypes=argtypes, restype=ctp.c_int
+        )
+        # A different prototype doesn't change the existing function object.
+        other = lib.get_libgmt_func("GMT_Get_Enum", argtypes=argtypes, restype=None)
+        assert other is not func
+        assert func.restype is ctp.c_int
+        assert func(None, b"GMT_DOUBLE") == lib["GMT_DOUBLE"]
+
+
 def test_create_destroy_session():
     """
     Test that create and destroy session are called without errors.
@@ -2,12 +2,16 @@
 Test the dataarray_to_matrix function.
 """
 
+import os
+
 import numpy as np
 import numpy.testing as npt
 import pytest
 import xarray as xr
+from pygmt import grdclip
 from pygmt.clib.conversion import dataarray_to_matrix
 from pygmt.exceptions import GMTValueError
+from pygmt.helpers.testing import load_static_earth_relief
 
 
 @pytest.mark.benchmark
@@ -71,6 +75,31 @@ def test_dataarray_to_matrix_negative_x_and_y_increment():
     npt.assert_allclose(actual=inc, desired=[abs(x[1] - x[0]), abs(y[1] - y[0])])
 
 
+def test_dataarray_to_matrix_north_up_no_copy():
+    """
+    Check that a north-up, C-contiguous grid is not copied.
+    """
+    data = np.arange(12, dtype=np.float32).reshape(3, 4)
+    x = np.linspace(start=0, stop=3, num=4)
+    y = np.linspace(start=9, stop=5, num=3)
+    grid = xr.DataArray(data, coords=[("y", y), ("x", x)])
+
+    matrix, region, inc = dataarray_to_matrix(grid)
+    assert np.shares_memory(matrix, data)
+    npt.assert_allclose(actual=region, desired=[0, 3, 5, 9])
+    npt.assert_allclose(actual=inc, desired=[1, 2])
+
+
+def test_dataarray_to_matrix_north_up_input_unchanged():
+    """
+    Check that a grid passed to GMT without a copy is not changed by GMT modules.
+    """
+    grid = load_static_earth_relief().sortby("lat", ascending=False).copy()
+    expected = grid.copy()
+    grdclip(grid=grid, below=[500, 0], above=[700, 1000])
+    xr.testing.assert_identical(grid, expected)
+
+
 def test_dataarray_to_matrix_dims_fails():
     """
     Check that it fails for > 2 dims.
@@ -115,3 +144,39 @@ def test_dataarray_to_matrix_zero_inc_fails():
     grid = xr.DataArray(data, coords=[("y", y), ("x", x)])
     with pytest.raises(GMTValueError):
         dataarray_to_matrix(grid)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "size",
+    [
+        2000,
+        pytest.param(
+            20000,
+            marks=pytest.mark.skipif(
+                not os.environ.get("PYGMT_RUN_LARGE_BENCHMARKS"),
+                reason="Needs several GB of memory. "
+                "Set PYGMT_RUN_LARGE_BENCHMARKS=1 to run it.",
+            ),
+        ),
+    ],
+)
+def test_dataarray_to_matrix_chained_large_grid(size):
+    """
+    Benchmark chained grid operations on a large grid.
+
+    The output of each operation has ascending y coordinates and is copied once to
+    flip the rows before passing it to the next one. The 20,000 x 20,000 grid is only
+    used if the PYGMT_RUN_LARGE_BENCHMARKS environment variable is set.
+    """
+    grid = xr.DataArray(
+        data=np.zeros((size, size), dtype=np.float32),
+        coords={
+            "y": np.linspace(start=size - 1, stop=0, num=size),
+            "x": np.linspace(start=0, stop=size - 1, num=size),
+        },
+        dims=("y", "x"),
+    )
+    clipped = grdclip(grid=grid, below=[-1, -1], above=[1, 1])
+    clipped = grdclip(grid=clipped, below=[-0.5, -0.5], above=[0.5, 0.5])
+    assert clipped.shape == (size, size)
@@ -13,6 +13,7 @@ from unittest import mock
 
 import pytest
 from pygmt.clib.loading import (
+    _gmt_show_library,
     check_libgmt,
     clib_full_names,
     clib_names,
@@ -350,6 +351,30 @@ def test_clib_full_names_gmt_library_path_incorrect_path_included(
         assert list(lib_fullpaths) == [gmt_lib_realpath] * npath + gmt_lib_names
 
 
+def test_gmt_show_library_cached(monkeypatch, tmp_path, gmt_lib_realpath):
+    """
+    Make sure that the output of "gmt --show-library" is cached in a file.
+    """
+    cachefile = tmp_path / "pygmt" / "libgmt-path.json"
+    monkeypatch.setattr("pygmt.clib.loading._library_path_cache", lambda: cachefile)
+    gmtbin = shutil.which("gmt")
+    with mock.patch(
+        "subprocess.check_output", wraps=subprocess.check_output
+    ) as mock_sp:
+        assert str(PurePath(_gmt_show_library(gmtbin))) == gmt_lib_realpath
+        assert mock_sp.call_count == 1
+        assert cachefile.exists()
+        # The second call reads the cached library path.
+        assert str(PurePath(_gmt_show_library(gmtbin))) == gmt_lib_realpath
+        assert mock_sp.call_count == 1
+        # A broken cache file is ignored and rewritten.
+        cachefile.write_text("not a JSON file", encoding="utf-8")
+        assert str(PurePath(_gmt_show_library(gmtbin))) == gmt_lib_realpath
+        assert mock_sp.call_count == 2
+        assert str(PurePath(_gmt_show_library(gmtbin))) == gmt_lib_realpath
+        assert mock_sp.call_count == 2
+
+
 ###############################################################################
 # Test get_gmt_version
 def test_get_gmt_version():
@@ -0,0 +1,164 @@
+"""
+Test the plan_table_input function in the clib.conversion module.
+"""
+
+import logging
+
+import numpy as np
+import numpy.testing as npt
+import pandas as pd
+import pytest
+from pygmt.clib.conversion import plan_table_input, vectors_to_arrays
+
+
+def _check_columns(vectors, expected, copied):
+    """
+    A helper function to check the columns planned for virtualfile_from_vectors.
+
+    The columns must have the expected values, and must share memory with the input
+    data unless they are expected to be copied.
+    """
+    arrays = vectors_to_arrays(vectors)
+    assert all(array.flags.c_contiguous for array in arrays)
+    npt.assert_equal(arrays, expected.T)
+    assert copied == (not all(np.shares_memory(array, expected) for array in arrays))
+
+
+def test_plan_table_input_matrix_pointer(caplog):
+    """
+    Test that a C-contiguous numeric matrix is passed as a matrix.
+    """
+    data = np.arange(12.0).reshape(4, 3)
+    with caplog.at_level(logging.DEBUG, logger="pygmt.clib.conversion"):
+        kind, matrix = plan_table_input(data, kind="matrix")
+    assert kind == "matrix"
+    assert matrix is data
+    assert "(matrix pointer)" in caplog.text
+
+
+def test_plan_table_input_fortran_matrix(caplog):
+    """
+    Test that a Fortran-ordered matrix is passed as column views.
+    """
+    data = np.asfortranarray(np.arange(12.0).reshape(4, 3))
+    with caplog.at_level(logging.DEBUG, logger="pygmt.clib.conversion"):
+        kind, vectors = plan_table_input(data, kind="matrix")
+    assert kind == "vectors"
+    _check_columns(vectors, data, copied=False)
+    assert "(column views)" in caplog.text
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_plan_table_input_dataframe(order):
+    """
+    Test that a pandas.DataFrame with a single numeric block is not copied.
+    """
+    values = np.asarray(np.arange(12.0).reshape(4, 3), order=order)
+    data = pd.DataFrame(values, copy=False)
+    kind, planned = plan_table_input(data, kind="vectors")
+    if kind == "matrix":
+        assert planned.flags.c_contiguous
+        npt.assert_equal(planned, values)
+    else:
+        _check_columns(planned, data.to_numpy(), copied=False)
+
+
+def test_plan_table_input_dataframe_multiple_blocks(caplog):
+    """
+    Test that a pandas.DataFrame with a single numeric dtype, but several blocks, is
+    passed as column views instead of being copied into a matrix.
+    """
+    data = pd.DataFrame(np.arange(8.0).reshape(4, 2), columns=["x", "y"])
+    data["z"] = np.arange(4.0)  # Adds a second block.
+    with caplog.at_level(logging.DEBUG, logger="pygmt.clib.conversion"):
+        kind, vectors = plan_table_input(data, kind="vectors")
+    assert kind == "vectors"
+    for vector, (_, column) in zip(vectors, data.items(), strict=True):
+        assert np.shares_memory(np.asarray(vector), column.to_numpy())
+    assert "(column views)" in caplog.text
+
+
+def test_plan_table_input_dataframe_mixed_dtypes(caplog):
+    """
+    Test that a pandas.DataFrame with mixed dtypes is passed column by column.
+    """
+    data = pd.DataFrame({"x": [1.0, 2.0], "y": [3, 4], "text": ["a", "b"]})
+    with caplog.at_level(logging.DEBUG, logger="pygmt.clib.conversion"):
+        kind, vectors = plan_table_input(data, kind="vectors")
+    assert kind == "vectors"
+    assert len(vectors) == 3
+    assert "(column views)" in caplog.text
+
+
+def test_plan_table_input_structured_array(caplog):
+    """
+    Test that the fields of a structured array are passed as vectors.
+    """
+    data = np.array(
+        [(1.0, 2, "a"), (3.0, 4, "b")],
+        dtype=[("x", "f8"), ("y", "i4"), ("text", "U1")],
+    )
+    with caplog.at_level(logging.DEBUG, logger="pygmt.clib.conversion"):
+        kind, vectors = plan_table_input(data, kind="vectors")
+    assert kind == "vectors"
+    arrays = vectors_to_arrays(vectors)
+    npt.assert_equal(arrays[0], [1.0, 3.0])
+    npt.assert_equal(arrays[1], [2, 4])
+    npt.assert_equal(arrays[2], ["a", "b"])
+    assert "(one copy)" in caplog.text
+
+
+def test_plan_table_input_object_matrix():
+    """
+    Test that an object matrix is converted column by column.
+    """
+    data = np.array(
+        [[np.datetime64("2020-01-01"), "a"], [np.datetime64("2020-01-02"), "b"]],
+        dtype=object,
+    )
+    kind, vectors = plan_table_input(data, kind="matrix")
+    assert kind == "vectors"
+    arrays = vectors_to_arrays(vectors)
+    assert arrays[0].dtype.type == np.datetime64
+    assert arrays[1].dtype.type == np.str_
+
+
+def test_plan_table_input_list_of_records():
+    """
+    Test that a list of records is converted to columns with a single copy.
+    """
+    kind, vectors = plan_table_input([[1, 2, 3], [4, 5, 6]], kind="vectors")
+    assert kind == "vectors"
+    assert all(vector.flags.c_contiguous for vector in vectors)
+    npt.assert_equal(vectors_to_arrays(vectors), [[1, 4], [2, 5], [3, 6]])
+
+
+def test_plan_table_input_arrow_without_pyarrow(monkeypatch):
+    """
+    Test that Arrow tables (e.g., polars.DataFrame) fall back to the generic column
+    path if pyarrow is not installed.
+    """
+
+    class ArrowTable:
+        """
+        A dummy class to mimic an Arrow tabular object that doesn't need pyarrow.
+        """
+
+        schema = None
+
+        def __arrow_c_stream__(self, requested_schema=None):
+            """
+            A dummy method to mimic the Arrow PyCapsule stream interface.
+            """
+            raise NotImplementedError
+
+        def __array__(self, dtype=None, copy=None):
+            """
+            Convert the table to a 2-D numpy.ndarray.
+            """
+            return np.array([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]], dtype=dtype)
+
+    monkeypatch.setattr("pygmt.clib.conversion._HAS_PYARROW", False)
+    kind, vectors = plan_table_input(ArrowTable(), kind="vectors")
+    assert kind == "vectors"
+    npt.assert_equal(vectors_to_arrays(vectors), [[1, 2, 3], [4, 5, 6]])
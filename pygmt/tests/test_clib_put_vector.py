@@ -8,7 +8,7 @@ import itertools
 import numpy as np
 import numpy.testing as npt
 import pytest
-from pygmt import clib
+from pygmt import clib, info
 from pygmt.clib.session import DTYPES_NUMERIC
 from pygmt.exceptions import GMTCLibError, GMTTypeError, GMTValueError
 from pygmt.helpers import GMTTempFile
@@ -170,6 +170,53 @@ def test_put_vector_string_dtype():
                     npt.assert_array_equal(output["y"], expected_vectors[j])
 
 
+def test_put_vector_datetime64_dtype():
+    """
+    Passing datetime64 type vectors with various date/time units to a dataset.
+    """
+    for unit in ["D", "h", "m", "s", "ms", "us", "ns"]:
+        with clib.Session() as lib, GMTTempFile() as tmp_file:
+            dataset = lib.create_data(
+                family="GMT_IS_DATASET|GMT_VIA_VECTOR",
+                geometry="GMT_IS_POINT",
+                mode="GMT_CONTAINER_ONLY",
+                dim=[2, 3, 0, 0],  # ncolumns, nrows, dtype, unused
+            )
+            x = np.array([1.0, 2.0, 3.0])
+            timedata = np.array(
+                ["1960-02-03", "2021-02-03T04:05:06", "2262-01-01"],
+                dtype=f"datetime64[{unit}]",
+            )
+            lib.put_vector(dataset, column=0, vector=x)
+            lib.put_vector(dataset, column=1, vector=timedata)
+            lib.write_data(
+                family="GMT_IS_VECTOR",
+                geometry="GMT_IS_POINT",
+                mode="GMT_WRITE_SET",
+                wesn=[0] * 6,
+                output=tmp_file.name,
+                data=dataset,
+            )
+            output = np.loadtxt(tmp_file.name, dtype=str, usecols=1)
+            npt.assert_equal(
+                actual=output.astype(f"datetime64[{unit}]"),
+                desired=timedata.astype("datetime64[s]").astype(f"datetime64[{unit}]"),
+            )
+
+
+@pytest.mark.benchmark
+def test_put_vector_datetime64_large():
+    """
+    Benchmark passing 10 million datetimes to GMT.
+    """
+    start = np.datetime64("2000-01-01T00:00:00")
+    times = np.arange(start, start + 10_000_000)
+    output = info(data=times, per_column=True)
+    npt.assert_equal(
+        actual=output, desired=["2000-01-01T00:00:00", "2000-04-25T17:46:39"]
+    )
+
+
 def test_put_vector_timedelta64_dtype():
     """
     Passing timedelta64 type vectors with various date/time units to a dataset.
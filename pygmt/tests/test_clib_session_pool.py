@@ -0,0 +1,173 @@
+"""
+Test the pool of reusable GMT API sessions.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from pygmt import blockmean, info, select
+from pygmt.clib import Session, session_pool
+from pygmt.exceptions import GMTCLibError, GMTValueError
+from pygmt.session_management import _begin_global_session
+
+
+def test_session_pool_reuses_session():
+    """
+    Check that sessions are reused within the session_pool context manager.
+    """
+    with session_pool(size=1):
+        with Session() as lib:
+            pointer = lib.session_pointer
+        with Session() as lib:
+            assert lib.session_pointer == pointer
+    # Sessions are created and destroyed as usual outside of the pool.
+    with Session() as lib:
+        assert lib.session_pointer is not None
+
+
+def test_session_pool_exhausted():
+    """
+    Check that a regular session is created if all pooled sessions are in use.
+    """
+    with session_pool(size=1):
+        with Session() as lib1, Session() as lib2:
+            assert lib1.session_pointer != lib2.session_pointer
+            assert getattr(lib1, "_pooled", None) is not None
+            assert getattr(lib2, "_pooled", None) is None
+
+
+def test_session_pool_clears_error_log():
+    """
+    Check that error messages of a previous use don't leak into the next one.
+    """
+    with session_pool(size=1):
+        with Session() as lib:
+            with pytest.raises(GMTCLibError):
+                lib.call_module("info", ["nonexistent-file.txt"])
+            pointer = lib.session_pointer
+            assert lib._error_message != ""
+        with Session() as lib:
+            assert lib.session_pointer == pointer
+            assert lib._error_message == ""
+
+
+def test_session_pool_discards_session_on_error():
+    """
+    Check that a session is not reused if an exception was raised while borrowed.
+    """
+    with session_pool(size=1):
+        with Session() as lib:
+            pooled = lib._pooled
+        lib = Session()
+        with pytest.raises(GMTCLibError), lib:
+            lib.call_module("info", ["nonexistent-file.txt"])
+        with Session() as lib:
+            assert lib._pooled is not pooled
+
+
+def test_session_pool_wrappers():
+    """
+    Check that the module wrappers work with pooled sessions.
+    """
+    data = np.array([[1.0, 2.0], [3.0, 4.0]])
+    with session_pool(size=2):
+        results = [info(data, per_column=True) for _ in range(5)]
+    for result in results:
+        np.testing.assert_allclose(result, [1, 3, 2, 4])
+
+
+def test_session_pool_frees_outputs():
+    """
+    Check that the outputs read from virtual files are freed with the session's data
+    containers when returning the session to the pool.
+    """
+    with session_pool(size=1):
+        with Session() as lib:
+            with lib.virtualfile_out(kind="dataset") as vouttbl:
+                lib.call_module("read", ["@tut_ship.xyz", vouttbl, "-Td"])
+                pointer = lib.read_virtualfile(vouttbl)
+            assert pointer in lib._containers
+            pooled = lib._pooled
+        assert lib._containers == []
+        with Session() as lib:
+            assert lib._pooled is pooled
+
+
+def test_session_pool_reuses_session_for_table_outputs():
+    """
+    Check that wrappers reading their outputs after closing the output virtual file
+    (e.g., select and blockmean) give the session back to the pool for reuse.
+    """
+    data = np.array([[1.0, 2.0, 3.0], [2.0, 3.0, 4.0], [4.0, 4.0, 5.0]])
+    with session_pool(size=1):
+        with Session() as lib:
+            pooled, pointer = lib._pooled, lib.session_pointer
+        for _ in range(3):
+            select(data, region=[0, 3, 0, 3])
+            blockmean(data, spacing=1, region=[0, 5, 0, 5])
+        with Session() as lib:
+            assert lib._pooled is pooled
+            assert lib.session_pointer == pointer
+
+
+def test_session_pool_datetime_then_numeric():
+    """
+    Check that numeric input isn't read as absolute times after datetime input was
+    passed through the same pool.
+    """
+    times = pd.DataFrame(
+        {"time": pd.date_range("2020-01-01", periods=2), "y": [3.0, 4.0]}
+    )
+    data = np.array([[1.0, 2.0], [3.0, 4.0]])
+    with session_pool(size=1):
+        with Session() as lib:
+            pooled = lib._pooled
+            with lib.virtualfile_in(data=times) as vintbl:
+                lib.call_module("info", [vintbl, "->/dev/null"])
+        # The session is discarded since column 0 is now of absolute time type.
+        with Session() as lib:
+            assert lib._pooled is not pooled
+        result = info(data, per_column=True)
+    np.testing.assert_allclose(result, [1, 3, 2, 4])
+
+
+def test_session_pool_drops_sessions_of_other_mode(monkeypatch):
+    """
+    Check that sessions created before the global modern mode session started, which
+    ignore gmt.history, are not reused after it.
+    """
+    _begin_global_session()  # Make sure the global session has been started
+    with session_pool(size=1):
+        with monkeypatch.context() as mpatch:
+            mpatch.setattr(Session, "_modern_mode", False)
+            with Session() as lib:
+                classic = lib._pooled
+                assert classic._nohistory
+        with Session() as lib:
+            assert lib._pooled is not classic
+            assert not lib._pooled._nohistory
+
+
+def test_session_pool_invalid_size():
+    """
+    Check that session_pool raises an exception for an invalid pool size.
+    """
+    with pytest.raises(GMTValueError):
+        with session_pool(size=0):
+            pass
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("pooled", [False, True])
+def test_session_pool_overhead(pooled):
+    """
+    Benchmark the per-call overhead of calling a wrapper many times on small inputs.
+    """
+    data = np.array([[1.0, 2.0], [3.0, 4.0]])
+    if pooled:
+        with session_pool(size=1):
+            for _ in range(100):
+                info(data, per_column=True)
+    else:
+        for _ in range(100):
+            info(data, per_column=True)
@@ -589,6 +589,40 @@ def test_to_numpy_pyarrow_numeric_with_na(dtype, expected_dtype):
     npt.assert_array_equal(result, array)
 
 
+@pytest.mark.skipif(not _HAS_PYARROW, reason="pyarrow is not installed")
+def test_to_numpy_pyarrow_numeric_no_copy():
+    """
+    Test that the _to_numpy function doesn't copy single-chunk numeric PyArrow arrays
+    without nulls.
+    """
+    array = pa.array(np.arange(10, dtype=np.float64))
+    buffer = np.frombuffer(array.buffers()[1], dtype=np.float64)
+    for data in (
+        array,
+        array[2:8],
+        pa.chunked_array([array]),
+        pd.Series(pd.arrays.ArrowExtensionArray(array)),
+    ):
+        result = _to_numpy(data)
+        _check_result(result, np.float64)
+        assert np.shares_memory(result, buffer)
+        npt.assert_array_equal(result, data)
+
+
+@pytest.mark.skipif(not _HAS_PYARROW, reason="pyarrow is not installed")
+def test_to_numpy_pyarrow_chunked_array():
+    """
+    Test the _to_numpy function with multi-chunk PyArrow arrays.
+    """
+    result = _to_numpy(pa.chunked_array([[1, 2], [3, 4, 5]], type=pa.int32()))
+    _check_result(result, np.int32)
+    npt.assert_array_equal(result, [1, 2, 3, 4, 5])
+
+    result = _to_numpy(pa.chunked_array([[1, None], [3, 4, 5]], type=pa.int32()))
+    _check_result(result, np.float64)
+    npt.assert_array_equal(result, [1, np.nan, 3, 4, 5])
+
+
 @pytest.mark.skipif(not _HAS_PYARROW, reason="pyarrow is not installed")
 @pytest.mark.parametrize(
     "dtype",
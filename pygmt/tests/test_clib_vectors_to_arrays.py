@@ -69,6 +69,19 @@ def test_vectors_to_arrays_not_c_contiguous():
     _check_arrays(arrays)
 
 
+def test_vectors_to_arrays_memmap(tmp_path):
+    """
+    Test that the vectors_to_arrays function doesn't copy memory-mapped columns.
+    """
+    fname = tmp_path / "columns.npy"
+    np.save(fname, np.asfortranarray(np.arange(30, dtype=np.float32).reshape(10, 3)))
+    data = np.load(fname, mmap_mode="r")
+    arrays = vectors_to_arrays(data.T)
+    _check_arrays(arrays)
+    assert all(np.shares_memory(array, data) for array in arrays)
+    npt.assert_equal(arrays, data.T)
+
+
 @pytest.mark.skipif(not _HAS_PYARROW, reason="pyarrow is not installed.")
 def test_vectors_to_arrays_pyarrow_datetime():
     """
@@ -0,0 +1,116 @@
+"""
+Test the Session.virtualfile_from_image method.
+"""
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import xarray as xr
+from pygmt.clib import Session
+from pygmt.exceptions import GMTTypeError
+
+
+def _make_image(n_rows=90, n_columns=180, n_bands=3, descending_y=True):
+    """
+    Create a uint8 image on a 2-degree global grid.
+    """
+    rng = np.random.default_rng(seed=42)
+    y = np.arange(-89, 90, 2.0)[:n_rows]
+    image = xr.DataArray(
+        data=rng.integers(0, 256, size=(n_bands, n_rows, n_columns), dtype=np.uint8),
+        coords={
+            "band": np.arange(1, n_bands + 1, dtype=np.uint8),
+            "y": y[::-1] if descending_y else y,
+            "x": np.arange(-179, 180, 2.0)[:n_columns],
+        },
+        dims=("band", "y", "x"),
+    )
+    image.gmt.registration = 1
+    image.gmt.gtype = 1
+    return image
+
+
+def _roundtrip(image):
+    """
+    Pass an image to GMT through a virtual file and read it back.
+    """
+    with Session() as lib:
+        with (
+            lib.virtualfile_in(check_kind="raster", data=image) as vinimg,
+            lib.virtualfile_out(kind="image") as voutimg,
+        ):
+            lib.call_module("read", [vinimg, voutimg, "-Ti"])
+            return lib.virtualfile_to_raster(vfname=voutimg, kind="image")
+
+
+@pytest.mark.parametrize("descending_y", [True, False])
+def test_virtualfile_from_image(descending_y):
+    """
+    Check that an image goes through a virtual file without changes.
+    """
+    image = _make_image(descending_y=descending_y)
+    result = _roundtrip(image)
+    assert result.sizes == {"band": 3, "y": 90, "x": 180}
+    npt.assert_allclose(result.x, image.x)
+    npt.assert_allclose(result.y, image.y.sortby(image.y, ascending=False))
+    npt.assert_equal(result.to_numpy(), image.sortby("y", ascending=False).to_numpy())
+    assert result.to_numpy().flags.c_contiguous
+    assert result.gmt.registration == 1
+    assert result.gmt.gtype == 1
+
+
+@pytest.mark.parametrize("n_bands", [1, 2, 4])
+def test_virtualfile_from_image_bands(n_bands):
+    """
+    Check that images with other numbers of bands are returned band-first.
+    """
+    image = _make_image(n_bands=n_bands)
+    result = _roundtrip(image)
+    assert result.dims == ("band", "y", "x")
+    npt.assert_equal(result.band, np.arange(1, n_bands + 1))
+    assert result.to_numpy().flags.c_contiguous
+    npt.assert_equal(result.to_numpy(), image.to_numpy())
+
+
+@pytest.mark.parametrize("dtype", [np.uint16, np.float32])
+def test_virtualfile_from_image_non_uint8(dtype):
+    """
+    Check that images of other types than uint8 are rejected instead of being
+    reinterpreted as bytes.
+    """
+    image = _make_image(n_rows=4, n_columns=6).astype(dtype)
+    with Session() as lib:
+        with pytest.raises(GMTTypeError):
+            with lib.virtualfile_from_image(image):
+                pass
+
+
+def test_virtualfile_from_image_input_unchanged():
+    """
+    Check that the input image is not changed by passing it to GMT.
+    """
+    image = _make_image()
+    expected = image.copy()
+    _roundtrip(image)
+    xr.testing.assert_identical(image, expected)
+
+
+@pytest.mark.benchmark
+def test_virtualfile_from_image_large():
+    """
+    Benchmark passing a large image to GMT through a virtual file.
+    """
+    rng = np.random.default_rng(seed=42)
+    image = xr.DataArray(
+        data=rng.integers(0, 256, size=(3, 2000, 4000), dtype=np.uint8),
+        coords={
+            "band": np.array([1, 2, 3], dtype=np.uint8),
+            "y": np.linspace(89.955, -89.955, 2000),
+            "x": np.linspace(-179.955, 179.955, 4000),
+        },
+        dims=("band", "y", "x"),
+    )
+    image.gmt.registration = 1
+    image.gmt.gtype = 1
+    result = _roundtrip(image)
+    npt.assert_equal(result.to_numpy(), image.to_numpy())
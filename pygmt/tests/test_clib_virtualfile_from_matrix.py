@@ -53,3 +53,40 @@ def test_virtualfile_from_matrix_slice(dtypes):
             bounds = "\t".join([f"<{col.min():.0f}/{col.max():.0f}>" for col in data.T])
             expected = f"<matrix memory>: N = {rows}\t{bounds}\n"
             assert output == expected
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+def test_virtualfile_from_matrix_memmap(tmp_path, order):
+    """
+    Test passing a memory-mapped matrix in C or Fortran order to a virtual file.
+    """
+    fname = tmp_path / "matrix.npy"
+    data = np.arange(60, dtype=np.float32).reshape(20, 3)
+    np.save(fname, np.asarray(data, order=order))
+    matrix = np.load(fname, mmap_mode="r")
+    assert matrix.flags.c_contiguous == (order == "C")
+    with clib.Session() as lib:
+        with lib.virtualfile_in(data=matrix) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("info", [vfile, "-C", f"->{outfile.name}"])
+                output = outfile.read(keep_tabs=True)
+    assert output == "0\t57\t1\t58\t2\t59\n"
+
+
+@pytest.mark.benchmark
+def test_virtualfile_from_matrix_memmap_large(tmp_path):
+    """
+    Benchmark passing a large Fortran-ordered memory-mapped matrix to GMT.
+    """
+    fname = tmp_path / "points.dat"
+    matrix = np.memmap(
+        fname, dtype=np.float32, mode="w+", shape=(10_000_000, 3), order="F"
+    )
+    matrix[:] = 1.0
+    matrix.flush()
+    with clib.Session() as lib:
+        with lib.virtualfile_from_matrix(matrix) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("info", [vfile, "-C", f"->{outfile.name}"])
+                output = outfile.read(keep_tabs=True)
+    assert output == "1\t1\t1\t1\t1\t1\n"
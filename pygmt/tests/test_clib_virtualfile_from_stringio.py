@@ -3,12 +3,15 @@ Test the Session.virtualfile_from_stringio method.
 """
 
 import io
+import mmap
 
 import numpy as np
+import pytest
 from pygmt import clib
+from pygmt.clib.conversion import text_to_segments
 
 
-def _stringio_to_dataset(data: io.StringIO):
+def _stringio_to_dataset(data: io.StringIO | io.BytesIO | mmap.mmap):
     """
     A helper function for check the virtualfile_from_stringio method.
 
@@ -93,3 +96,63 @@ def test_multiple_segments():
         "6 7 8   9  FG\n"
     )
     assert _stringio_to_dataset(data) == expected
+
+
+def test_empty_segments_and_crlf():
+    """
+    Test the virtualfile_from_stringio method with empty segments and CRLF endings.
+    """
+    data = io.StringIO(
+        "> Dropped\r\n> Segment 1\r\nA B\r\n# Comment\r\n>\r\n> Segment 2\r\nC"
+    )
+    expected = "> Segment 1\nA B\n> Segment 2\nC\n"
+    assert _stringio_to_dataset(data) == expected
+
+
+def test_text_to_segments_embedded_cr():
+    """
+    Test that only the CR of CRLF line endings is removed, not a CR within a line.
+    """
+    data = io.StringIO("> Segment\r\nA\rB C\r\nD\n")
+    segments = text_to_segments(data)
+    assert [(header, [s.decode() for s in text]) for header, text in segments] == [
+        ("Segment", ["A\rB C", "D"])
+    ]
+
+
+def test_bytesio():
+    """
+    Test the virtualfile_from_stringio method with a BytesIO object.
+    """
+    data = io.BytesIO("> Segment 1\nH 24p Légende\nN 2\n".encode())
+    assert _stringio_to_dataset(data) == "> Segment 1\nH 24p Légende\nN 2\n"
+    # The BytesIO object can still be written after passing it to GMT.
+    data.write(b"more text")
+
+
+def test_mmap(tmp_path):
+    """
+    Test the virtualfile_from_stringio method with a memory-mapped file.
+    """
+    fname = tmp_path / "legend.txt"
+    fname.write_text("# Comment\nH 24p Legend\nN 2\n", encoding="utf-8")
+    with (
+        fname.open(mode="rb") as fp,
+        mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        assert _stringio_to_dataset(data) == ">\nH 24p Legend\nN 2\n"
+
+
+@pytest.mark.benchmark
+def test_many_lines():
+    """
+    Benchmark the virtualfile_from_stringio method with many lines.
+    """
+    lines = [
+        "> Segment" if i % 1000 == 0 else f"S 0.1i c 0.15i p300/12 0.25p 0.3i Label {i}"
+        for i in range(200_000)
+    ]
+    data = io.StringIO("\n".join(lines) + "\n")
+    output = _stringio_to_dataset(data).splitlines()
+    assert len(output) == len(lines)
+    assert output[-1] == lines[-1]
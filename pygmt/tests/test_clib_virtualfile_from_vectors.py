@@ -117,6 +117,45 @@ def test_virtualfile_from_vectors_two_string_or_object_columns(dtype):
         assert output == expected
 
 
+def test_virtualfile_from_vectors_three_unicode_string_columns():
+    """
+    Test passing in three columns of non-ASCII strings into virtual file dataset.
+    """
+    x = np.arange(3, dtype=np.int32)
+    y = np.arange(3, 6, dtype=np.int32)
+    strings1 = np.array(["ä", "bcd", "ñandú"])
+    strings2 = np.array(["β", "γδ", "x"])
+    strings3 = np.array(["東京", "z", "°C"])
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors(
+            (x, y, strings1, strings2, strings3)
+        ) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("convert", [vfile, f"->{outfile.name}"])
+                output = outfile.read(keep_tabs=True)
+    expected = "".join(
+        f"{h}\t{i}\t{j} {k} {m}\n"
+        for h, i, j, k, m in zip(x, y, strings1, strings2, strings3, strict=True)
+    )
+    assert output == expected
+
+
+@pytest.mark.benchmark
+def test_virtualfile_from_vectors_many_strings():
+    """
+    Benchmark passing in one million rows with two string columns.
+    """
+    size = 1_000_000
+    x = np.arange(size, dtype=np.float64)
+    labels = np.char.add("label-", x.astype(np.int64).astype(str))
+    with clib.Session() as lib:
+        with lib.virtualfile_from_vectors((x, x, labels, labels)) as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("info", [vfile, "-C", f"->{outfile.name}"])
+                output = outfile.read(keep_tabs=True)
+    assert output == f"0\t{size - 1}\t0\t{size - 1}\n"
+
+
 def test_virtualfile_from_vectors_transpose(dtypes):
     """
     Test transforming matrix columns to virtual file dataset.
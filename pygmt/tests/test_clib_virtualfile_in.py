@@ -14,6 +14,7 @@ from pygmt import clib
 from pygmt.clib import __gmt_version__
 from pygmt.exceptions import GMTInvalidInput
 from pygmt.helpers import GMTTempFile, data_kind
+from pygmt.helpers.testing import skip_if_no
 
 POINTS_DATA = Path(__file__).parent / "data" / "points.txt"
 
@@ -126,3 +127,29 @@ def test_virtualfile_in_matrix_string_dtype():
                 assert output == "347.5 348.5 -30.5 -30\n"
                 # Should check that lib.virtualfile_from_vectors is called once,
                 # not lib.virtualfile_from_matrix, but it's technically complicated.
+
+
+@pytest.mark.parametrize("table_type", ["table", "record_batch"])
+@skip_if_no(package="pyarrow")
+def test_virtualfile_in_arrow_table(table_type):
+    """
+    Test passing a pyarrow.Table or pyarrow.RecordBatch with multiple chunks, nulls and
+    string columns.
+    """
+    import pyarrow as pa  # ruff: ignore[import-outside-top-level]
+
+    columns = {
+        "x": pa.chunked_array([[1.0, 2.0], [3.0, 4.0]]),
+        "y": pa.chunked_array([[5, None, 7, 8]]),
+        "z": pa.chunked_array([[9, 10, 11, 12]], type=pa.int32()),
+        "label": pa.chunked_array([["a", "b", "c", "d"]]),
+    }
+    data = pa.table(columns)
+    if table_type == "record_batch":
+        data = data.combine_chunks().to_batches()[0]
+    with clib.Session() as lib:
+        with lib.virtualfile_in(data=data, mincols=3, check_kind="vector") as vfile:
+            with GMTTempFile() as outfile:
+                lib.call_module("convert", [vfile, f"->{outfile.name}"])
+                output = outfile.read(keep_tabs=True)
+    assert output == "1\t5\t9\ta\n2\tNaN\t10\tb\n3\t7\t11\tc\n4\t8\t12\td\n"
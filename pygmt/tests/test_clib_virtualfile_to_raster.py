@@ -0,0 +1,66 @@
+"""
+Test the Session.virtualfile_to_raster method.
+"""
+
+import gc
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import xarray as xr
+from pygmt.clib import Session
+from pygmt.datatypes.buffer import _can_adopt
+from pygmt.helpers.testing import load_static_earth_relief
+
+
+def _grdmath_grid(region="0/10/0/10", spacing="1"):
+    """
+    Create a grid with values equal to the x coordinates using grdmath.
+    """
+    with Session() as lib:
+        with lib.virtualfile_out(kind="grid") as voutgrd:
+            lib.call_module(
+                "grdmath", [f"-R{region}", f"-I{spacing}", "X", "=", voutgrd]
+            )
+            return lib.virtualfile_to_raster(vfname=voutgrd)
+
+
+@pytest.mark.skipif(not _can_adopt(), reason="GMT memory can't be adopted.")
+def test_virtualfile_to_raster_zero_copy():
+    """
+    Check that the grid data is handed over to the DataArray without copying it.
+    """
+    grid = _grdmath_grid()
+    gc.collect()  # The GMT session is gone, but the data must be still valid
+    assert isinstance(grid, xr.DataArray)
+    assert grid.dtype == np.float32
+    assert not grid.to_numpy().flags.owndata
+    npt.assert_allclose(grid.to_numpy(), np.tile(np.arange(11), (11, 1)))
+
+
+def test_virtualfile_to_raster_referenced_input():
+    """
+    Check that the output of a module that edits an input grid in place is correct and
+    that the input grid is not affected.
+    """
+    grid = load_static_earth_relief().astype(np.float32)
+    expected = grid.copy()
+    with Session() as lib:
+        with (
+            lib.virtualfile_in(check_kind="raster", data=grid) as vingrd,
+            lib.virtualfile_out(kind="grid") as voutgrd,
+        ):
+            lib.call_module("grdedit", [vingrd, "-D+zelevation", f"-G{voutgrd}"])
+            result = lib.virtualfile_to_raster(vfname=voutgrd)
+    gc.collect()
+    xr.testing.assert_equal(grid, expected)
+    npt.assert_allclose(result.to_numpy(), expected.to_numpy())
+
+
+@pytest.mark.benchmark
+def test_virtualfile_to_raster_large_grid():
+    """
+    Benchmark converting a large grid output to an xarray.DataArray.
+    """
+    grid = _grdmath_grid(region="0/40/0/40", spacing="0.01")
+    assert grid.shape == (4001, 4001)
@@ -4,12 +4,14 @@ Tests for GMT_DATASET data type.
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 from packaging.version import Version
 from pygmt import which
 from pygmt.clib import Session
 from pygmt.helpers import GMTTempFile
+from pygmt.helpers.testing import skip_if_no
 
 
 def dataframe_from_pandas(filepath_or_buffer, sep=r"\s+", comment="#", header=None):
@@ -146,6 +148,106 @@ def test_dataset_header_too_many_names():
         pd.testing.assert_frame_equal(df, expected_df)
 
 
+def test_dataset_segment_ids():
+    """
+    Test adding the segment index of each row as a column.
+    """
+    with GMTTempFile(suffix=".txt") as tmpfile:
+        with Path(tmpfile.name).open(mode="w", encoding="utf-8") as fp:
+            print(">", file=fp)
+            print("1.0 2.0", file=fp)
+            print("3.0 4.0", file=fp)
+            print(">", file=fp)
+            print("5.0 6.0", file=fp)
+
+        df = dataframe_from_gmt(tmpfile.name, column_names=["x", "y"], segment_ids=True)
+        assert df.columns.tolist() == ["x", "y", "segment_id"]
+        assert df["x"].tolist() == [1.0, 3.0, 5.0]
+        assert df["segment_id"].tolist() == [0, 0, 1]
+
+
+@pytest.mark.benchmark
+def test_dataset_many_segments():
+    """
+    Benchmark converting a dataset with 100,000 segments to a pandas.DataFrame.
+    """
+    nsegments, nrows = 100_000, 3
+    data = np.arange(nsegments * nrows * 2, dtype=np.float64).reshape(-1, 2)
+    with GMTTempFile(suffix=".txt") as tmpfile:
+        with Path(tmpfile.name).open(mode="w", encoding="utf-8") as fp:
+            for segment in data.reshape(nsegments, nrows, 2):
+                print(">", file=fp)
+                np.savetxt(fp, segment, fmt="%.1f")
+
+        df = dataframe_from_gmt(tmpfile.name, segment_ids=True)
+        assert df.shape == (nsegments * nrows, 3)
+        np.testing.assert_equal(df[[0, 1]].to_numpy(), data)
+        np.testing.assert_equal(
+            df["segment_id"].to_numpy(), np.repeat(np.arange(nsegments), nrows)
+        )
+
+
+@skip_if_no(package="pyarrow")
+def test_dataset_to_arrow():
+    """
+    Test converting a multi-segment dataset with trailing text to a pyarrow.Table.
+    """
+    with GMTTempFile(suffix=".txt") as tmpfile:
+        with Path(tmpfile.name).open(mode="w", encoding="utf-8") as fp:
+            print("# lon lat z text", file=fp)
+            print(">", file=fp)
+            print("1.0 2.0 3.0 TEXT1 TEXT23", file=fp)
+            print("4.0 5.0 6.0 TEXT4 TEXT567", file=fp)
+            print(">", file=fp)
+            print("7.0 8.0 9.0 TEXT8 TEXT90", file=fp)
+
+        table = dataframe_from_gmt(tmpfile.name, output_type="arrow", header=0)
+        df = dataframe_from_gmt(tmpfile.name, header=0)
+        assert table.column_names == ["lon", "lat", "z", "text"]
+        assert str(table.schema.field("text").type) == "string"
+        assert table.to_pydict() == df.to_dict(orient="list")
+
+
+@skip_if_no(package="pyarrow")
+def test_dataset_to_arrow_single_segment():
+    """
+    Test converting a single-segment numeric dataset to a pyarrow.Table.
+    """
+    data = np.arange(30, dtype=np.float64).reshape(10, 3)
+    with GMTTempFile(suffix=".txt") as tmpfile:
+        np.savetxt(tmpfile.name, data, fmt="%.1f")
+        table = dataframe_from_gmt(
+            tmpfile.name,
+            output_type="arrow",
+            column_names=["x", "y", "z"],
+            dtype={"z": np.float32},
+        )
+    assert table.column_names == ["x", "y", "z"]
+    assert str(table.schema.field("z").type) == "float"
+    np.testing.assert_equal(np.column_stack(table.columns), data)
+
+
+@skip_if_no(package="polars")
+def test_dataset_to_polars():
+    """
+    Test converting a dataset to a polars.DataFrame.
+    """
+    with GMTTempFile(suffix=".txt") as tmpfile:
+        with Path(tmpfile.name).open(mode="w", encoding="utf-8") as fp:
+            print("1.0 2.0 TEXT1", file=fp)
+            print("3.0 4.0 TEXT2", file=fp)
+
+        df = dataframe_from_gmt(
+            tmpfile.name, output_type="polars", column_names=["x", "y", "text"]
+        )
+    assert df.columns == ["x", "y", "text"]
+    assert df.to_dict(as_series=False) == {
+        "x": [1.0, 3.0],
+        "y": [2.0, 4.0],
+        "text": ["TEXT1", "TEXT2"],
+    }
+
+
 def test_dataset_to_strings_with_none_values():
     """
     Test that None values in the trailing text doesn't raise an exception.
@@ -77,6 +77,59 @@ def test_figure_repr():
     assert repr_html.endswith('" width="500px">')
 
 
+def test_figure_repr_cached():
+    """
+    Make sure that previews are rendered once until the figure is modified.
+    """
+    fig = Figure()
+    fig.basemap(region=[0, 1, 2, 3], projection="X4c", frame=True)
+    with patch.object(fig, "savefig", wraps=fig.savefig) as savefig:
+        repr_png = fig._repr_png_()
+        assert fig._repr_png_() == repr_png
+        assert savefig.call_count == 1
+        # The HTML preview uses another resolution, rendered once too.
+        repr_html = fig._repr_html_()
+        assert fig._repr_html_() == repr_html
+        assert savefig.call_count == 2
+        # Plotting on the figure invalidates the previews.
+        fig.plot(x=[0.5], y=[2.5], style="c0.2c", fill="red")
+        assert fig._repr_png_() != repr_png
+        assert savefig.call_count == 3
+        # The previews of the earlier revision are removed.
+        assert len(list(Path(fig._preview_dir.name).iterdir())) == 1
+
+
+def test_figure_repr_mimebundle():
+    """
+    Make sure that the PNG and HTML previews for IPython are rendered only once.
+    """
+    fig = Figure()
+    fig.basemap(region=[0, 1, 2, 3], projection="X4c", frame=True)
+    with patch.object(fig, "savefig", wraps=fig.savefig) as savefig:
+        data, metadata = fig._repr_mimebundle_()
+        assert savefig.call_count == 1
+    assert data["image/png"].hex().startswith("89504e470d0a1a0a")
+    assert data["text/html"].startswith('<img src="data:image/png;base64,')
+    assert metadata == {"image/png": {"width": 500}}
+
+
+def test_figure_revision():
+    """
+    Make sure that plotting methods bump the revision of the figure.
+    """
+    fig = Figure()
+    assert fig._revision == 0
+    fig.basemap(region=[0, 1, 2, 3], projection="X4c", frame=True)
+    assert fig._revision == 1
+    fig.psconvert(prefix="test_figure_revision", fmt="g", dpi=30)
+    Path("test_figure_revision.png").unlink()
+    assert fig._revision == 1
+    with fig.inset(position="jTR+w2c", box=True):
+        revision = fig._revision
+        assert revision > 1
+    assert fig._revision > revision
+
+
 def test_figure_savefig_exists():
     """
     Make sure the saved figure has the right name.
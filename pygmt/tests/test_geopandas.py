@@ -7,6 +7,7 @@ import numpy.testing as npt
 import pandas as pd
 import pytest
 from pygmt import Figure, info, makecpt, which
+from pygmt.clib import Session
 from pygmt.helpers import data_kind
 from pygmt.helpers.testing import skip_if_no
 from pygmt.params import Axis, Frame
@@ -92,6 +93,62 @@ def test_geopandas_info_shapely(gdf, geomtype, desired):
     npt.assert_allclose(actual=output, desired=desired)
 
 
+def test_geopandas_virtualfile_geometry_only():
+    """
+    Check that the geometries of a geopandas.GeoDataFrame are stored in memory as one
+    segment per polygon part, with the fill values as the segment z-values.
+    """
+    gdf = geopandas.GeoDataFrame(
+        {"value": [1.5, 2.5]},
+        geometry=[
+            shapely.geometry.MultiPolygon(
+                [
+                    shapely.geometry.box(0, 0, 1, 1),
+                    shapely.geometry.box(2, 2, 3, 3),
+                ]
+            ),
+            shapely.geometry.box(5, 5, 7, 6),
+        ],
+    )
+    with Session() as lib:
+        with (
+            lib.virtualfile_in(
+                check_kind="vector", data=gdf, geometry_only=True
+            ) as vin,
+            lib.virtualfile_out(kind="dataset") as vout,
+        ):
+            lib.call_module("convert", [vin, f"->{vout}"])
+            output = lib.virtualfile_to_dataset(vfname=vout, output_type="segments")
+    npt.assert_equal(output.offsets, [0, 5, 10, 15])
+    npt.assert_allclose(output.data.iloc[10:15].min(), [5.0, 5.0])
+    npt.assert_allclose(output.data.iloc[10:15].max(), [7.0, 6.0])
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("geometry_only", [True, False])
+def test_geopandas_virtualfile_many_polygons(geometry_only):
+    """
+    Benchmark passing a geopandas.GeoDataFrame with many polygons to GMT in memory
+    against writing a temporary OGR_GMT file.
+    """
+    x, y = np.meshgrid(np.arange(100), np.arange(100))
+    gdf = geopandas.GeoDataFrame(
+        {"value": np.arange(x.size)},
+        geometry=shapely.box(x.ravel(), y.ravel(), x.ravel() + 0.5, y.ravel() + 0.5),
+    )
+    with Session() as lib:
+        with (
+            lib.virtualfile_in(
+                check_kind="vector", data=gdf, geometry_only=geometry_only
+            ) as vin,
+            lib.virtualfile_out(kind="dataset") as vout,
+        ):
+            lib.call_module("convert", [vin, f"->{vout}"])
+            output = lib.virtualfile_to_dataset(vfname=vout, output_type="segments")
+    assert len(output.offsets) == x.size + 1
+    npt.assert_allclose(output.data.max(), [99.5, 99.5])
+
+
 @pytest.mark.mpl_image_compare
 def test_geopandas_plot_default_square():
     """
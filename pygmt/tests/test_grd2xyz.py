@@ -7,7 +7,7 @@ import pandas as pd
 import pytest
 from pygmt import grd2xyz
 from pygmt.exceptions import GMTValueError
-from pygmt.helpers.testing import load_static_earth_relief
+from pygmt.helpers.testing import load_static_earth_relief, skip_if_no
 
 
 @pytest.fixture(scope="module", name="grid")
@@ -34,6 +34,17 @@ def test_grd2xyz(grid):
     np.testing.assert_allclose(orig_val, xyz_val)
 
 
+@skip_if_no(package="pyarrow")
+def test_grd2xyz_arrow(grid):
+    """
+    Test grd2xyz with the arrow output type.
+    """
+    table = grd2xyz(grid=grid, output_type="arrow")
+    assert table.column_names == ["lon", "lat", "z"]
+    assert table.num_rows == 112
+    pd.testing.assert_frame_equal(table.to_pandas(), grd2xyz(grid=grid))
+
+
 def test_grd2xyz_pandas_output_with_o(grid):
     """
     Test that grd2xyz fails when outcols is set and output_type is set to 'pandas'.
@@ -11,7 +11,7 @@ import xarray as xr
 from pygmt import grdclip
 from pygmt.datasets import load_earth_mask
 from pygmt.enums import GridRegistration, GridType
-from pygmt.exceptions import GMTParameterError
+from pygmt.exceptions import GMTParameterError, GMTValueError
 from pygmt.helpers import GMTTempFile
 from pygmt.helpers.testing import load_static_earth_relief
 
@@ -110,6 +110,45 @@ def test_grdclip_between_repeated():
     npt.assert_array_equal(np.unique(result.data), [0, 1, 2, 3])
 
 
+@pytest.mark.parametrize("out_dtype", [None, "float32", "float64", "int16"])
+def test_grdclip_out_dtype(grid, out_dtype):
+    """
+    Test the out_dtype parameter for grdclip with an int16 input grid.
+    """
+    dem = grid.astype(np.int16)
+    result = grdclip(grid=dem, below=[550, -1000], out_dtype=out_dtype)
+    assert result.dtype == np.dtype(out_dtype or np.float32)
+    expected = np.where(dem < 550, -1000, dem)
+    npt.assert_array_equal(result.to_numpy(), expected)
+
+
+def test_grdclip_out_dtype_nan(grid):
+    """
+    Test that NaN nodes can't be converted to an integer out_dtype.
+    """
+    with pytest.raises(GMTValueError, match="Fill the NaN nodes"):
+        grdclip(grid=grid, below=[550, np.nan], out_dtype=np.int16)
+
+
+@pytest.mark.benchmark
+def test_grdclip_out_dtype_large_int16():
+    """
+    Benchmark an int16 grid passing through grdclip and back without widening.
+    """
+    size = 4000
+    dem = xr.DataArray(
+        data=np.arange(size * size, dtype=np.int32).reshape(size, size) % 9000,
+        coords={
+            "lat": np.linspace(-89.5, 89.5, size),
+            "lon": np.linspace(0, 359, size),
+        },
+        dims=("lat", "lon"),
+    ).astype(np.int16)
+    result = grdclip(grid=dem, below=[0, 0], out_dtype=np.int16)
+    assert result.dtype == np.int16
+    npt.assert_array_equal(result.to_numpy(), dem.to_numpy())
+
+
 def test_grdclip_missing_required_parameter(grid):
     """
     Test that grdclip raises GMTParameterError if the clipping parameters are missing.
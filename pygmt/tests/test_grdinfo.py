@@ -4,7 +4,7 @@ Test pygmt.grdinfo.
 
 import numpy as np
 import pytest
-from pygmt import grdinfo
+from pygmt import config, grdinfo
 from pygmt.exceptions import GMTTypeError
 from pygmt.helpers.testing import load_static_earth_relief
 
@@ -42,3 +42,29 @@ def test_grdinfo_region(grid):
         grid=grid, force_scan=0, per_column="n", region=[-54, -50, -23, -20]
     )
     assert result.strip() == "-54 -50 -23 -20 284.5 491 1 1 4 3 1 1"
+
+
+def test_grdinfo_format_float_out(grid):
+    """
+    Check that numerical reports are formatted by GMT, using FORMAT_FLOAT_OUT.
+    """
+    with config(FORMAT_FLOAT_OUT="%.2f"):
+        result = grdinfo(grid=grid, force_scan=0, per_column="n")
+    assert result.split()[:6] == [
+        "-55.00",
+        "-47.00",
+        "-24.00",
+        "-10.00",
+        "190.00",
+        "981.00",
+    ]
+
+
+def test_grdinfo_bounding_box(grid):
+    """
+    Check that the segment header of the bounding box polygon is kept.
+    """
+    result = grdinfo(grid=grid, spacing="b")
+    lines = result.splitlines()
+    assert lines[0].startswith(">")
+    assert lines[1].split() == ["-55", "-24"]
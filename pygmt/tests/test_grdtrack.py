@@ -8,8 +8,10 @@ import numpy as np
 import numpy.testing as npt
 import pandas as pd
 import pytest
+import xarray as xr
 from pygmt import grdtrack
-from pygmt.exceptions import GMTParameterError, GMTTypeError
+from pygmt.clib import Session
+from pygmt.exceptions import GMTParameterError, GMTTypeError, GMTValueError
 from pygmt.helpers import GMTTempFile
 from pygmt.helpers.testing import load_static_earth_relief
 
@@ -124,6 +126,149 @@ def test_grdtrack_profile(dataarray):
     )
 
 
+def test_grdtrack_crossprofile_segments(dataarray):
+    """
+    Run grdtrack with cross-profiles and keep the segments apart.
+    """
+    output = grdtrack(
+        grid=dataarray,
+        profile="-51/-17/-54/-19",
+        crossprofile="100k/10k/50k",
+        output_type="segments",
+    )
+    nsegments = len(output.headers)
+    assert nsegments > 1
+    assert output.offsets.shape == (nsegments + 1,)
+    assert output.offsets[0] == 0
+    assert output.offsets[-1] == len(output.data)
+    assert isinstance(output.data, pd.DataFrame)
+    # Each cross-profile is 100 km long with a spacing of 10 km.
+    npt.assert_equal(np.diff(output.offsets), 11)
+
+
+def test_grdtrack_chunksize(dataarray, dataframe, expected_array):
+    """
+    Run grdtrack on chunks of the points and check that the chunks add up to the
+    sampled points.
+    """
+    chunks = grdtrack(
+        points=dataframe, grid=dataarray, newcolname="bathymetry", chunksize=3
+    )
+    outputs = list(chunks)
+    assert [len(output) for output in outputs] == [3, 3, 3, 1]
+    output = pd.concat(outputs)
+    assert output.columns.to_list() == ["longitude", "latitude", "bathymetry"]
+    npt.assert_allclose(output.to_numpy(), expected_array)
+
+
+def test_grdtrack_chunksize_frees_chunks(dataarray, dataframe, monkeypatch):
+    """
+    Check that the GMT data containers of the chunks don't accumulate in the session.
+    """
+    sessions = []
+    enter = Session.__enter__
+
+    def spy_enter(self):
+        sessions.append(self)
+        return enter(self)
+
+    monkeypatch.setattr(Session, "__enter__", spy_enter)
+    ncontainers = [
+        len(sessions[0]._containers)
+        for _ in grdtrack(
+            points=dataframe, grid=dataarray, newcolname="bathymetry", chunksize=2
+        )
+    ]
+    assert len(ncontainers) == 5
+    # Only the containers of the grid are kept between the chunks.
+    assert len(set(ncontainers)) == 1
+
+
+def test_grdtrack_iterator_of_dataframes(dataarray, dataframe, expected_array):
+    """
+    Run grdtrack on an iterator of pandas.DataFrame chunks.
+    """
+    points = (dataframe.iloc[i : i + 4] for i in range(0, 10, 4))
+    outputs = grdtrack(
+        points=points, grid=dataarray, newcolname="bathymetry", output_type="numpy"
+    )
+    npt.assert_allclose(np.concatenate(list(outputs)), expected_array)
+
+
+def test_grdtrack_chunksize_fails(dataarray, dataframe):
+    """
+    Check that grdtrack fails for invalid chunksize or conflicting parameters.
+    """
+    with pytest.raises(GMTValueError):
+        grdtrack(points=dataframe, grid=dataarray, newcolname="z", chunksize=0)
+    with GMTTempFile() as tmpfile:
+        with pytest.raises(GMTParameterError):
+            grdtrack(
+                points=dataframe,
+                grid=dataarray,
+                newcolname="z",
+                chunksize=2,
+                outfile=tmpfile.name,
+            )
+
+
+@pytest.mark.parametrize(
+    "points",
+    [
+        pytest.param("@tut_ship.xyz", id="filename"),
+        pytest.param(POINTS_DATA, id="path"),
+        pytest.param({"x": [1.0, 2.0], "y": [3.0, 4.0]}, id="dict"),
+        pytest.param(
+            xr.Dataset({"x": ("n", [1.0, 2.0]), "y": ("n", [3.0, 4.0])}),
+            id="dataset",
+        ),
+    ],
+)
+def test_grdtrack_chunksize_non_table_points(dataarray, points):
+    """
+    Check that grdtrack fails in streaming mode for points that can't be split into
+    chunks of rows.
+    """
+    with pytest.raises(GMTParameterError):
+        grdtrack(points=points, grid=dataarray, newcolname="z", chunksize=2)
+    with pytest.raises(GMTParameterError):
+        list(grdtrack(points=iter([points]), grid=dataarray, newcolname="z"))
+
+
+def test_grdtrack_iterator_of_dataframes_fails_without_newcolname(
+    dataarray, dataframe
+):
+    """
+    Check that grdtrack fails for an iterator of pandas.DataFrame without newcolname.
+    """
+    chunks = grdtrack(points=iter([dataframe]), grid=dataarray)
+    with pytest.raises(GMTParameterError):
+        next(chunks)
+
+
+@pytest.mark.benchmark
+def test_grdtrack_chunksize_throughput(dataarray):
+    """
+    Benchmark the throughput (points per second) of sampling one million points in
+    chunks.
+    """
+    npoints = 1_000_000
+    rng = np.random.default_rng(seed=42)
+    points = pd.DataFrame(
+        {
+            "longitude": rng.uniform(-54.5, -47.5, size=npoints),
+            "latitude": rng.uniform(-23.5, -10.5, size=npoints),
+        }
+    )
+    nsampled = sum(
+        len(chunk)
+        for chunk in grdtrack(
+            points=points, grid=dataarray, newcolname="z", chunksize=100_000
+        )
+    )
+    assert nsampled == npoints
+
+
 def test_grdtrack_wrong_kind_of_points_input(dataarray, dataframe):
     """
     Run grdtrack using points input that is not a pandas.DataFrame or file.
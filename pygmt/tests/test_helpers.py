@@ -7,6 +7,7 @@ import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import numpy as np
 import pytest
 import xarray as xr
 from pygmt import Figure
@@ -17,6 +18,8 @@ from pygmt.helpers import (
     build_arg_list,
     kwargs_to_strings,
     launch_external_viewer,
+    non_ascii_array_to_octal,
+    non_ascii_to_octal,
     unique_name,
 )
 from pygmt.helpers.testing import load_static_earth_relief, skip_if_no
@@ -63,6 +66,21 @@ def test_non_ascii_to_octal():
     return fig
 
 
+@pytest.mark.parametrize("encoding", ["ISOLatin1+", "ISO-8859-4"])
+def test_non_ascii_array_to_octal(encoding):
+    """
+    Test that translating an array of strings in bulk is the same as translating the
+    strings one by one, including strings with newlines.
+    """
+    texts = np.array(
+        [["ABC", "±120°", "āáâ", "'quoted'"], ["αζ∆", "❡✉", "multi\nline ä", ""]]
+    )
+    result = non_ascii_array_to_octal(texts, encoding=encoding)
+    assert result.shape == texts.shape
+    for text, translated in zip(texts.ravel(), result.ravel(), strict=True):
+        assert translated == non_ascii_to_octal(text, encoding=encoding)
+
+
 def test_kwargs_to_strings_fails():
     """
     Make sure it fails for invalid conversion types.
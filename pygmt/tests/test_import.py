@@ -0,0 +1,53 @@
+"""
+Test importing pygmt.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def test_import_is_lazy():
+    """
+    Make sure that importing pygmt doesn't import the wrappers or load libgmt.
+    """
+    code = (
+        "import sys, pygmt; from pygmt.clib.session import _load_libgmt; "
+        "print(_load_libgmt.cache_info().currsize); "
+        "print('pygmt.src.grdcut' in sys.modules, 'pygmt.figure' in sys.modules)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], encoding="utf-8")
+    assert output.splitlines() == ["0", "False False"]
+
+
+def test_import_lazy_attributes():
+    """
+    Make sure that the lazily imported objects are the same as the original ones.
+    """
+    import pygmt  # ruff: ignore[import-outside-top-level]
+    from pygmt.figure import Figure  # ruff: ignore[import-outside-top-level]
+    from pygmt.src.grdinfo import grdinfo  # ruff: ignore[import-outside-top-level]
+
+    assert pygmt.Figure is Figure
+    assert pygmt.grdinfo is grdinfo
+    assert pygmt.src.grdinfo is grdinfo
+    assert {"Figure", "datasets", "grdinfo", "which"}.issubset(dir(pygmt))
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_function'"):
+        _ = pygmt.not_a_function
+
+
+@pytest.mark.benchmark
+def test_import_time():
+    """
+    Benchmark the time of importing pygmt in a new Python process.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import pygmt"],
+        capture_output=True,
+        check=True,
+        encoding="utf-8",
+    )
+    # The last line of the report gives the cumulative import time of pygmt, e.g.,
+    # "import time:      2209 |     653798 | pygmt".
+    assert proc.stderr.splitlines()[-1].split("|")[-1].strip() == "pygmt"
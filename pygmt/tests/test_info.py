@@ -240,6 +240,31 @@ def test_info_nearest_multiple():
     npt.assert_allclose(actual=output, desired=[11.5, 61.8, 0.1])
 
 
+def test_info_per_column_spacing_array():
+    """
+    Make sure the numerical outputs are the same for in-memory numerical inputs.
+    """
+    table = np.loadtxt(POINTS_DATA)
+    output = info(data=table, per_column=True, spacing=0.1)
+    npt.assert_allclose(actual=output, desired=[11.5, 61.8, -3, 7.9, 0.1412, 0.9338])
+    output = info(data=table, spacing="b")
+    assert output.shape == (5, 2)
+    npt.assert_allclose(actual=output[2], desired=[61.7074, 7.8648])
+
+
+@pytest.mark.benchmark
+def test_info_many_calls():
+    """
+    Benchmark repeated calls of info on small in-memory tables.
+    """
+    table = np.loadtxt(POINTS_DATA)
+    for _ in range(100):
+        output = info(data=table, per_column=True)
+    npt.assert_allclose(
+        actual=output, desired=[11.5309, 61.7074, -2.9289, 7.8648, 0.1412, 0.9338]
+    )
+
+
 def test_info_fails():
     """
     Make sure info raises an exception if not given either a file name, pandas
@@ -0,0 +1,170 @@
+"""
+Test pygmt.parallel.map and pygmt.render_many.
+"""
+
+import functools
+
+import numpy as np
+import numpy.testing as npt
+import pytest
+import xarray as xr
+from pygmt import Figure, grdfilter, grdinfo, grdtrack, info, parallel, render_many
+from pygmt.clib import Session, session_pool
+from pygmt.exceptions import GMTCLibError, GMTTypeError, GMTValueError
+from pygmt.helpers.testing import load_static_earth_relief
+
+
+@pytest.fixture(scope="module", name="grid")
+def fixture_grid():
+    """
+    Load the grid data from the static earth relief file.
+    """
+    return load_static_earth_relief()
+
+
+def _build_map(region):
+    """
+    Build a simple map for render_many. Must be defined at the module level.
+    """
+    fig = Figure()
+    fig.basemap(region=region, projection="M10c", frame=True)
+    fig.coast(land="gray", water="lightblue", resolution="c")
+    return fig
+
+
+def _build_nothing(region):
+    """
+    Return something else than a Figure.
+    """
+    return region
+
+
+def test_parallel_map():
+    """
+    Check that the results are the same as the serial results and in the same order.
+    """
+    data = [np.arange(i + 2) for i in range(20)]
+    func = functools.partial(info, per_column=True)
+    results = parallel.map(func, data, max_workers=4)
+    assert len(results) == 20
+    for result, expected in zip(results, map(func, data), strict=True):
+        npt.assert_equal(result, expected)
+
+
+def test_parallel_map_stress(grid):
+    """
+    Run many grid-processing calls in many threads at the same time.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = [
+        rng.uniform(low=[-52, -19.5], high=[-49, -17.5], size=(50, 2)) for _ in range(8)
+    ]
+    tasks = [
+        functools.partial(grdfilter, grid, filter="g60", distance="4"),
+        functools.partial(grdinfo, grid, per_column="n"),
+        *[
+            functools.partial(grdtrack, grid=grid, points=pts, newcolname="z")
+            for pts in points
+        ],
+    ] * 25
+    expected = [task() for task in tasks[: len(tasks) // 25]]
+    results = parallel.map(lambda task: task(), tasks, max_workers=8)
+    for i, result in enumerate(results):
+        match result:
+            case xr.DataArray():
+                xr.testing.assert_identical(result, expected[i % len(expected)])
+            case str():
+                assert result == expected[i % len(expected)]
+            case _:
+                npt.assert_equal(
+                    result.to_numpy(), expected[i % len(expected)].to_numpy()
+                )
+
+
+def test_parallel_map_exception(grid):
+    """
+    Check that an exception raised by a call is raised by parallel.map.
+    """
+    func = functools.partial(grdfilter, grid, distance="4")
+    with pytest.raises(GMTCLibError):
+        # "z" is not a valid filter type.
+        parallel.map(lambda filter_type: func(filter=filter_type), ["g60", "z60"])
+
+
+def test_parallel_map_session_pool():
+    """
+    Check that the worker threads don't borrow sessions from the global session pool.
+    """
+
+    def borrowed(_):
+        with Session() as lib:
+            return getattr(lib, "_pooled", None)
+
+    with session_pool(size=2):
+        with Session() as lib:
+            assert lib._pooled is not None
+        results = parallel.map(borrowed, range(4), max_workers=2)
+    assert results == [None] * 4
+
+
+def test_parallel_map_invalid_max_workers():
+    """
+    Check that parallel.map raises an error for an invalid number of threads.
+    """
+    with pytest.raises(GMTValueError):
+        parallel.map(grdinfo, ["@static_earth_relief.nc"], max_workers=0)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_parallel_map_scaling(grid, max_workers):
+    """
+    Benchmark filtering the same grid many times with one and multiple threads.
+    """
+    func = functools.partial(grdfilter, filter="m600", distance="4")
+    results = parallel.map(func, [grid] * 16, max_workers=max_workers)
+    assert len(results) == 16
+
+
+def test_render_many_outputs(tmp_path):
+    """
+    Check that render_many saves the figures to the given files in order.
+    """
+    regions = [[i, i + 10, 0, 10] for i in range(6)]
+    outputs = [tmp_path / f"map-{i}.png" for i in range(6)]
+    results = list(render_many(_build_map, regions, processes=2, outputs=outputs))
+    assert results == [str(fname) for fname in outputs]
+    for fname in outputs:
+        assert fname.read_bytes().startswith(b"\x89PNG")
+
+
+def test_render_many_bytes():
+    """
+    Check that render_many returns the figures as bytes.
+    """
+    results = list(render_many(_build_map, [[0, 10, 0, 10]] * 3, fmt="pdf"))
+    assert len(results) == 3
+    assert all(result.startswith(b"%PDF") for result in results)
+
+
+def test_render_many_errors():
+    """
+    Check that render_many raises errors for invalid arguments.
+    """
+    with pytest.raises(GMTValueError):
+        render_many(_build_map, [[0, 10, 0, 10]], processes=0)
+    with pytest.raises(GMTValueError):
+        render_many(_build_map, [[0, 10, 0, 10]], outputs=["a.png", "b.png"])
+    with pytest.raises(GMTTypeError):
+        list(render_many(_build_nothing, [[0, 10, 0, 10]], processes=1))
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("processes", [1, 2, 4])
+def test_render_many_scaling(processes):
+    """
+    Benchmark the number of maps rendered per second with the number of processes.
+    """
+    regions = [[i, i + 10, 0, 10] for i in range(16)]
+    results = list(render_many(_build_map, regions, processes=processes, dpi=100))
+    assert len(results) == 16
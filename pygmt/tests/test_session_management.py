@@ -3,12 +3,14 @@ Test the session management modules.
 """
 
 import multiprocessing as mp
+import subprocess
+import sys
 from importlib import reload
 from pathlib import Path
 
 import pytest
 from pygmt.clib import Session
-from pygmt.session_management import begin, end
+from pygmt.session_management import _begin_global_session, begin, end
 
 
 @pytest.mark.benchmark
@@ -18,6 +20,7 @@ def test_begin_end():
 
     First, end the global session. When finished, restart it.
     """
+    _begin_global_session()  # Make sure the global session has been started
     end()  # Kill the global session
     begin()
     with Session() as lib:
@@ -34,6 +37,7 @@ def test_gmt_compat_6_is_applied(capsys):
 
     GMT_COMPATIBILITY: Expects values from 6 to 6; reset to 6.
     """
+    _begin_global_session()  # Make sure the global session has been started
     end()  # Kill the global session
     try:
         # Generate a gmt.conf file in the current directory
@@ -62,6 +66,35 @@ def test_gmt_compat_6_is_applied(capsys):
         begin()  # Restart the global session
 
 
+def test_session_begins_with_first_figure():
+    """
+    Make sure that the global session is started by the first Figure, not on import.
+    """
+    code = (
+        "import pygmt; from pygmt.clib import Session; "
+        "print(Session._modern_mode); pygmt.which('@static_earth_relief.nc'); "
+        "print(Session._modern_mode); pygmt.Figure(); print(Session._modern_mode)"
+    )
+    output = subprocess.check_output([sys.executable, "-c", code], encoding="utf-8")
+    assert output.split() == ["False", "False", "True"]
+
+
+def test_session_classic_mode_before_first_figure(tmp_path):
+    """
+    Make sure that processing functions called before the first Figure run in classic
+    mode, without reading or writing gmt.history in the current directory.
+    """
+    code = (
+        "import numpy as np; import pygmt; from pygmt.clib import Session; "
+        "pygmt.info(np.arange(3.0), spacing=1); print(Session._modern_mode)"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", code], cwd=tmp_path, encoding="utf-8"
+    )
+    assert output.split() == ["False"]
+    assert not (tmp_path / "gmt.history").exists()
+
+
 def _gmt_func_wrapper(figname):
     """
     A wrapper for running PyGMT scripts with multiprocessing.
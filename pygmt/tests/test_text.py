@@ -517,3 +517,22 @@ def test_text_nonascii_iso8859():
     fig.text(x=1, y=1, text="xytext:1éęëė2")
     fig.text(x=[5, 5], y=[3, 5], text=["xytext1:ųúûüũūαζ∆❡", "xytext2:íîī∑π∇✉"])
     return fig
+
+
+@pytest.mark.benchmark
+def test_text_many_nonascii_labels():
+    """
+    Benchmark placing many labels with non-ASCII characters from several charsets.
+    """
+    rng = np.random.default_rng(seed=42)
+    words = np.array(["München", "Zürich", "Kraków", "Besançon", "Αθηνα", "Øresund"])
+    size = 200_000
+    fig = Figure()
+    fig.text(
+        region=[0, 100, 0, 100],
+        projection="X10c",
+        x=rng.uniform(0, 100, size=size),
+        y=rng.uniform(0, 100, size=size),
+        text=rng.choice(words, size=size),
+        font="4p",
+    )
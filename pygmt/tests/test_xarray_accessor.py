@@ -5,9 +5,10 @@ Test the behaviour of the GMTDataArrayAccessor class.
 import importlib.util
 from pathlib import Path
 
+import numpy as np
 import pytest
 import xarray as xr
-from pygmt import which
+from pygmt import grdtrack, which
 from pygmt.datasets import load_earth_relief
 from pygmt.enums import GridRegistration, GridType
 from pygmt.exceptions import GMTValueError
@@ -211,3 +212,38 @@ def test_xarray_accessor_histeq(grid):
         dims=["lat", "lon"],
     )
     xr.testing.assert_allclose(a=equalized_grid, b=expected_equalized_grid)
+
+
+def test_xarray_accessor_pin(grid):
+    """
+    Check that a pinned grid is converted once and gives the same results.
+    """
+    expected_clipped = grid.gmt.clip(below=[550, -1000], above=[700, 1000])
+    expected_sampled = grid.gmt.sample(spacing=0.5)
+    with grid.gmt.pin() as pinned:
+        assert pinned is grid
+        matrix = grid.gmt._pinned[0]
+        xr.testing.assert_allclose(
+            a=grid.gmt.clip(below=[550, -1000], above=[700, 1000]),
+            b=expected_clipped,
+        )
+        # Nested blocks reuse the matrix of the outermost block.
+        with grid.gmt.pin():
+            assert grid.gmt._pinned[0] is matrix
+            xr.testing.assert_allclose(
+                a=grid.gmt.sample(spacing=0.5), b=expected_sampled
+            )
+        assert grid.gmt._pinned[0] is matrix
+    assert grid.gmt._pinned is None
+
+
+@pytest.mark.benchmark
+def test_xarray_accessor_pin_many_calls():
+    """
+    Benchmark passing the same pinned grid to PyGMT functions many times.
+    """
+    grid = load_earth_relief(resolution="05m")
+    points = np.array([[0.0, 0.0], [10.0, 10.0], [-120.0, 45.0]])
+    with grid.gmt.pin():
+        for _ in range(20):
+            grdtrack(grid=grid, points=points, newcolname="z")
@@ -4,24 +4,48 @@ GMT accessor for :class:`xarray.DataArray`.
 
 import contextlib
 import functools
+from collections.abc import Generator
 from pathlib import Path
 
 import xarray as xr
+from pygmt.clib.conversion import dataarray_to_matrix
 from pygmt.enums import GridRegistration, GridType
 from pygmt.exceptions import GMTValueError
-from pygmt.src import (
-    dimfilter,
-    grdclip,
-    grdcut,
-    grdfill,
-    grdfilter,
-    grdgradient,
-    grdhisteq,
-    grdinfo,
-    grdproject,
-    grdsample,
-    grdtrack,
-)
+
+
+class _GridMethod:
+    """
+    Create a wrapper method for PyGMT grid-processing methods.
+
+    The :class:`xarray.DataArray` object is passed as the first argument. The
+    grid-processing function is imported on first access of the method, so that
+    importing pygmt doesn't have to import the modules of all the functions.
+
+    Parameters
+    ----------
+    path
+        Dotted path of the function in :mod:`pygmt.src` (e.g., ``"grdcut"`` or
+        ``"grdhisteq.equalize_grid"``).
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+
+    def __set_name__(self, owner: type, name: str):
+        self._name = name
+
+    def __get__(self, instance: object, owner: type):
+        from pygmt import src  # ruff: ignore[import-outside-top-level]
+
+        func = functools.reduce(getattr, self._path.split("."), src)
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            return func(self._obj, *args, **kwargs)
+
+        # Replace the descriptor by the method so that the import happens only once.
+        setattr(owner, self._name, wrapper)
+        return wrapper.__get__(instance, owner)
 
 
 @xr.register_dataarray_accessor("gmt")
@@ -181,6 +205,14 @@ class GMTDataArrayAccessor:
     >>> new_grid = pygmt.grdclip(grid=grid, below=[1000, 0], above=[1500, 10000])
     >>> # Option 2:
     >>> new_grid = grid.gmt.clip(below=[1000, 0], above=[1500, 10000])
+
+    When the same grid is passed to many PyGMT functions, use :meth:`pin` to convert
+    it to the memory layout required by GMT only once:
+
+    >>> with grid.gmt.pin():
+    ...     grad = pygmt.grdgradient(grid=grid, azimuth=45)
+    ...     points = np.array([[20, 20], [25, 18]])
+    ...     track = pygmt.grdtrack(grid=grid, points=points, newcolname="z")
     """
 
     def __init__(self, xarray_obj: xr.DataArray):
@@ -189,10 +221,14 @@ class GMTDataArrayAccessor:
         # Default to Gridline registration and Cartesian grid type
         self._registration = GridRegistration.GRIDLINE
         self._gtype = GridType.CARTESIAN
+        # Cached output of dataarray_to_matrix while the grid is pinned
+        self._pinned: tuple | None = None
 
         # If the source file exists, get grid registration and grid type from the last
         # two columns of the shortened summary information of grdinfo.
         if (_source := self._obj.encoding.get("source")) and Path(_source).exists():
+            from pygmt.src import grdinfo  # ruff: ignore[import-outside-top-level]
+
             with contextlib.suppress(ValueError):
                 _registration, _gtype = map(
                     int, grdinfo(_source, per_column="n").split()[-2:]
@@ -230,28 +266,45 @@ class GMTDataArrayAccessor:
             )
         self._gtype = GridType(value)
 
-    @staticmethod
-    def _make_method(func):
+    @contextlib.contextmanager
+    def pin(self) -> Generator[xr.DataArray, None, None]:
         """
-        Create a wrapper method for PyGMT grid-processing methods.
+        Keep the grid converted for GMT while passing it to many PyGMT functions.
 
-        The :class:`xarray.DataArray` object is passed as the first argument.
-        """
+        Every time a :class:`xarray.DataArray` grid is passed to a PyGMT function, its
+        coordinates are checked and its data is copied into a C-contiguous, north-up
+        matrix that GMT can read. Inside this context manager, the conversion is done
+        only once and the matrix is reused by all PyGMT functions that read the grid.
 
-        @functools.wraps(func)
-        def wrapper(self, *args, **kwargs):
-            return func(self._obj, *args, **kwargs)
+        Context manager (use in a ``with`` block). Yields the grid itself. The cached
+        matrix is released upon exit of the ``with`` block. Nested calls reuse the
+        matrix of the outermost block.
+
+        The grid must not be modified inside the ``with`` block, since the changes are
+        not seen by the cached matrix.
 
-        return wrapper
+        Yields
+        ------
+        grid
+            The pinned :class:`xarray.DataArray` grid.
+        """
+        if self._pinned is not None:  # Already pinned by an outer block.
+            yield self._obj
+            return
+        self._pinned = dataarray_to_matrix(self._obj)
+        try:
+            yield self._obj
+        finally:
+            self._pinned = None
 
     # Accessor methods for grid operations.
-    clip = _make_method(grdclip)
-    cut = _make_method(grdcut)
-    dimfilter = _make_method(dimfilter)
-    histeq = _make_method(grdhisteq.equalize_grid)
-    fill = _make_method(grdfill)
-    filter = _make_method(grdfilter)
-    gradient = _make_method(grdgradient)
-    project = _make_method(grdproject)
-    sample = _make_method(grdsample)
-    track = _make_method(grdtrack)
+    clip = _GridMethod("grdclip")
+    cut = _GridMethod("grdcut")
+    dimfilter = _GridMethod("dimfilter")
+    histeq = _GridMethod("grdhisteq.equalize_grid")
+    fill = _GridMethod("grdfill")
+    filter = _GridMethod("grdfilter")
+    gradient = _GridMethod("grdgradient")
+    project = _GridMethod("grdproject")
+    sample = _GridMethod("grdsample")
+    track = _GridMethod("grdtrack")